@@ -0,0 +1,62 @@
+import numpy as np
+
+from quarterly import period_index, period_label
+
+# -----------------------------------------------------------
+# 대시보드 집계 조회 (분기별 합계 + 분기별 성장률 정렬 인덱스)
+# -----------------------------------------------------------
+# 지표 프레임(variant 하나)을 받아 한 번만 만들어 두고, 선택값이 바뀔 때마다 다시 계산하지 않습니다.
+# - 분기별 매출/영업이익 합계를 미리 구해 두고 선택한 분기만 골라 씁니다. (추세 탭)
+# - 분기마다 '매출 기준 이상' 행을 성장률 내림차순으로 정렬해 두고,
+#   선택한 분기들의 앞 k개만 모아 다시 k개를 고릅니다. (급상승 Top 20 탭)
+# 기업 필터가 걸린 선택은 행 수가 적으므로 호출하는 쪽에서 필터된 프레임으로 바로 계산합니다.
+DEFAULT_RANK_COLUMNS = ('rev_qoq', 'prof_qoq')
+DEFAULT_MIN_REVENUE = 10000   # 백만 원 (= 100억)
+
+class PeriodIndex:
+    def __init__(self, df, rank_columns=DEFAULT_RANK_COLUMNS, min_revenue=DEFAULT_MIN_REVENUE):
+        self.df = df.reset_index(drop=True)
+        pidx = period_index(self.df['year'], self.df['quarter'])
+        self.periods = np.unique(pidx)
+
+        # 분기별 합계 (period 라벨 포함)
+        sums = self.df[['revenue', 'profit']].groupby(pidx).sum()
+        self.totals = sums.assign(period=period_label(sums.index)).reset_index(drop=True)[['period', 'revenue', 'profit']]
+
+        # 분기별 성장률 정렬 위치: {column: {pidx: 행 위치 배열(내림차순, 같은 값은 원래 행 순서)}}
+        revenue = self.df['revenue'].to_numpy(dtype=np.float64)
+        self.ranked = {}
+        for col in rank_columns:
+            values = self.df[col].to_numpy(dtype=np.float64)
+            rows = np.flatnonzero((revenue > min_revenue) & ~np.isnan(values))
+            order = rows[np.lexsort((-values[rows], pidx[rows]))]
+            keys = pidx[order]
+            starts = np.searchsorted(keys, self.periods, side='left')
+            ends = np.searchsorted(keys, self.periods, side='right')
+            self.ranked[col] = {p: order[b:e] for p, b, e in zip(self.periods, starts, ends)}
+
+    def select_periods(self, years=None, quarters=None):
+        years_of, quarters_of = self.periods // 4, self.periods % 4
+        mask = np.ones(len(self.periods), dtype=bool)
+        if years: mask &= np.isin(years_of, [int(y) for y in years])
+        if quarters: mask &= np.isin(quarters_of, [['1Q', '2Q', '3Q', '4Q'].index(q) for q in quarters])
+        return self.periods[mask], mask
+
+    def period_totals(self, years=None, quarters=None):
+        _, mask = self.select_periods(years, quarters)
+        return self.totals[mask].reset_index(drop=True)
+
+    def top(self, column, k=20, years=None, quarters=None, columns=None):
+        periods, _ = self.select_periods(years, quarters)
+        lists = [self.ranked[column][p][:k] for p in periods]
+        # 원래 행 순서로 되돌린 뒤 고르면 동점 처리까지 전체 프레임 nlargest와 같습니다.
+        pos = np.sort(np.concatenate(lists)) if lists else np.array([], dtype=np.int64)
+        out = self.df.iloc[pos].nlargest(k, column)
+        return out[list(columns)] if columns is not None else out
+
+def paginate(df, page, page_size):
+    # page: 1부터. 범위를 벗어나면 마지막 페이지로 맞춥니다. 반환: (페이지 프레임, 전체 페이지 수)
+    n_pages = max(1, -(-len(df) // page_size))
+    page = min(max(1, int(page)), n_pages)
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size], n_pages
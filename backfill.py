@@ -0,0 +1,48 @@
+import os
+import json
+from datetime import datetime, timedelta
+
+# -----------------------------------------------------------
+# 기간 백필: 날짜 구간 분할 + 진행 상황 체크포인트
+# -----------------------------------------------------------
+DATE_FMT = '%Y%m%d'
+DEFAULT_WINDOW_DAYS = 7
+DEFAULT_CHECKPOINT = 'backfill_checkpoint.json'
+
+def iter_windows(start, end, days=DEFAULT_WINDOW_DAYS):
+    # 'YYYYMMDD' 구간을 days일 단위로 잘라 (시작, 끝) 문자열 쌍으로 돌려줍니다.
+    # days가 1보다 작으면 구간이 앞으로 가지 않아 끝나지 않으므로 거부합니다.
+    if days < 1:
+        raise ValueError(f"days는 1 이상이어야 합니다: {days}")
+    cur = datetime.strptime(start, DATE_FMT)
+    last = datetime.strptime(end, DATE_FMT)
+    while cur <= last:
+        win_end = min(cur + timedelta(days=days - 1), last)
+        yield cur.strftime(DATE_FMT), win_end.strftime(DATE_FMT)
+        cur = win_end + timedelta(days=1)
+
+def load_checkpoint(path, start, end):
+    # 같은 구간(start, end)으로 중단된 기록이 있으면 완료된 마지막 날짜를 돌려줍니다.
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ 체크포인트 로딩 실패, 처음부터 시작합니다: {e}")
+        return None
+    if data.get('start') != start or data.get('end') != end:
+        return None
+    return data.get('done_until')
+
+def save_checkpoint(path, start, end, done_until):
+    data = {'start': start, 'end': end, 'done_until': done_until,
+            'updated_at': datetime.now().isoformat(timespec='seconds')}
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+def clear_checkpoint(path):
+    if os.path.exists(path):
+        os.remove(path)
@@ -0,0 +1,66 @@
+import os
+import time
+import argparse
+import tempfile
+import pandas as pd
+
+from db_index import load_key_index, save_key_index, make_key, index_path_for
+from bench.datagen import write_financial_db
+
+# -----------------------------------------------------------
+# 중복 체크 벤치마크: 보고서마다 CSV 재파싱 vs 키 인덱스
+# 실행: python -m bench.bench_dedup --rows 100000 --reports 200
+# -----------------------------------------------------------
+def old_path(csv_path, reports):
+    hits = 0
+    for corp_code, corp_name, year, quarter in reports:
+        df_existing = pd.read_csv(csv_path)
+        check = df_existing[
+            (df_existing['corp_name'] == corp_name) &
+            (df_existing['year'] == year) &
+            (df_existing['quarter'] == quarter)
+        ]
+        if not check.empty: hits += 1
+    return hits
+
+def new_path(csv_path, reports):
+    keys = load_key_index(csv_path)
+    hits = 0
+    for corp_code, corp_name, year, quarter in reports:
+        if make_key(corp_code, year, quarter) in keys: hits += 1
+    return hits
+
+def timed(func, *args):
+    t0 = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - t0
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--reports', type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'financial_db.csv')
+        df = write_financial_db(csv_path, args.rows)
+
+        # 절반은 기존 키, 절반은 신규 키로 구성
+        sample = df.sample(n=args.reports, random_state=0)
+        reports = [(c, n, int(y) + (i % 2) * 100, q)
+                   for i, (c, n, y, q) in enumerate(sample[['corp_code', 'corp_name', 'year', 'quarter']].itertuples(index=False))]
+
+        old_hits, old_sec = timed(old_path, csv_path, reports)
+        cold_hits, cold_sec = timed(new_path, csv_path, reports)
+        save_key_index(load_key_index(csv_path), csv_path)
+        warm_hits, warm_sec = timed(new_path, csv_path, reports)
+        assert old_hits == cold_hits == warm_hits
+
+        print(f"📊 rows={args.rows:,} reports={args.reports:,} (중복 {old_hits}건)")
+        print(f"   기존 (보고서마다 read_csv): {old_sec:8.3f}s")
+        print(f"   인덱스 (CSV에서 생성):       {cold_sec:8.3f}s  (x{old_sec / cold_sec:,.0f})")
+        print(f"   인덱스 (사이드카 로딩):      {warm_sec:8.3f}s  (x{old_sec / warm_sec:,.0f})")
+        print(f"   사이드카 크기: {os.path.getsize(index_path_for(csv_path)) / 1024:,.0f} KB")
+
+if __name__ == '__main__':
+    main()
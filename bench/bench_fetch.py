@@ -0,0 +1,41 @@
+import time
+import argparse
+
+from dart_fetch import fetch_all, fetch_finstate
+from bench.fake_dart import FakeDart
+
+# -----------------------------------------------------------
+# 재무데이터 조회 벤치마크: 순차 조회 vs 병렬 조회 (가짜 DART)
+# 실행: python -m bench.bench_fetch --reports 100 --latency 0.2
+# -----------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--reports', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.2)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--rate', type=float, default=5.0)
+    parser.add_argument('--fail-rate', type=float, default=0.05)
+    args = parser.parse_args()
+
+    jobs = [{'corp_code': f"{100000 + i:08d}", 'year': 2025} for i in range(args.reports)]
+
+    dart = FakeDart(latency=args.latency, missing_rate=0.1)
+    t0 = time.perf_counter()
+    for job in jobs:
+        fetch_finstate(dart, job['corp_code'], job['year'])
+        time.sleep(0.5)  # 기존 main.py의 저장 후 대기
+    seq_sec = time.perf_counter() - t0
+    seq_calls = dart.calls
+
+    dart = FakeDart(latency=args.latency, fail_rate=args.fail_rate, missing_rate=0.1)
+    t0 = time.perf_counter()
+    results = list(fetch_all(dart, jobs, max_workers=args.workers, rate=args.rate, backoff=0.1))
+    par_sec = time.perf_counter() - t0
+    errors = sum(1 for _, _, e in results if e is not None)
+
+    print(f"📊 reports={args.reports} latency={args.latency}s workers={args.workers} rate={args.rate}/s")
+    print(f"   순차 (+0.5초 대기): {seq_sec:8.2f}s  (API {seq_calls}회)")
+    print(f"   병렬 (토큰 버킷):   {par_sec:8.2f}s  (API {dart.calls}회, 최종 실패 {errors}건, 실패율 {args.fail_rate:.0%})")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+import time
+import argparse
+
+from metrics import compute_metrics
+from aggregates import paginate
+from dashboard_data import prepare, select_variant, filter_frame, summary_table, summary_kpis, frame_mb
+from bench.datagen import make_financial_db, parse_size
+
+# -----------------------------------------------------------
+# 대시보드 메모리: 기존(문자열/float64 전체 컬럼, 세션마다 전체 복사) vs 축소 프레임
+# 실행: python -m bench.bench_memory --sizes 100k 1m
+# -----------------------------------------------------------
+# 세션당 = 재실행 한 번에 스크립트가 cache_data에서 받아 들고 있는 복사본 (기본 선택: 최신 연도, 4Q 변환)
+#   기존: load_data() 전체 프레임 + filtered_df + 정렬된 상세 표
+#   변경: 지표 카드 숫자 + 상세 표 현재 페이지 (전체 프레임/뷰는 cache_resource로 세션 간 한 벌 공유)
+def legacy_prepare(df):
+    # 변경 전 dashboard.prepare()
+    df = df.astype({col: str for col in ['corp_name', 'quarter', 'variant'] if col in df.columns})
+    for col in ['revenue', 'profit', 'net_income', 'cash_flow']:
+        df[col] = df[col] / 1000000
+    df = df.sort_values(['corp_name', 'year', 'quarter'])
+    df['period'] = df['year'].astype(str) + "-" + df['quarter']
+    return df
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', nargs='+', default=['100k', '1m'])
+    parser.add_argument('--page-size', type=int, default=100)
+    args = parser.parse_args()
+
+    for label in args.sizes:
+        metrics = compute_metrics(make_financial_db(parse_size(label), missing_rate=0.03))
+
+        t0 = time.perf_counter()
+        old = legacy_prepare(metrics)
+        old_sec = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        new = prepare(metrics)
+        new_sec = time.perf_counter() - t0
+
+        latest = int(new['year'].max())
+        old_view = old[old['variant'] == 'iso4q'].drop(columns='variant')
+        old_filtered = old_view[old_view['year'].isin([latest])]
+        old_session = frame_mb(old) + frame_mb(old_filtered) + frame_mb(summary_table(old_filtered))
+
+        new_view = select_variant(new, True)
+        new_filtered = filter_frame(new_view, years=[latest])
+        kpis = summary_kpis(new_filtered)
+        page, _ = paginate(summary_table(new_filtered), 1, args.page_size)
+        new_session = frame_mb(page)
+
+        print(f"📊 {label}: 지표 {len(metrics):,}행 (raw+iso4q), 기본 선택 {kpis['rows']:,}행")
+        print(f"   {'':<26} {'기존':>10} {'변경':>10} {'감소':>8}")
+        rows = [
+            ('전체 프레임 (MB)', frame_mb(old), frame_mb(new)),
+            ('iso4q 뷰 (MB)', frame_mb(old_view), frame_mb(new_view)),
+            ('세션당 재실행 복사본 (MB)', old_session, new_session),
+        ]
+        for name, before, after in rows:
+            print(f"   {name:<26} {before:10.2f} {after:10.2f} {1 - after / before:8.1%}")
+        print(f"   {'전처리 시간 (s)':<26} {old_sec:10.2f} {new_sec:10.2f}")
+        print(f"   컬럼: {len(old.columns)}개 → {len(new.columns)}개 ({', '.join(f'{c}:{t}' for c, t in new.dtypes.astype(str).items())})")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+import json
+import time
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import requests
+
+from notifier import SlackNotifier
+
+# -----------------------------------------------------------
+# 슬랙 알림 벤치마크: 기존 기업별 동기 전송 vs SlackNotifier (로컬 모의 웹훅 서버)
+# 실행: python -m bench.bench_notify --messages 200 --latency 0.3
+# 모의 서버는 응답마다 latency만큼 지연하고, --rate-limit-every N이면 N번째 요청마다 429(Retry-After: 1)를 돌려줍니다.
+# 429 재시도와 블록 수 제한 분할 동작은 tests/test_notifier.py에서 확인합니다.
+# -----------------------------------------------------------
+class MockWebhook:
+    def __init__(self, latency, rate_limit_every):
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.requests = 0
+        self.throttled = 0
+        self.messages = 0
+        self.lock = threading.Lock()
+
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            time.sleep(state.latency)
+            with state.lock:
+                state.requests += 1
+                throttle = state.rate_limit_every and state.requests % state.rate_limit_every == 0
+                if throttle:
+                    state.throttled += 1
+                else:
+                    blocks = payload.get('blocks')
+                    if blocks is None:
+                        state.messages += 1
+                    else:
+                        state.messages += sum(b['type'] == 'section' for b in blocks)
+            if throttle:
+                self.send_response(429)
+                self.send_header('Retry-After', '1')
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b'ok')
+
+        def log_message(self, *args):
+            pass
+    return Handler
+
+def sample_message(i):
+    return "\n".join([
+        f"📢 *기업{i:05d} 2025년 3Q 실적*",
+        f"- 매출액: {1234567890 + i:,}원 (🔺 +12,345,678)",
+        f"- 영업이익: {98765432 + i:,}원 (🔻 -1,234,567)",
+        f"- 당기순이익: {45678901 + i:,}원 (-)",
+    ])
+
+def serve(latency, rate_limit_every):
+    state = MockWebhook(latency, rate_limit_every)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(state))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return state, server, f"http://127.0.0.1:{server.server_port}/webhook"
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--messages', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=0.3)
+    parser.add_argument('--rate-limit-every', type=int, default=5)
+    parser.add_argument('--old-max', type=int, default=50, help="기존 방식은 이 개수까지만 실행 (지연 × 건수만큼 걸림)")
+    args = parser.parse_args()
+    messages = [sample_message(i) for i in range(args.messages)]
+
+    print(f"📊 메시지 {args.messages}건, 웹훅 지연 {args.latency}s, {args.rate_limit_every}번째 요청마다 429")
+
+    # 기존: 저장 루프 안에서 기업마다 requests.post (타임아웃/세션 없음, 429는 그대로 유실)
+    n_old = min(args.old_max, args.messages)
+    state, server, url = serve(args.latency, args.rate_limit_every)
+    t0 = time.perf_counter()
+    for msg in messages[:n_old]:
+        requests.post(url, json={"text": msg})
+    old_sec = time.perf_counter() - t0
+    server.shutdown()
+    print(f"   기존  : {n_old}건 루프 차단 {old_sec:6.2f}s, 요청 {state.requests}회, 전달 {state.messages}/{n_old} (429 유실 {state.throttled})")
+
+    state, server, url = serve(args.latency, args.rate_limit_every)
+    notifier = SlackNotifier(url, flush_interval=0.5, backoff=0.2)
+    t0 = time.perf_counter()
+    for msg in messages:
+        notifier.notify(msg)
+    loop_sec = time.perf_counter() - t0
+    notifier.close()
+    total_sec = time.perf_counter() - t0
+    server.shutdown()
+    stats = notifier.stats()
+    print(f"   디스패처: {args.messages}건 루프 차단 {loop_sec * 1000:6.2f}ms, 종료 flush까지 {total_sec:5.2f}s, "
+          f"요청 {state.requests}회 (429 {state.throttled}, 재시도 {stats['retried']}), 전달 {state.messages}/{args.messages}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+import time
+import argparse
+import numpy as np
+import pandas as pd
+
+from metrics import compute_metrics
+from bench.datagen import make_financial_db
+
+# -----------------------------------------------------------
+# 4Q 개별분기 + OPM/QoQ/YoY 계산 벤치마크
+# 기존 dashboard.py 인라인 로직(apply/merge/pivot) vs quarterly 엔진(metrics.compute_metrics)
+# 실행: python -m bench.bench_quarterly --sizes 15000 100000 1000000
+# -----------------------------------------------------------
+def old_pipeline(raw):
+    # 기존 load_data() + 4Q 보정 블록을 그대로 옮긴 것 (단위 변환 제외)
+    df = raw.rename(columns={'매출액': 'revenue', '영업이익': 'profit', '순이익': 'net_income', '영업현금흐름': 'cash_flow'})
+    for col in ['revenue', 'profit', 'net_income', 'cash_flow']:
+        df[col] = df[col].fillna(0)
+    df = df.sort_values(['corp_name', 'year', 'quarter'])
+    df['opm'] = df.apply(lambda x: (x['profit'] / x['revenue'] * 100) if x['revenue'] != 0 else 0, axis=1)
+    df['rev_qoq'] = df.groupby('corp_name')['revenue'].pct_change().fillna(0) * 100
+    df['prof_qoq'] = df.groupby('corp_name')['profit'].pct_change().fillna(0) * 100
+    df.replace([np.inf, -np.inf], 0, inplace=True)
+    df['prev_year'] = df['year'] - 1
+    df_prev = df[['corp_name', 'year', 'quarter', 'revenue', 'profit']].copy()
+    df_prev = df_prev.rename(columns={'year': 'join_year', 'revenue': 'rev_prev', 'profit': 'prof_prev'})
+    df = pd.merge(df, df_prev, left_on=['corp_name', 'prev_year', 'quarter'], right_on=['corp_name', 'join_year', 'quarter'], how='left')
+    df['rev_yoy'] = ((df['revenue'] - df['rev_prev']) / df['rev_prev'] * 100).fillna(0)
+    df['prof_yoy'] = ((df['profit'] - df['prof_prev']) / df['prof_prev'] * 100).fillna(0)
+    df.replace([np.inf, -np.inf], 0, inplace=True)
+
+    iso = df.copy()
+    pivot = iso[iso['quarter'].isin(['1Q', '2Q', '3Q'])].pivot_table(
+        index=['corp_name', 'year'], values=['revenue', 'profit', 'net_income'], aggfunc='sum'
+    ).reset_index().rename(columns={'revenue': 'r_sum', 'profit': 'p_sum', 'net_income': 'n_sum'})
+    iso = pd.merge(iso, pivot, on=['corp_name', 'year'], how='left')
+    mask_4q = iso['quarter'] == '4Q'
+    for col, sum_col in zip(['revenue', 'profit', 'net_income'], ['r_sum', 'p_sum', 'n_sum']):
+        iso.loc[mask_4q, col] = iso.loc[mask_4q, col] - iso.loc[mask_4q, sum_col].fillna(0)
+    iso['opm'] = iso.apply(lambda x: (x['profit'] / x['revenue'] * 100) if x['revenue'] != 0 else 0, axis=1)
+    return df, iso
+
+def timed(func, *args, repeat=1):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(*args)
+        sec = time.perf_counter() - t0
+        best = sec if best is None else min(best, sec)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[15000, 100000, 1000000])
+    parser.add_argument('--old-max', type=int, default=100000, help="이 행 수를 넘으면 기존 로직은 건너뜀 (행 단위 apply가 매우 느림)")
+    parser.add_argument('--missing-rate', type=float, default=0.03)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"📊 결측 분기 비율 {args.missing_rate:.0%}, 최소 {args.repeat}회 기준")
+    print(f"   {'rows':>10} {'기존':>10} {'엔진':>10} {'배율':>8}")
+    for n in args.sizes:
+        raw = make_financial_db(n, missing_rate=args.missing_rate)
+        new_sec = timed(compute_metrics, raw, repeat=args.repeat)
+        if n <= args.old_max:
+            old_sec = timed(old_pipeline, raw)
+            print(f"   {len(raw):>10,} {old_sec:9.2f}s {new_sec:9.3f}s {old_sec / new_sec:7.0f}x")
+        else:
+            print(f"   {len(raw):>10,} {'-':>10} {new_sec:9.3f}s {'-':>8}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+import os
+import time
+import hashlib
+import argparse
+import tempfile
+import threading
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import requests
+
+from remote_sync import sync_remote
+from bench.datagen import make_financial_db
+
+# -----------------------------------------------------------
+# 대시보드 원격 동기화 벤치마크: 로컬 HTTP 서버(GitHub raw 대역)로 시나리오별 전송량과 시간 측정
+# 실행: python -m bench.bench_remote --rows 100000  (시나리오별 동작 확인은 tests/test_remote_sync.py)
+# 서버는 ETag(If-None-Match)와 Last-Modified(If-Modified-Since)를 지원하고 요청 수를 셉니다.
+# -----------------------------------------------------------
+class StandIn:
+    def __init__(self):
+        self.body = b''
+        self.etag = None
+        self.mtime = time.time()
+        self.requests = 0
+        self.sent_bytes = 0
+        self.broken = False
+
+    def publish(self, body, mtime=None):
+        self.body = body
+        self.etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        self.mtime = mtime or time.time()
+
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            state.requests += 1
+            if state.broken:
+                self.send_response(200)
+                self.end_headers()
+                self.wfile.write(b'<html>oops</html>')
+                return
+            last_modified = formatdate(state.mtime, usegmt=True)
+            inm = self.headers.get('If-None-Match')
+            ims = self.headers.get('If-Modified-Since')
+            not_modified = (inm == state.etag) if inm else bool(ims) and parsedate_to_datetime(ims).timestamp() >= int(state.mtime)
+            if not_modified:
+                self.send_response(304)
+                self.send_header('ETag', state.etag)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('ETag', state.etag)
+            self.send_header('Last-Modified', last_modified)
+            self.send_header('Content-Length', str(len(state.body)))
+            self.end_headers()
+            self.wfile.write(state.body)
+            state.sent_bytes += len(state.body)
+
+        def log_message(self, *args):
+            pass
+    return Handler
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    state = StandIn()
+    body = make_financial_db(args.rows).to_csv(index=False).encode('utf-8-sig')
+    state.publish(body, mtime=time.time() - 3600)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(state))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/financial_db.csv"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        local_path = os.path.join(tmp, 'financial_db.csv')
+        snapshot_dir = os.path.join(tmp, 'snapshot')
+        session = requests.Session()
+
+        def run(label):
+            before = state.sent_bytes
+            t0 = time.perf_counter()
+            info = sync_remote(url, local_path=local_path, snapshot_dir=snapshot_dir, session=session)
+            total = time.perf_counter() - t0
+            where = 'local' if info['path'] == local_path else ('snapshot' if info['path'] else None)
+            print(f"   {label:<24} {info['status']:<13} {str(where):<9} "
+                  f"{(state.sent_bytes - before) / 1e6:6.2f}MB  fetch {info['fetch_sec'] * 1000:6.1f}ms  "
+                  f"검증 {info['parse_sec'] * 1000:6.1f}ms  총 {total * 1000:6.1f}ms")
+            return info
+
+        print(f"📊 CSV {len(body) / 1e6:.1f} MB, {args.rows:,} rows")
+        print(f"   {'시나리오':<24} {'상태':<13} {'경로':<9} {'전송':>8}")
+        run("로컬 없음, 첫 실행")
+        run("변경 없음 (ETag)")
+        state.publish(body + body[-200:].split(b'\n', 1)[1])
+        run("원격 변경")
+        state.broken = True
+        run("원격 응답 깨짐")
+        state.broken = False
+        server.shutdown()
+        server.server_close()
+        run("원격 장애")
+
+        # 배포 직후: 로컬 CSV만 있고 원격은 그 이후 변경 없음 → If-Modified-Since로 304
+        state2 = StandIn()
+        state2.publish(body, mtime=time.time() - 3600)
+        with open(local_path, 'wb') as f:
+            f.write(body)
+        server2 = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(state2))
+        threading.Thread(target=server2.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server2.server_port}/financial_db.csv"
+        snapshot_dir = os.path.join(tmp, 'snapshot2')
+        state = state2
+        run("로컬 있음, 원격 동일")
+        server2.shutdown()
+        server2.server_close()
+        print(f"   서버 요청 수: {state2.requests}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+import os
+import time
+import argparse
+import tempfile
+import multiprocessing as mp
+import pandas as pd
+
+import storage
+from bench.datagen import write_financial_db
+
+# -----------------------------------------------------------
+# 저장소 벤치마크: CSV 전체 파싱 vs Parquet 사본 (컬럼 선택/연도 필터)
+# 실행: python -m bench.bench_storage --rows 100000
+# 케이스마다 별도 프로세스에서 실행해 첫 로딩 전후 RSS 증가량을 잽니다. (Linux /proc 기준)
+# RSS에는 pyarrow 등 라이브러리를 처음 쓸 때 올라오는 메모리가 포함되므로,
+# 세션마다 유지되는 크기는 '프레임' 컬럼(memory_usage deep)을 보면 됩니다.
+# -----------------------------------------------------------
+DASHBOARD_COLUMNS = ['corp_code', 'corp_name', 'year', 'quarter', '매출액', '영업이익', '순이익', '영업현금흐름']
+
+def load_case(case, csv_path, columnar_dir, latest_year):
+    if case == 'csv (기존 대시보드)':
+        try: return pd.read_csv(csv_path)
+        except UnicodeDecodeError: return pd.read_csv(csv_path, encoding='cp949')
+    if case == 'parquet 전체':
+        return storage.read_db(source=csv_path, columnar_dir=columnar_dir)
+    if case == 'parquet 컬럼 선택':
+        return storage.read_db(columns=DASHBOARD_COLUMNS, source=csv_path, columnar_dir=columnar_dir)
+    if case == 'parquet 최신 연도':
+        return storage.read_db(columns=DASHBOARD_COLUMNS, years=[latest_year], source=csv_path, columnar_dir=columnar_dir)
+    if case == 'csv 폴백 (read_db)':
+        return storage.read_db(source=csv_path, columnar_dir=columnar_dir + '_missing')
+    raise ValueError(case)
+
+def current_rss():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        return 0
+
+def run_case(queue, case, csv_path, columnar_dir, latest_year, repeat):
+    rss_before = current_rss()
+    df = load_case(case, csv_path, columnar_dir, latest_year)
+    rss_loaded = current_rss() - rss_before
+    times = []
+    for _ in range(repeat):
+        del df
+        t0 = time.perf_counter()
+        df = load_case(case, csv_path, columnar_dir, latest_year)
+        times.append(time.perf_counter() - t0)
+    queue.put((min(times), len(df), df.memory_usage(deep=True).sum(), rss_loaded))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if not storage.HAS_PYARROW:
+        print("❌ pyarrow가 설치되어 있지 않습니다.")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'financial_db.csv')
+        columnar_dir = os.path.join(tmp, 'financial_db_parquet')
+        df = write_financial_db(csv_path, args.rows)
+        storage.sync_columnar(csv_path=csv_path, columnar_dir=columnar_dir)
+        latest_year = int(df['year'].max())
+
+        parquet_bytes = sum(os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(columnar_dir) for f in files)
+        print(f"📊 rows={args.rows:,}  CSV {os.path.getsize(csv_path) / 1e6:,.1f} MB / Parquet {parquet_bytes / 1e6:,.1f} MB")
+        print(f"   {'케이스':<20} {'시간':>9} {'행 수':>10} {'프레임':>10} {'첫 RSS 증가':>10}")
+
+        ctx = mp.get_context('spawn')
+        for case in ['csv (기존 대시보드)', 'csv 폴백 (read_db)', 'parquet 전체', 'parquet 컬럼 선택', 'parquet 최신 연도']:
+            queue = ctx.Queue()
+            proc = ctx.Process(target=run_case, args=(queue, case, csv_path, columnar_dir, latest_year, args.repeat))
+            proc.start()
+            sec, rows, frame_bytes, rss = queue.get()
+            proc.join()
+            print(f"   {case:<20} {sec * 1000:7.0f}ms {rows:>10,} {frame_bytes / 1e6:8.1f}MB {rss / 1e6:8.1f}MB")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+import time
+import argparse
+
+from metrics import compute_metrics
+from aggregates import PeriodIndex, paginate
+from dashboard_data import prepare, select_variant
+from bench.datagen import make_financial_db
+
+# -----------------------------------------------------------
+# 대시보드 탭별 지연 시간: 기존(매 실행마다 전체 프레임 계산) vs 집계 인덱스/페이지 표
+# 실행: python -m bench.bench_tabs --sizes 100000 1000000
+# 탭1의 Styler 비용은 Styler.to_html()로 잽니다. (st.dataframe도 셀마다 같은 문자열 변환을 거침)
+# -----------------------------------------------------------
+FORMATS = {'revenue': "{:,.0f}", 'profit': "{:,.0f}", 'net_income': "{:,.0f}",
+           'rev_qoq': "{:+.1f}%", 'rev_yoy': "{:+.1f}%", 'prof_qoq': "{:+.1f}%", 'opm': "{:+.1f}%"}
+TABLE_COLUMNS = ['corp_name', 'year', 'quarter', 'revenue', 'rev_qoq', 'rev_yoy', 'profit', 'prof_qoq', 'opm', 'net_income']
+
+def dashboard_view(n_rows):
+    # 대시보드와 같은 전처리 (iso4q, 백만 원 단위, 기업명·연도·분기 정렬)
+    return select_variant(prepare(compute_metrics(make_financial_db(n_rows, missing_rate=0.03))), True)
+
+def timed(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        sec = time.perf_counter() - t0
+        best = sec if best is None else min(best, sec)
+    return best
+
+def old_tab1(filtered):
+    table = filtered[TABLE_COLUMNS].sort_values(['revenue'], ascending=False)
+    return table.style.format(FORMATS, na_rep="-").to_html()
+
+def old_tab2(filtered):
+    growth = filtered[filtered['revenue'] > 10000]
+    return growth.nlargest(20, 'rev_qoq'), growth.nlargest(20, 'prof_qoq')
+
+def old_tab5(filtered):
+    return filtered.groupby('period')[['revenue', 'profit']].sum().reset_index()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100000, 1000000])
+    parser.add_argument('--styler-max', type=int, default=200000, help="이 행 수를 넘는 선택은 기존 탭1(전체 Styler)을 건너뜀")
+    parser.add_argument('--page-size', type=int, default=100)
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        view = dashboard_view(n)
+        t0 = time.perf_counter()
+        index = PeriodIndex(view)
+        build_sec = time.perf_counter() - t0
+        latest = int(view['year'].max())
+        print(f"📊 rows={len(view):,} (iso4q), 인덱스 생성 {build_sec * 1000:.0f}ms (데이터 버전당 1회)")
+        print(f"   {'선택':<12} {'탭':<14} {'기존':>10} {'변경':>10}")
+
+        for label, years in [('최신 연도', [latest]), ('전체 연도', [])]:
+            filtered = view[view['year'].isin(years)] if years else view
+            table = filtered[TABLE_COLUMNS].sort_values(['revenue'], ascending=False)
+
+            rows = []
+            old1 = timed(lambda: old_tab1(filtered), repeat=1) if len(filtered) <= args.styler_max else None
+            new1 = timed(lambda: paginate(table, 1, args.page_size)[0].style.format(FORMATS, na_rep="-").to_html())
+            rows.append(('탭1 상세 표', old1, new1))
+            rows.append(('탭2 Top 20', timed(lambda: old_tab2(filtered)),
+                         timed(lambda: (index.top('rev_qoq', 20, years), index.top('prof_qoq', 20, years)))))
+            rows.append(('탭5 추세', timed(lambda: old_tab5(filtered)), timed(lambda: index.period_totals(years))))
+            for tab, old, new in rows:
+                old_txt = f"{old * 1000:8.1f}ms" if old is not None else f"{'(생략)':>10}"
+                print(f"   {label:<12} {tab:<14} {old_txt} {new * 1000:8.1f}ms")
+
+if __name__ == '__main__':
+    main()
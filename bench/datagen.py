@@ -0,0 +1,71 @@
+import os
+import argparse
+import numpy as np
+import pandas as pd
+
+# -----------------------------------------------------------
+# financial_db.csv 형태의 합성 데이터 생성기 (벤치마크용)
+# -----------------------------------------------------------
+DB_COLUMNS = ['corp_code', 'corp_name', 'year', 'quarter',
+              '매출액', '영업이익', '순이익', '영업현금흐름', '수주잔고', '수주잔고_증감']
+QUARTERS = ['1Q', '2Q', '3Q', '4Q']
+SIZES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+DATA_DIR = os.path.join('bench', 'data')
+
+def make_financial_db(n_rows, seed=0, start_year=2015, missing_rate=0.0):
+    # 기업당 분기 수를 고정하고 기업 수로 행 수를 맞춥니다.
+    # missing_rate > 0이면 그 비율만큼 분기를 무작위로 빼서 결측 분기를 만듭니다.
+    rng = np.random.default_rng(seed)
+    n_periods = 40
+    n_corps = max(1, -(-n_rows // n_periods))
+
+    corp_idx = np.repeat(np.arange(n_corps), n_periods)[:n_rows]
+    period_idx = np.tile(np.arange(n_periods), n_corps)[:n_rows]
+
+    base = rng.lognormal(mean=24, sigma=1.5, size=n_corps)[corp_idx]
+    revenue = (base * rng.uniform(0.7, 1.3, n_rows)).round()
+    profit = (revenue * rng.normal(0.06, 0.08, n_rows)).round()
+    net_income = (profit * rng.uniform(0.5, 1.1, n_rows)).round()
+    cash_flow = (profit * rng.uniform(0.2, 1.5, n_rows)).round()
+
+    df = pd.DataFrame({
+        'corp_code': [f"{c:08d}" for c in corp_idx + 100000],
+        'corp_name': [f"기업{c:05d}" for c in corp_idx],
+        'year': start_year + period_idx // 4,
+        'quarter': np.array(QUARTERS)[period_idx % 4],
+        '매출액': revenue,
+        '영업이익': profit,
+        '순이익': net_income,
+        '영업현금흐름': cash_flow,
+        '수주잔고': 0.0,
+        '수주잔고_증감': 0.0,
+    }, columns=DB_COLUMNS)
+    if missing_rate > 0:
+        df = df[rng.random(len(df)) >= missing_rate].reset_index(drop=True)
+    return df
+
+def parse_size(label):
+    # '10k' / '1m' / '250000' → 행 수
+    return SIZES.get(label.lower()) or int(label)
+
+def write_financial_db(path, n_rows, seed=0, missing_rate=0.0):
+    df = make_financial_db(n_rows, seed=seed, missing_rate=missing_rate)
+    df.to_csv(path, index=False, encoding='utf-8-sig', lineterminator='\n')
+    return df
+
+# 실행: python -m bench.datagen --sizes 10k 100k 1m  → bench/data/financial_db_{size}.csv
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', nargs='+', default=list(SIZES))
+    parser.add_argument('--out', default=DATA_DIR)
+    parser.add_argument('--missing-rate', type=float, default=0.03)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    os.makedirs(args.out, exist_ok=True)
+    for label in args.sizes:
+        path = os.path.join(args.out, f"financial_db_{label}.csv")
+        df = write_financial_db(path, parse_size(label), seed=args.seed, missing_rate=args.missing_rate)
+        print(f"🧪 {path}: {len(df):,}행, {os.path.getsize(path) / 1e6:.1f}MB")
+
+if __name__ == '__main__':
+    main()
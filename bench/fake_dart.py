@@ -0,0 +1,83 @@
+import time
+import random
+import threading
+from datetime import datetime, timedelta
+import pandas as pd
+
+# -----------------------------------------------------------
+# 오프라인용 OpenDartReader 대역 (지연/실패 주입 가능)
+# -----------------------------------------------------------
+# latency: 호출마다 기본 지연(초), jitter: 그 위에 더하는 지수분포 지연의 평균(초, 가끔 느린 응답 재현)
+class FakeDart:
+    def __init__(self, latency=0.05, fail_rate=0.0, missing_rate=0.0, seed=0, reports_per_day=20, jitter=0.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.reports_per_day = reports_per_day
+        self.fail_rate = fail_rate
+        self.missing_rate = missing_rate
+        self.rng = random.Random(seed)
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def list(self, corp=None, start=None, end=None, kind='', kind_detail='', final=True):
+        # 하루 reports_per_day건씩 정기공시 목록 생성 (일부는 비상장/실적 외 보고서)
+        self.wait()
+        return make_report_list(start, end, self.reports_per_day)
+
+    def finstate(self, corp_code, year):
+        roll = self.wait()
+        if roll < self.fail_rate:
+            raise ConnectionError(f"fake DART timeout ({corp_code}, {year})")
+        if roll < self.fail_rate + self.missing_rate:
+            return None
+        return make_finstate(corp_code, year)
+
+    def wait(self):
+        # 호출 수를 세고 지연을 흉내 냄. 반환: 실패/결측 판정용 난수
+        with self.lock:
+            self.calls += 1
+            roll = self.rng.random()
+            delay = self.latency + (self.rng.expovariate(1 / self.jitter) if self.jitter > 0 else 0.0)
+        time.sleep(delay)
+        return roll
+
+REPORT_NAMES = ['분기보고서 ({year}.03)', '반기보고서 ({year}.06)', '분기보고서 ({year}.09)', '사업보고서 ({year}.12)']
+
+def make_report_list(start, end, reports_per_day=20):
+    # OpenDartReader.list()와 같은 컬럼 구성
+    rows = []
+    day = datetime.strptime(start, '%Y%m%d')
+    last = datetime.strptime(end, '%Y%m%d')
+    while day <= last:
+        if day.weekday() < 5:
+            for i in range(reports_per_day):
+                corp = (day.toordinal() * 7 + i * 13) % 2500
+                q = (day.month - 1) // 3
+                year = day.year if q > 0 else day.year - 1
+                report_nm = REPORT_NAMES[(q - 1) % 4].format(year=year)
+                if i % 11 == 5: report_nm = '[기재정정]' + report_nm
+                rows.append({
+                    'corp_code': f"{100000 + corp:08d}", 'corp_name': f"기업{corp:05d}",
+                    'stock_code': f"{corp:06d}" if i % 10 else None, 'corp_cls': 'Y' if corp % 2 else 'K',
+                    'report_nm': report_nm if i % 7 else '주요사항보고서(자기주식취득결정)',
+                    'rcept_no': f"{day:%Y%m%d}{800000 + i:06d}", 'flr_nm': f"기업{corp:05d}",
+                    'rcept_dt': f"{day:%Y%m%d}", 'rm': '',
+                })
+        day += timedelta(days=1)
+    return pd.DataFrame(rows)
+
+def make_finstate(corp_code, year):
+    # OpenDartReader.finstate()와 같은 모양: 계정별 CFS/OFS 행, 금액은 콤마 문자열
+    seed = int(str(corp_code)) * 31 + int(year)
+    base = 10_000_000_000 + seed % 90_000_000_000
+    amounts = {'매출액': base, '영업이익': base // 10, '법인세차감전 순이익': base // 12,
+               '당기순이익': base // 15, '자산총계': base * 3, '부채총계': base, '자본총계': base * 2}
+    rows = []
+    for fs_div, scale in (('CFS', 1.0), ('OFS', 0.8)):
+        for account_nm, amount in amounts.items():
+            rows.append({
+                'rcept_no': f"{year + 1}0315000001", 'bsns_year': str(year), 'corp_code': str(corp_code).zfill(8),
+                'fs_div': fs_div, 'sj_div': 'IS', 'account_nm': account_nm,
+                'thstrm_amount': f"{int(amount * scale):,}", 'frmtrm_amount': f"{int(amount * scale * 0.9):,}",
+            })
+    return pd.DataFrame(rows)
@@ -0,0 +1,220 @@
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import contextlib
+import subprocess
+from datetime import datetime
+
+import pandas as pd
+
+import main as ingest
+import dashboard_data
+from storage import CSV_FILE, read_db
+from metrics import compute_metrics
+from aggregates import PeriodIndex
+from screening import compute_screening, screen
+from bench.datagen import SIZES, parse_size, write_financial_db
+from bench.fake_dart import FakeDart
+
+# -----------------------------------------------------------
+# 헤드리스 벤치마크 모음 (대시보드 로딩·4Q 변환·필터 + 수집 루프) + 결과 저장/회귀 비교
+# 실행: python -m bench.run_suite --sizes 10k 100k 1m --ingest-sizes 10k 100k
+#       python -m bench.run_suite --sizes 100k --baseline bench/results/latest.json --fail-on-regression
+# -----------------------------------------------------------
+# 크기마다 임시 폴더에 합성 financial_db.csv를 만들고 그 안에서 실행합니다. (저장소 파일은 건드리지 않음)
+# 결과는 bench/results/bench_YYYYmmdd_HHMMSS.json과 latest.json에 남기고,
+# --baseline을 주면 케이스별로 비교해 threshold배 이상 느려진 항목을 회귀로 표시합니다.
+RESULTS_DIR = os.path.join('bench', 'results')
+DEFAULT_THRESHOLD = 1.25
+MIN_COMPARE_SEC = 0.005   # 이보다 짧은 케이스는 측정 오차가 커서 회귀 판정에서 제외
+
+def timed(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        sec = time.perf_counter() - t0
+        best = sec if best is None else min(best, sec)
+    return best
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+@contextlib.contextmanager
+def workdir(path):
+    cwd = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+
+def bench_dashboard(repeat):
+    # 대시보드 데이터 계층 (dashboard.py가 캐시로 감싸는 함수들)
+    results = {}
+    results['load.csv_to_metrics'] = timed(lambda: dashboard_data.load_dataset(url=None), repeat=1)
+    db = read_db()
+    results['4q.compute_metrics'] = timed(lambda: compute_metrics(db), repeat)
+
+    df, _ = dashboard_data.load_dataset(url=None)
+    view = dashboard_data.select_variant(df, True)
+    latest = int(view['year'].max())
+    corps = list(view['corp_name'].unique()[:5])
+    results['filter.all'] = timed(lambda: dashboard_data.filter_frame(view), repeat)
+    results['filter.latest_year'] = timed(lambda: dashboard_data.filter_frame(view, years=[latest]), repeat)
+    results['filter.five_corps'] = timed(lambda: dashboard_data.filter_frame(view, corps=corps), repeat)
+    results['table.summary_all'] = timed(lambda: dashboard_data.summary_table(view), repeat)
+
+    t0 = time.perf_counter()
+    index = PeriodIndex(view)
+    results['top.index_build'] = time.perf_counter() - t0
+    results['top.index_top20'] = timed(lambda: (index.top('rev_qoq', 20, [latest]), index.top('prof_qoq', 20, [latest])), repeat)
+    results['top.nlargest_all'] = timed(lambda: dashboard_data.top_growth(view), repeat)
+    results['trend.index'] = timed(lambda: index.period_totals(), repeat)
+    results['trend.groupby'] = timed(lambda: dashboard_data.period_trend(view), repeat)
+
+    # 스크리닝: 전체 계산(수집 때 1회) / 탭 조회(기준 분기 + 조건)
+    metrics = dashboard_data.read_metrics(CSV_FILE, columns=None)
+    results['screen.compute_all'] = timed(lambda: compute_screening(metrics), repeat)
+    table = dashboard_data.prepare_screening(compute_screening(metrics))
+    latest_period = int(table['period'].max())
+    results['screen.query_latest'] = timed(lambda: screen(table, latest_period, min_rev_streak=2, min_ttm_revenue=10000), repeat)
+    return results
+
+def bench_ingest(args):
+    # main.main()을 가짜 DART로 실행 (슬랙 끔, finstate 디스크 캐시 끔). 단계별 시간은 실행 리포트에서 가져옴
+    env = {'SLACK_WEBHOOK_URL': None, 'FINSTATE_CACHE_DIR': '', 'RUN_REPORT_PATH': 'run_report.json',
+           'DART_RATE_PER_SEC': str(args.rate)}
+    saved_env = {key: os.environ.get(key) for key in env}
+    for key, value in env.items():
+        if value is None: os.environ.pop(key, None)
+        else: os.environ[key] = value
+    dart = FakeDart(latency=args.latency, jitter=args.jitter, fail_rate=0.02, missing_rate=0.05)
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            t0 = time.perf_counter()
+            code = ingest.main(['--start', args.ingest_start, '--end', args.ingest_end, '--no-resume'], dart=dart)
+            total = time.perf_counter() - t0
+    finally:
+        for key, value in saved_env.items():
+            if value is None: os.environ.pop(key, None)
+            else: os.environ[key] = value
+    with open('run_report.json', encoding='utf-8') as f:
+        report = json.load(f)
+    results = {'ingest.total': total}
+    for name, stage in report['stages'].items():
+        results[f"ingest.{name}"] = stage['total_sec']
+    extra = {'exit_code': code, 'saved': report['saved'], 'api_calls': report['api_calls'], 'bytes': report['bytes']}
+    return results, extra
+
+def bench_after_ingest(repeat):
+    # 수집 후: main.py가 만든 지표 테이블/SQLite 사본에서 읽는 경로
+    results = {'load.metrics_table': timed(lambda: dashboard_data.read_metrics(CSV_FILE), repeat)}
+    df, info = dashboard_data.load_dataset(url=None)
+    if info['use_sql']:
+        latest = int(dashboard_data.data_options(df, info)[1][0])
+        results['filter.sql_latest_year'] = timed(lambda: dashboard_data.query_filtered(True, years=[latest]), repeat)
+    return results
+
+def run_size(label, args):
+    n_rows = parse_size(label)
+    tmp = tempfile.mkdtemp(prefix=f"bench_{label}_")
+    try:
+        with workdir(tmp):
+            write_financial_db(CSV_FILE, n_rows, missing_rate=0.03)
+            print(f"📊 {label}: {n_rows:,}행 ({os.path.getsize(CSV_FILE) / 1e6:.1f}MB)")
+            results = bench_dashboard(args.repeat)
+            extra = {}
+            if label in args.ingest_sizes:
+                ingest_results, extra = bench_ingest(args)
+                results.update(ingest_results)
+                results.update(bench_after_ingest(args.repeat))
+            return {'rows': n_rows, 'cases': {k: round(v, 6) for k, v in results.items()}, **extra}
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+def compare(current, baseline, threshold):
+    # 반환: [(크기, 케이스, 기준 초, 현재 초, 배율)] 중 threshold배 이상 느려진 항목
+    regressions = []
+    for label, result in current['results'].items():
+        base_cases = baseline.get('results', {}).get(label, {}).get('cases', {})
+        for case, sec in result['cases'].items():
+            base = base_cases.get(case)
+            if base is None or max(base, sec) < MIN_COMPARE_SEC: continue
+            ratio = sec / base if base > 0 else float('inf')
+            if ratio >= threshold:
+                regressions.append((label, case, base, sec, ratio))
+    return regressions
+
+def print_results(current, baseline=None):
+    for label, result in current['results'].items():
+        base_cases = (baseline or {}).get('results', {}).get(label, {}).get('cases', {})
+        print(f"\n📊 {label} ({result['rows']:,}행)")
+        for case, sec in result['cases'].items():
+            line = f"   {case:<34} {sec * 1000:10.1f}ms"
+            if case in base_cases and base_cases[case] > 0:
+                line += f"   기준 {base_cases[case] * 1000:10.1f}ms  x{sec / base_cases[case]:.2f}"
+            print(line)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', nargs='+', default=list(SIZES))
+    parser.add_argument('--ingest-sizes', nargs='*', default=['10k', '100k'], help="수집 루프까지 돌릴 크기")
+    parser.add_argument('--ingest-start', default='20250303')
+    parser.add_argument('--ingest-end', default='20250314')
+    parser.add_argument('--latency', type=float, default=0.02, help="가짜 DART 호출당 지연(초)")
+    parser.add_argument('--jitter', type=float, default=0.01, help="가짜 DART 지연 꼬리(지수분포 평균, 초)")
+    parser.add_argument('--rate', type=float, default=50, help="수집 시 초당 finstate 호출 수")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--out', default=RESULTS_DIR)
+    parser.add_argument('--baseline', help="비교할 이전 결과 JSON (예: bench/results/latest.json)")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument('--fail-on-regression', action='store_true')
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    current = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'params': {k: v for k, v in vars(args).items() if k not in ('out', 'baseline', 'fail_on_regression')},
+        'results': {},
+    }
+    for label in args.sizes:
+        current['results'][label] = run_size(label, args)
+
+    print_results(current, baseline)
+    os.makedirs(args.out, exist_ok=True)
+    path = os.path.join(args.out, f"bench_{datetime.now():%Y%m%d_%H%M%S}.json")
+    for out_path in (path, os.path.join(args.out, 'latest.json')):
+        with open(out_path, 'w', encoding='utf-8') as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 결과 저장: {path}")
+
+    if baseline is not None:
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"🚨 회귀 {len(regressions)}건 (기준 대비 x{args.threshold} 이상, 기준 커밋 {baseline.get('commit')})")
+            for label, case, base, sec, ratio in regressions:
+                print(f"   {label} {case}: {base * 1000:.1f}ms → {sec * 1000:.1f}ms (x{ratio:.2f})")
+            if args.fail_on_regression:
+                sys.exit(1)
+        else:
+            print(f"✅ 회귀 없음 (기준 커밋 {baseline.get('commit')})")
+
+if __name__ == '__main__':
+    main()
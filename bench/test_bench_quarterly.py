@@ -0,0 +1,28 @@
+import pytest
+
+from metrics import compute_metrics
+from bench.datagen import make_financial_db
+from bench.bench_quarterly import old_pipeline
+
+# -----------------------------------------------------------
+# pytest-benchmark 버전 (bench_quarterly.py와 같은 비교)
+# 실행: python -m pytest bench/test_bench_quarterly.py --benchmark-only
+#       python -m pytest bench/test_bench_quarterly.py --benchmark-autosave  (이후 --benchmark-compare로 비교)
+# -----------------------------------------------------------
+pytest.importorskip('pytest_benchmark')
+
+SIZES = [15000, 100000, 1000000]
+OLD_MAX = 100000   # 기존 로직은 행 단위 apply라 1M은 건너뜀
+
+@pytest.fixture(scope='module', params=SIZES, ids=lambda n: f"{n // 1000}k")
+def raw(request):
+    return make_financial_db(request.param, missing_rate=0.03)
+
+def test_engine(benchmark, raw):
+    metrics = benchmark.pedantic(compute_metrics, args=(raw,), rounds=3, iterations=1)
+    assert len(metrics) == 2 * len(raw)
+
+def test_old_pipeline(benchmark, raw):
+    if len(raw) > OLD_MAX:
+        pytest.skip("기존 로직은 100k행까지만 측정")
+    benchmark.pedantic(old_pipeline, args=(raw,), rounds=1, iterations=1)
@@ -0,0 +1,81 @@
+import time
+import threading
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# -----------------------------------------------------------
+# DART 재무데이터 병렬 조회 (토큰 버킷 + 재시도)
+# -----------------------------------------------------------
+# 조회는 스레드 풀에서, 저장/알림은 호출한 쪽(메인 스레드)에서 하나씩 처리합니다.
+DEFAULT_WORKERS = 4
+DEFAULT_RATE = 5.0      # 초당 요청 수 (DART 분당 제한 이내)
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 1.0   # 1초, 2초, 4초 ...
+
+class TokenBucket:
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+def call_with_retry(func, *args, limiter=None, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF):
+    for attempt in range(retries + 1):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            return func(*args)
+        except Exception as e:
+            if attempt == retries:
+                raise
+            wait = backoff * (2 ** attempt)
+            print(f"   🔁 재시도 {attempt + 1}/{retries} ({wait:.1f}초 후): {e}")
+            time.sleep(wait)
+
+def fetch_one(dart, corp_code, year, limiter=None, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, refresh=False):
+    # 캐시(CachedDart.cached)에 있으면 토큰을 쓰지 않고 바로 반환, 없을 때만 속도 제한을 거쳐 API 호출
+    # refresh=True(정정공시)면 캐시를 건너뜀
+    cached = getattr(dart, 'cached', None)
+    if cached is not None and not refresh:
+        found, fs = cached(corp_code, year)
+        if found:
+            return fs
+    func = partial(dart.finstate, refresh=True) if refresh else dart.finstate
+    return call_with_retry(func, corp_code, year, limiter=limiter, retries=retries, backoff=backoff)
+
+def fetch_finstate(dart, corp_code, year, limiter=None, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, refresh=False):
+    # 당해 연도 데이터가 없으면(None) 전년도로 한 번 더 조회
+    fs = fetch_one(dart, corp_code, year, limiter, retries, backoff, refresh)
+    if fs is None:
+        fs = fetch_one(dart, corp_code, year - 1, limiter, retries, backoff, refresh)
+    return fs
+
+def fetch_all(dart, jobs, max_workers=DEFAULT_WORKERS, rate=DEFAULT_RATE,
+              retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF):
+    # jobs: dict 목록 (corp_code, year 필수, amended=True면 캐시 무시). 완료되는 순서대로 (job, fs, error)를 돌려줍니다.
+    limiter = TokenBucket(rate)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(fetch_finstate, dart, job['corp_code'], job['year'], limiter, retries, backoff,
+                        job.get('amended', False)): job
+            for job in jobs
+        }
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                yield job, future.result(), None
+            except Exception as e:
+                yield job, None, e
@@ -1,86 +1,34 @@
 import streamlit as st
-import pandas as pd
-import numpy as np # inf 처리를 위해 추가
 import plotly.express as px
 import plotly.graph_objects as go
+from storage import CSV_FILE
+from aggregates import PeriodIndex, paginate
+from dashboard_data import (CSV_URL, REV_COLUMNS, PROF_COLUMNS, format_big_number, load_dataset, data_options,
+                            select_variant, filter_frame, query_filtered, summary_table, top_growth, period_trend,
+                            summary_kpis, display_frame, read_screening, prepare_screening, SCREEN_COLUMNS)
+from screening import screen
+from quarterly import period_label
 
 # -----------------------------------------------------------------------------
 # 1. 페이지 설정
 # -----------------------------------------------------------------------------
 st.set_page_config(page_title="Yeouido Pro Dashboard", layout="wide", page_icon="📈")
 
-# [함수] 큰 숫자 포맷팅
-def format_big_number(value):
-    if pd.isna(value) or value == 0: return "-"
-    val = float(value)
-    if abs(val) >= 1000000: return f"{val/1000000:,.1f}조"
-    elif abs(val) >= 100:   return f"{val/100:,.1f}억"
-    else: return f"{val:,.0f}백만"
-
 # -----------------------------------------------------------------------------
-# 2. 데이터 로드 및 전처리
+# 2. 데이터 로드 및 전처리 (데이터 함수는 dashboard_data.py, 여기서는 캐시만)
 # -----------------------------------------------------------------------------
-CSV_URL = "https://raw.githubusercontent.com/YH4762/stock-bot/main/financial_db.csv"
+# 전체 지표 프레임은 cache_resource로 세션 간에 한 벌만 공유합니다. (cache_data는 호출마다 복사본을 돌려줌)
+# 공유 객체이므로 제자리 수정하지 말고, 걸러낸 새 프레임만 만들어 씁니다.
+@st.cache_resource(ttl=600)
+def load_data():
+    return load_dataset(CSV_URL)
 
 @st.cache_data(ttl=3600)
-def load_data():
-    try:
-        try: df = pd.read_csv(CSV_URL)
-        except UnicodeDecodeError: df = pd.read_csv(CSV_URL, encoding='cp949')
-    except: return pd.DataFrame()
-
-    # 1. 컬럼명 통합
-    rename_map = {
-        '매출액': 'revenue', '영업이익': 'profit', '영업현금흐름': 'cash_flow', 
-        '당기순이익': 'net_income', '순이익': 'net_income', 
-        '분기순이익': 'net_income', '반기순이익': 'net_income', '연결당기순이익': 'net_income'
-    }
-    col_map = {k: v for k, v in rename_map.items() if k in df.columns}
-    df = df.rename(columns=col_map)
-    
-    # 2. 숫자 전처리 (백만 단위)
-    target_cols = ['revenue', 'profit', 'net_income', 'cash_flow']
-    for col in target_cols:
-        if col in df.columns:
-            if df[col].dtype == object:
-                df[col] = df[col].astype(str).str.replace(',', '').apply(pd.to_numeric, errors='coerce')
-            df[col] = df[col].fillna(0) / 1000000 
-
-    # 3. 정렬 및 시계열 컬럼
-    df = df.sort_values(['corp_name', 'year', 'quarter'])
-    df['period'] = df['year'].astype(str) + "-" + df['quarter']
-
-    # 4. 이익률(OPM)
-    if 'revenue' in df.columns and 'profit' in df.columns:
-        df['opm'] = df.apply(lambda x: (x['profit'] / x['revenue'] * 100) if x['revenue'] != 0 else 0, axis=1)
-
-    # ---------------------------------------------------------
-    # [QoQ & YoY 계산] - 전체 데이터 기준 (필터링 전 수행해야 정확함)
-    # ---------------------------------------------------------
-    # QoQ
-    df['rev_qoq'] = df.groupby('corp_name')['revenue'].pct_change().fillna(0) * 100
-    df['prof_qoq'] = df.groupby('corp_name')['profit'].pct_change().fillna(0) * 100
-
-    # 무한대(inf) 처리: 전분기 0원이었던 경우 성장률이 무한대로 뜸 -> 0이나 999%로 치환
-    df.replace([np.inf, -np.inf], 0, inplace=True)
-
-    # YoY
-    df['prev_year'] = df['year'] - 1
-    df_prev = df[['corp_name', 'year', 'quarter', 'revenue', 'profit']].copy()
-    df_prev = df_prev.rename(columns={'year': 'join_year', 'revenue': 'rev_prev', 'profit': 'prof_prev'})
-    
-    df = pd.merge(df, df_prev, left_on=['corp_name', 'prev_year', 'quarter'], right_on=['corp_name', 'join_year', 'quarter'], how='left')
-    
-    df['rev_yoy'] = ((df['revenue'] - df['rev_prev']) / df['rev_prev'] * 100).fillna(0)
-    df['prof_yoy'] = ((df['profit'] - df['prof_prev']) / df['prof_prev'] * 100).fillna(0)
-    df.replace([np.inf, -np.inf], 0, inplace=True) # YoY도 inf 제거
-    
-    # 안전장치
-    df['period'] = df['year'].astype(str) + "-" + df['quarter']
-    
-    return df
+def get_options(version):
+    return data_options(*load_data())
 
-raw_df = load_data()
+load_info = load_data()[1]
+all_corps, all_years, all_q = get_options(load_info.get('version'))
 
 # -----------------------------------------------------------------------------
 # 3. 사이드바 (필터링)
@@ -88,22 +36,23 @@ raw_df = load_data()
 with st.sidebar:
     st.header("🏢 Analysis Console")
     
-    if not raw_df.empty:
+    if all_corps:
         st.subheader("⚙️ 데이터 옵션")
         use_iso_4q = st.checkbox("4Q(누적) 개별 분기 변환", value=True)
         
         st.divider()
 
-        all_corps = sorted(raw_df['corp_name'].unique())
         selected_corps = st.multiselect("기업 선택", all_corps, placeholder="전체 보기 (비워두면 전체)")
         
-        all_years = sorted(raw_df['year'].unique(), reverse=True)
         sel_year = st.multiselect("연도", all_years, default=all_years[:1]) # 기본: 최신 연도만
-        all_q = sorted(raw_df['quarter'].unique())
         sel_q = st.multiselect("분기", all_q, default=['1Q', '2Q', '3Q', '4Q']) # 기본: 전체 분기
         
         st.divider()
         st.caption("모든 금액 단위: 백만 원")
+        source_label = ("로컬 SQLite" if load_info['use_sql'] else "로컬") if load_info['path'] == CSV_FILE else "원격 사본"
+        st.caption(f"데이터: {source_label} ({load_info['status']}) · 확인 {load_info['fetch_sec']:.2f}s · 지표 {load_info['load_sec']:.2f}s"
+                   + (f" · 메모리 {load_info['memory_mb']:.1f}MB (공유)" if 'memory_mb' in load_info else ""))
+        if load_info['error']: st.caption(f"⚠️ 원격 확인 실패, 보관된 데이터 사용: {load_info['error']}")
     else:
         selected_corps, sel_year, sel_q = [], [], []
         use_iso_4q = False
@@ -111,57 +60,67 @@ with st.sidebar:
 # -----------------------------------------------------------------------------
 # 4. 데이터 가공 (4Q 보정)
 # -----------------------------------------------------------------------------
-if raw_df.empty:
-    st.error("데이터 로딩 실패")
+if not all_corps:
+    st.error(f"데이터 로딩 실패: {load_info['error'] or '데이터 없음'}")
     st.stop()
 
-df = raw_df.copy()
+# 위젯을 건드릴 때마다 스크립트 전체가 다시 실행되므로, 단계별 결과를 선택값 기준으로 캐시합니다.
+# 캐시 함수는 DataFrame 대신 (4Q 옵션, 선택값 튜플)만 인자로 받아 해시 비용을 줄이고,
+# 내부에서 load_data() 캐시를 다시 불러옵니다.
+# version(데이터 파일 크기·수정 시각)을 키에 넣어, 원격 데이터가 바뀌면 이전 결과를 쓰지 않습니다.
+@st.cache_resource(ttl=3600)
+def get_view(version, use_iso_4q):
+    return select_variant(load_data()[0], use_iso_4q)
 
-if use_iso_4q:
-    df = df.sort_values(['corp_name', 'year', 'quarter'])
-    pivot = df[df['quarter'].isin(['1Q', '2Q', '3Q'])].pivot_table(
-        index=['corp_name', 'year'], values=['revenue', 'profit', 'net_income'], aggfunc='sum'
-    ).reset_index().rename(columns={'revenue': 'r_sum', 'profit': 'p_sum', 'net_income': 'n_sum'})
-    
-    df = pd.merge(df, pivot, on=['corp_name', 'year'], how='left')
-    mask_4q = df['quarter'] == '4Q'
-    for col, sum_col in zip(['revenue', 'profit', 'net_income'], ['r_sum', 'p_sum', 'n_sum']):
-        if col in df.columns:
-            df.loc[mask_4q, col] = df.loc[mask_4q, col] - df.loc[mask_4q, sum_col].fillna(0)
-    
-    # 보정 후 OPM 재계산
-    if 'revenue' in df.columns and 'profit' in df.columns:
-        df['opm'] = df.apply(lambda x: (x['profit'] / x['revenue'] * 100) if x['revenue'] != 0 else 0, axis=1)
+@st.cache_data(ttl=3600)
+def get_filtered(version, use_iso_4q, corps, years, quarters):
+    if load_data()[1]['use_sql']:
+        return query_filtered(use_iso_4q, corps, years, quarters)
+    return filter_frame(get_view(version, use_iso_4q), corps, years, quarters)
+
+@st.cache_resource(ttl=3600)
+def get_period_index(version, use_iso_4q):
+    # 분기별 합계/성장률 정렬 인덱스 (데이터 버전·4Q 옵션마다 한 번 생성, 복사 없이 공유)
+    if load_data()[1]['use_sql']:
+        return PeriodIndex(query_filtered(use_iso_4q))
+    return PeriodIndex(get_view(version, use_iso_4q))
+
+@st.cache_data(ttl=3600)
+def get_csv(selection):
+    # 다운로드 버튼을 눌렀을 때만 만들어집니다.
+    return display_frame(get_filtered(*selection)).to_csv(index=False).encode('utf-8-sig')
 
-# [핵심 변경] 필터 적용 (이제 이 filtered_df가 모든 탭의 기준이 됩니다)
-filtered_df = df.copy()
-if selected_corps: filtered_df = filtered_df[filtered_df['corp_name'].isin(selected_corps)]
-if sel_year: filtered_df = filtered_df[filtered_df['year'].isin(sel_year)]
-if sel_q: filtered_df = filtered_df[filtered_df['quarter'].isin(sel_q)]
+@st.cache_data(ttl=3600)
+def get_kpis(selection):
+    return summary_kpis(get_filtered(*selection))
 
-csv_data = filtered_df.to_csv(index=False).encode('utf-8-sig')
+# [핵심 변경] 필터 적용 (선택 결과가 모든 탭의 기준이 됩니다)
+# 스크립트에는 선택 행 전체를 들고 있지 않고, 탭마다 필요한 컬럼만 캐시 함수에서 받아 씁니다.
+selection = (load_info['version'], use_iso_4q, tuple(selected_corps), tuple(sel_year), tuple(sel_q))
+kpis = get_kpis(selection)
 
 # -----------------------------------------------------------------------------
 # 5. 메인 대시보드
 # -----------------------------------------------------------------------------
 st.title("📈 Yeouido Pro Dashboard")
-st.markdown(f"**Selected Data:** {len(filtered_df):,} rows | **Unit:** 백만 원 (Million KRW)")
+st.markdown(f"**Selected Data:** {kpis['rows']:,} rows | **Unit:** 백만 원 (Million KRW)")
 
-if not filtered_df.empty:
+if kpis['rows']:
     k1, k2, k3, k4 = st.columns(4)
-    k1.metric("총 매출액", format_big_number(filtered_df['revenue'].sum()))
-    k2.metric("총 영업이익", format_big_number(filtered_df['profit'].sum()))
-    k3.metric("평균 이익률", f"{filtered_df['opm'].mean():.1f}%")
-    k4.metric("분석 대상", f"{filtered_df['corp_name'].nunique()}개사")
+    k1.metric("총 매출액", format_big_number(kpis['revenue']))
+    k2.metric("총 영업이익", format_big_number(kpis['profit']))
+    k3.metric("평균 이익률", f"{kpis['opm']:.1f}%")
+    k4.metric("분석 대상", f"{kpis['corps']}개사")
 
 st.divider()
 
-tab1, tab2, tab3, tab4, tab5 = st.tabs([
+tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
     "📊 종합 현황", 
     "🔥 급상승 Top 20", 
     "⚔️ 경쟁사 비교", 
     "📅 분기 분석", 
-    "📈 추세"
+    "📈 추세",
+    "🧭 스크리닝"
 ])
 
 # [스타일 함수] 콤마 강제 적용을 위한 Pandas Styler
@@ -173,16 +132,98 @@ def apply_comma_style(dataframe, cols_to_format):
                 format_dict[col] = "{:+.1f}%"
             else:
                 format_dict[col] = "{:,.0f}"
-    return dataframe.style.format(format_dict)
+    return dataframe.style.format(format_dict, na_rep="-")
+
+# [캐시] 탭별 표/차트 (선택값이 같으면 다시 만들지 않음)
+@st.cache_data(ttl=3600)
+def get_summary_table(selection):
+    return summary_table(get_filtered(*selection))
+
+@st.cache_data(ttl=3600)
+def get_table_page(selection, page, page_size):
+    # 세션에는 현재 페이지만 넘깁니다. (정렬된 전체 표는 캐시 안에만)
+    return paginate(get_summary_table(selection), page, page_size)
+
+@st.cache_data(ttl=3600)
+def get_top_growth(selection):
+    # 노이즈 제거: 매출 100억 이상
+    # 기업을 고르지 않았으면 분기별 정렬 인덱스에서 선택 분기의 앞부분만 모아 고릅니다.
+    version, use_iso_4q, corps, years, quarters = selection
+    if not corps:
+        index = get_period_index(version, use_iso_4q)
+        return index.top('rev_qoq', 20, years, quarters, REV_COLUMNS), index.top('prof_qoq', 20, years, quarters, PROF_COLUMNS)
+    return top_growth(get_filtered(*selection))
+
+@st.cache_data(ttl=3600)
+def get_peer_figures(selection, comp_a, comp_b):
+    df = get_filtered(*selection)
+    df_comp = df[df['corp_name'].isin([comp_a, comp_b])].sort_values('period')
+    if df_comp.empty: return None
+    df_comp = display_frame(df_comp[['corp_name', 'period', 'revenue', 'profit']])
+    fig = px.bar(df_comp, x='period', y='revenue', color='corp_name', barmode='group', title="매출액 비교")
+    fig.update_traces(texttemplate='%{y:,.0f}', textposition='outside')
+    fig2 = px.bar(df_comp, x='period', y='profit', color='corp_name', barmode='group', title="영업이익 비교")
+    fig2.update_traces(texttemplate='%{y:,.0f}', textposition='outside')
+    return fig, fig2
+
+@st.cache_data(ttl=3600)
+def get_season_figures(selection, target):
+    df = get_filtered(*selection)
+    target_df = df[df['corp_name'] == target].sort_values(['year', 'quarter'])
+    if target_df.empty: return None
+    target_df = display_frame(target_df[['year', 'quarter', 'revenue', 'profit']])
+    target_df = target_df.assign(year_str=target_df['year'].astype(str))
+    fig = px.bar(target_df, x='quarter', y='revenue', color='year_str', barmode='group', title="매출액")
+    fig.update_traces(texttemplate='%{y:,.0f}', textposition='outside')
+    fig2 = px.bar(target_df, x='quarter', y='profit', color='year_str', barmode='group', title="영업이익")
+    fig2.update_traces(texttemplate='%{y:,.0f}', textposition='outside')
+    return fig, fig2
+
+@st.cache_data(ttl=3600)
+def get_trend_figure(selection):
+    version, use_iso_4q, corps, years, quarters = selection
+    if corps: d_sum = period_trend(get_filtered(*selection))
+    else: d_sum = get_period_index(version, use_iso_4q).period_totals(years, quarters)
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=d_sum['period'], y=d_sum['revenue'], name='매출',
+        text=d_sum['revenue'], texttemplate='%{text:,.0f}', textposition='auto'
+    ))
+    fig.add_trace(go.Scatter(
+        x=d_sum['period'], y=d_sum['profit'], name='이익', line=dict(color='orange', width=3),
+        mode='lines+markers+text', text=d_sum['profit'], texttemplate='%{text:,.0f}', textposition='top center'
+    ))
+    return fig
+
+# 스크리닝 테이블: main.py가 수집 때 미리 계산한 전 기간·전 기업 값을 읽기만 합니다. (세션 간 한 벌 공유)
+@st.cache_resource(ttl=3600)
+def get_screening(version):
+    return prepare_screening(read_screening(load_data()[1]['path']))
+
+@st.cache_data(ttl=3600)
+def get_screen_periods(version, years, quarters):
+    # 사이드바 연도/분기 안에서 고를 수 있는 기준 분기 (최신순)
+    periods = filter_frame(get_screening(version), years=years, quarters=quarters)['period'].unique()
+    return sorted((int(p) for p in periods), reverse=True)
+
+@st.cache_data(ttl=3600)
+def get_screen_result(version, corps, period, min_rev_streak, min_prof_streak, min_ttm_revenue, sort_by, k):
+    result = screen(get_screening(version), period, corps, min_rev_streak, min_prof_streak, min_ttm_revenue, sort_by, k)
+    return display_frame(result[SCREEN_COLUMNS])
 
 # --- Tab 1: 종합 현황 ---
 with tab1:
     st.subheader("🏆 상세 실적 리스트")
-    if not filtered_df.empty:
-        cols = ['corp_name', 'year', 'quarter', 'revenue', 'rev_qoq', 'rev_yoy', 'profit', 'prof_qoq', 'opm', 'net_income']
-        table_df = filtered_df[[c for c in cols if c in filtered_df.columns]].sort_values(['revenue'], ascending=False)
+    if kpis['rows']:
+        # 전체를 한 번에 그리지 않고 페이지 단위로 (현재 페이지만 스타일 적용)
+        p1, p2, p3 = st.columns([1, 1, 4])
+        with p1: page_size = st.selectbox("페이지당 행 수", [50, 100, 200], index=1)
+        n_pages = max(1, -(-kpis['rows'] // page_size))
+        with p2: page = st.number_input("페이지", min_value=1, max_value=n_pages, value=1, step=1)
+        page_df, n_pages = get_table_page(selection, page, page_size)
+        with p3: st.caption(f"{kpis['rows']:,}행 중 {page}/{n_pages} 페이지 (매출액 순)")
         
-        styled_df = apply_comma_style(table_df, ['revenue', 'profit', 'net_income', 'rev_qoq', 'rev_yoy', 'prof_qoq', 'opm'])
+        styled_df = apply_comma_style(page_df, ['revenue', 'profit', 'net_income', 'rev_qoq', 'rev_yoy', 'prof_qoq', 'opm'])
         
         st.dataframe(
             styled_df,
@@ -199,12 +240,11 @@ with tab2:
     st.subheader("🔥 선택된 기간 내 급상승 Top 20")
     st.markdown("사이드바에서 선택한 **연도/분기** 데이터 중 성장률이 높은 기업을 보여줍니다. (매출 100억 이상)")
     
-    if not filtered_df.empty:
-        # [수정됨] filtered_df를 사용하므로 사이드바 선택 값만 남음
-        # 노이즈 제거: 매출 100억 이상
-        growth_df = filtered_df[filtered_df['revenue'] > 10000].copy()
+    if kpis['rows']:
+        # [수정됨] 선택 결과 기준이므로 사이드바 선택 값만 남음
+        top_rev, top_prof = get_top_growth(selection)
 
-        if growth_df.empty:
+        if top_rev.empty:
             st.warning("조건에 맞는 데이터가 없습니다. (매출 100억 미만이거나 데이터 부족)")
         else:
             c1, c2 = st.columns(2)
@@ -212,7 +252,6 @@ with tab2:
             with c1:
                 st.markdown("#### 🚀 매출 급상승 (QoQ)")
                 # 필터링된 데이터 중에서 Top 20 선정
-                top_rev = growth_df.nlargest(20, 'rev_qoq')[['corp_name', 'year', 'quarter', 'revenue', 'rev_qoq']]
                 st.dataframe(
                     apply_comma_style(top_rev, ['revenue', 'rev_qoq']),
                     column_config={"corp_name": "기업명", "revenue": "매출액", "rev_qoq": "성장률"},
@@ -221,7 +260,6 @@ with tab2:
 
             with c2:
                 st.markdown("#### 💰 이익 급상승 (QoQ)")
-                top_prof = growth_df.nlargest(20, 'prof_qoq')[['corp_name', 'year', 'quarter', 'profit', 'prof_qoq']]
                 st.dataframe(
                     apply_comma_style(top_prof, ['profit', 'prof_qoq']),
                     column_config={"corp_name": "기업명", "profit": "영업이익", "prof_qoq": "성장률"},
@@ -232,24 +270,18 @@ with tab2:
 with tab3:
     st.subheader("⚔️ Peer Group 비교")
     c1, c2 = st.columns(2)
-    opts = sorted(raw_df['corp_name'].unique())
+    opts = all_corps
     if len(opts) > 0:
         with c1: comp_a = st.selectbox("기업 A", opts, index=0)
         with c2: comp_b = st.selectbox("기업 B", opts, index=1 if len(opts)>1 else 0)
 
         # 필터링된 데이터 안에서 비교 (선택된 기간만 비교됨)
-        df_comp = filtered_df[filtered_df['corp_name'].isin([comp_a, comp_b])].copy()
+        figs = get_peer_figures(selection, comp_a, comp_b)
         
-        if not df_comp.empty:
+        if figs is not None:
             cc1, cc2 = st.columns(2)
-            with cc1:
-                fig = px.bar(df_comp.sort_values('period'), x='period', y='revenue', color='corp_name', barmode='group', title="매출액 비교")
-                fig.update_traces(texttemplate='%{y:,.0f}', textposition='outside')
-                st.plotly_chart(fig, use_container_width=True)
-            with cc2:
-                fig2 = px.bar(df_comp.sort_values('period'), x='period', y='profit', color='corp_name', barmode='group', title="영업이익 비교")
-                fig2.update_traces(texttemplate='%{y:,.0f}', textposition='outside')
-                st.plotly_chart(fig2, use_container_width=True)
+            with cc1: st.plotly_chart(figs[0], use_container_width=True)
+            with cc2: st.plotly_chart(figs[1], use_container_width=True)
         else:
             st.info("선택된 기간에 해당 기업의 데이터가 없습니다.")
 
@@ -260,19 +292,12 @@ with tab4:
         target = selected_corps[0]
         # 여기서는 연도 비교를 위해 전체 데이터(df)에서 해당 기업만 다시 가져오는 게 좋을 수도 있지만,
         # 사용자 요청대로 "선택된 기간" 내에서 보여줍니다.
-        target_df = filtered_df[filtered_df['corp_name'] == target].copy()
-        target_df['year_str'] = target_df['year'].astype(str)
+        figs = get_season_figures(selection, target)
         
-        if not target_df.empty:
+        if figs is not None:
             cc1, cc2 = st.columns(2)
-            with cc1:
-                fig = px.bar(target_df.sort_values(['year', 'quarter']), x='quarter', y='revenue', color='year_str', barmode='group', title="매출액")
-                fig.update_traces(texttemplate='%{y:,.0f}', textposition='outside')
-                st.plotly_chart(fig, use_container_width=True)
-            with cc2:
-                fig2 = px.bar(target_df.sort_values(['year', 'quarter']), x='quarter', y='profit', color='year_str', barmode='group', title="영업이익")
-                fig2.update_traces(texttemplate='%{y:,.0f}', textposition='outside')
-                st.plotly_chart(fig2, use_container_width=True)
+            with cc1: st.plotly_chart(figs[0], use_container_width=True)
+            with cc2: st.plotly_chart(figs[1], use_container_width=True)
         else:
             st.warning("선택된 기간에 데이터가 없습니다.")
     else:
@@ -281,18 +306,48 @@ with tab4:
 # --- Tab 5: 추세 ---
 with tab5:
     st.subheader("📈 전체 추세")
-    if not filtered_df.empty:
-        d_sum = filtered_df.groupby('period')[['revenue', 'profit']].sum().reset_index()
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            x=d_sum['period'], y=d_sum['revenue'], name='매출',
-            text=d_sum['revenue'], texttemplate='%{text:,.0f}', textposition='auto'
-        ))
-        fig.add_trace(go.Scatter(
-            x=d_sum['period'], y=d_sum['profit'], name='이익', line=dict(color='orange', width=3),
-            mode='lines+markers+text', text=d_sum['profit'], texttemplate='%{text:,.0f}', textposition='top center'
-        ))
-        st.plotly_chart(fig, use_container_width=True)
+    if kpis['rows']:
+        st.plotly_chart(get_trend_figure(selection), use_container_width=True)
+
+# --- Tab 6: 스크리닝 ---
+with tab6:
+    st.subheader("🧭 전 기업 스크리닝")
+    st.markdown("연속 성장 분기 수, 최근 4분기(TTM) 합계, 같은 분기 전 기업 대비 백분위로 기업을 고릅니다. (4Q 개별 분기 기준, 백분위는 클수록 상위)")
+    screen_periods = get_screen_periods(load_info['version'], tuple(sel_year), tuple(sel_q))
+    if screen_periods:
+        sort_options = {"매출 YoY 백분위": 'rev_yoy_pct', "이익 YoY 백분위": 'prof_yoy_pct', "TTM 매출 백분위": 'ttm_revenue_pct',
+                        "TTM 이익률 백분위": 'ttm_opm_pct', "매출 연속 성장": 'rev_streak', "이익 연속 성장": 'prof_streak'}
+        s1, s2, s3 = st.columns(3)
+        with s1: screen_period = st.selectbox("기준 분기", screen_periods, format_func=period_label)
+        with s2: min_rev_streak = st.slider("매출 연속 성장(YoY) 최소 분기", 0, 12, 2)
+        with s3: min_prof_streak = st.slider("이익 연속 성장(YoY) 최소 분기", 0, 12, 0)
+        s4, s5, s6 = st.columns(3)
+        with s4: min_ttm_revenue = st.number_input("TTM 매출 최소 (억 원)", min_value=0, value=100, step=100)
+        with s5: sort_label = st.selectbox("정렬 기준", list(sort_options))
+        with s6: screen_k = st.selectbox("표시 개수", [20, 50, 100], index=1)
+
+        screened = get_screen_result(load_info['version'], tuple(selected_corps), screen_period, min_rev_streak, min_prof_streak,
+                                     min_ttm_revenue * 100, sort_options[sort_label], screen_k)
+        if screened.empty:
+            st.warning("조건에 맞는 기업이 없습니다.")
+        else:
+            pct_cols = [c for c in screened.columns if c.endswith('_pct')]
+            styled = apply_comma_style(screened, ['revenue', 'profit', 'ttm_revenue', 'ttm_profit', 'rev_yoy', 'prof_yoy', 'ttm_opm'])
+            st.dataframe(
+                styled.format({c: "{:.0f}" for c in pct_cols}, na_rep="-"),
+                column_config={
+                    "corp_name": "기업명", "year": "연도", "quarter": "분기",
+                    "rev_streak": "매출 연속", "prof_streak": "이익 연속",
+                    "ttm_revenue": "TTM 매출", "ttm_revenue_pct": "TTM 매출 %ile", "ttm_profit": "TTM 영업이익",
+                    "ttm_opm": "TTM 이익률", "ttm_opm_pct": "TTM 이익률 %ile",
+                    "revenue": "매출액", "rev_yoy": "매출YoY", "rev_yoy_pct": "매출YoY %ile",
+                    "profit": "영업이익", "prof_yoy": "이익YoY", "prof_yoy_pct": "이익YoY %ile"
+                },
+                use_container_width=True, hide_index=True
+            )
+    else:
+        st.info("선택한 연도/분기에 스크리닝 데이터가 없습니다.")
 
 with st.sidebar:
-    st.download_button("💾 엑셀 다운로드", csv_data, "dart_analysis.csv", "text/csv")
+    # data에 함수를 넘기면 실제로 눌렀을 때만 CSV를 만듭니다.
+    st.download_button("💾 엑셀 다운로드", lambda: get_csv(selection), "dart_analysis.csv", "text/csv")
@@ -0,0 +1,200 @@
+import os
+import time
+import numpy as np
+import pandas as pd
+from storage import HAS_PYARROW, read_db, CSV_FILE
+from metrics import compute_metrics, load_metrics, save_metrics, metrics_is_fresh, METRICS_FILE
+from remote_sync import sync_remote, SNAPSHOT_DIR
+from db_store import metrics_table_is_fresh, query_metrics, metric_options
+from aggregates import DEFAULT_MIN_REVENUE
+from quarterly import QUARTERS, period_index, period_label
+from screening import compute_screening, load_screening, save_screening, SCREENING_FILE
+
+# -----------------------------------------------------------
+# 대시보드 데이터 계층 (streamlit 없이 import 가능)
+# -----------------------------------------------------------
+# dashboard.py는 여기 함수들을 st.cache_data로 감싸 화면만 그리고,
+# 벤치마크(bench/)는 같은 함수를 직접 불러 로딩·변환·필터 시간을 잽니다.
+CSV_URL = "https://raw.githubusercontent.com/YH4762/stock-bot/main/financial_db.csv"
+LOCAL_COLUMNS = ['corp_code', 'corp_name', 'year', 'quarter', '매출액', '영업이익', '순이익', '영업현금흐름']
+SNAPSHOT_METRICS = os.path.join(SNAPSHOT_DIR, METRICS_FILE)
+SNAPSHOT_SCREENING = os.path.join(SNAPSHOT_DIR, SCREENING_FILE)
+# 대시보드가 실제로 쓰는 지표 컬럼 (corp_code, cash_flow, prof_yoy는 읽지 않음)
+# 금액(백만 원)은 합계·콤마 표시에 그대로 쓰이므로 float64, 비율(%)은 소수점 한 자리 표시라 float32
+AMOUNT_COLUMNS = ['revenue', 'profit', 'net_income']
+RATIO_COLUMNS = ['opm', 'rev_qoq', 'prof_qoq', 'rev_yoy']
+VIEW_COLUMNS = ['corp_name', 'year', 'quarter'] + AMOUNT_COLUMNS + RATIO_COLUMNS
+LOAD_COLUMNS = VIEW_COLUMNS + ['variant']
+SUMMARY_COLUMNS = ['corp_name', 'year', 'quarter', 'revenue', 'rev_qoq', 'rev_yoy', 'profit', 'prof_qoq', 'opm', 'net_income']
+REV_COLUMNS = ['corp_name', 'year', 'quarter', 'revenue', 'rev_qoq']
+PROF_COLUMNS = ['corp_name', 'year', 'quarter', 'profit', 'prof_qoq']
+# 스크리닝 탭: 금액은 백만 원(float64), 비율·백분위는 float32, 연속 분기 수는 int16 그대로
+SCREEN_AMOUNT_COLUMNS = ['revenue', 'profit', 'ttm_revenue', 'ttm_profit']
+SCREEN_RATIO_COLUMNS = ['rev_yoy', 'prof_yoy', 'ttm_opm', 'rev_yoy_pct', 'prof_yoy_pct', 'ttm_revenue_pct', 'ttm_opm_pct']
+SCREEN_COLUMNS = ['corp_name', 'year', 'quarter', 'rev_streak', 'prof_streak', 'ttm_revenue', 'ttm_revenue_pct',
+                  'ttm_profit', 'ttm_opm', 'ttm_opm_pct', 'revenue', 'rev_yoy', 'rev_yoy_pct', 'profit', 'prof_yoy', 'prof_yoy_pct']
+
+# [함수] 큰 숫자 포맷팅
+def format_big_number(value):
+    if pd.isna(value) or value == 0: return "-"
+    val = float(value)
+    if abs(val) >= 1000000: return f"{val/1000000:,.1f}조"
+    elif abs(val) >= 100:   return f"{val/100:,.1f}억"
+    else: return f"{val:,.0f}백만"
+
+def save_derived(save, table, csv_path, path):
+    # 파생 테이블 저장 (pyarrow가 없거나 쓸 수 없는 배포 환경이면 저장 없이 계속, 다음 로딩 때 다시 계산)
+    if not HAS_PYARROW: return
+    try:
+        save(table, csv_path=csv_path, path=path)
+    except OSError as e:
+        print(f"⚠️ {path} 저장 실패, 저장 없이 계속합니다: {e}")
+
+def read_metrics(path, columns=LOAD_COLUMNS):
+    # 로컬 CSV: main.py가 미리 계산해 둔 지표 테이블 → 없으면 (Parquet 사본 또는 CSV에서) 계산해 저장
+    #   지표 Parquet는 수집 때마다 통째로 바뀌어 저장소에 커밋하지 않으므로, 배포된 대시보드는 첫 로딩에 만듭니다.
+    # 원격 사본: 사본 기준 지표 테이블이 있으면 읽고, 없으면 한 번 계산해 저장 (재시작 시 재사용)
+    if path == CSV_FILE:
+        if metrics_is_fresh(CSV_FILE): return load_metrics(columns=columns)
+        df = compute_metrics(read_db(columns=LOCAL_COLUMNS, source=CSV_FILE))
+        save_derived(save_metrics, df, CSV_FILE, METRICS_FILE)
+        return df
+    if metrics_is_fresh(path, SNAPSHOT_METRICS): return load_metrics(SNAPSHOT_METRICS, columns=columns)
+    df = compute_metrics(read_db(columns=LOCAL_COLUMNS, source=path))
+    save_derived(save_metrics, df, path, SNAPSHOT_METRICS)
+    return df
+
+def read_screening(path):
+    # 로컬 CSV: main.py가 만든 스크리닝 테이블 → 없거나 오래됐으면 지표에서 계산해 저장
+    # 원격 사본: 사본 기준 스크리닝 테이블이 있으면 읽고, 없으면 한 번 계산해 저장
+    if path == CSV_FILE:
+        if metrics_is_fresh(CSV_FILE, SCREENING_FILE): return load_screening()
+        table = compute_screening(read_metrics(path, columns=None))
+        save_derived(save_screening, table, CSV_FILE, SCREENING_FILE)
+        return table
+    if metrics_is_fresh(path, SNAPSHOT_SCREENING): return load_screening(SNAPSHOT_SCREENING)
+    table = compute_screening(read_metrics(path, columns=None))
+    save_derived(save_screening, table, path, SNAPSHOT_SCREENING)
+    return table
+
+def sorted_category(values):
+    # 기업명 등 반복 문자열 → category (카테고리를 가나다순으로 두어 정렬 결과가 문자열 정렬과 같게)
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype(str).astype('category')
+    values = values.cat.remove_unused_categories()
+    return values.cat.reorder_categories(sorted(values.cat.categories))
+
+def prepare(df):
+    # 대시보드용 축소 프레임: 필요한 컬럼만, 작은 dtype으로 (백만 원 단위, 기업명·연도·분기 정렬)
+    # period는 '2024-1Q' 문자열 대신 분기 번호(int32, 연도×4+분기)로 두고 화면에 그릴 때만 라벨로 바꿉니다.
+    out = pd.DataFrame({'corp_name': sorted_category(df['corp_name']),
+                        'year': df['year'].astype(np.int16),
+                        'quarter': pd.Categorical(df['quarter'], categories=QUARTERS, ordered=True)}, index=df.index)
+    if 'variant' in df.columns:
+        out['variant'] = df['variant'].astype('category')
+    for col in AMOUNT_COLUMNS:
+        out[col] = df[col] / 1000000
+    for col in RATIO_COLUMNS:
+        out[col] = df[col].astype(np.float32)
+    out['period'] = period_index(out['year'], out['quarter']).astype(np.int32)
+    return out.sort_values(['corp_name', 'year', 'quarter']).reset_index(drop=True)
+
+def prepare_screening(table):
+    # 스크리닝 탭용 축소 프레임 (prepare와 같은 규칙, corp_code는 쓰지 않음)
+    out = pd.DataFrame({'corp_name': sorted_category(table['corp_name']),
+                        'year': table['year'].astype(np.int16),
+                        'quarter': pd.Categorical(table['quarter'].astype(str), categories=QUARTERS, ordered=True)},
+                       index=table.index)
+    for col in SCREEN_AMOUNT_COLUMNS:
+        out[col] = table[col] / 1000000
+    for col in SCREEN_RATIO_COLUMNS:
+        out[col] = table[col].astype(np.float32)
+    for col in ['rev_streak', 'prof_streak']:
+        out[col] = table[col].astype(np.int16)
+    out['period'] = period_index(out['year'], out['quarter']).astype(np.int32)
+    return out.reset_index(drop=True)
+
+def frame_mb(df):
+    return df.memory_usage(deep=True).sum() / 1e6
+
+def local_info():
+    # 원격 확인 없이 로컬 CSV만 쓸 때의 로딩 정보 (sync_remote 반환값과 같은 키)
+    path = CSV_FILE if os.path.exists(CSV_FILE) else None
+    return {'status': 'local', 'path': path, 'fetch_sec': 0.0, 'parse_sec': 0.0, 'bytes': 0,
+            'error': None if path else f"{CSV_FILE} 없음"}
+
+def load_dataset(url=CSV_URL):
+    # 로컬 파일을 먼저 쓰고, 원격은 ETag/If-Modified-Since로 확인해 바뀐 경우에만 내려받습니다. (url=None이면 로컬만)
+    # 원격 장애 시에는 마지막 정상 사본(없으면 로컬 CSV)으로 계속 보여줍니다.
+    # 로컬 SQLite 지표 사본(main.py가 생성)이 최신이면 전체를 읽지 않고, 선택값마다 SQL로 조회합니다.
+    # 반환: (지표 DataFrame 또는 None(SQL 조회), 로딩 정보: 상태/소요 시간/에러)
+    info = sync_remote(url) if url else local_info()
+    info['use_sql'] = False
+    if info['path'] is None: return pd.DataFrame(), info
+    info['version'] = f"{info['path']}:{os.path.getsize(info['path'])}:{os.path.getmtime(info['path'])}"
+    t0 = time.perf_counter()
+    if info['path'] == CSV_FILE and metrics_table_is_fresh(CSV_FILE):
+        info['use_sql'] = True
+        info['load_sec'] = 0.0
+        return None, info
+    try:
+        df = read_metrics(info['path'])
+    except (OSError, ValueError, KeyError) as e:
+        info['error'] = f"{type(e).__name__}: {e}"
+        return pd.DataFrame(), info
+    df = prepare(df)
+    info['load_sec'] = time.perf_counter() - t0
+    info['memory_mb'] = frame_mb(df)
+    print(f"📥 데이터 로딩: {info['status']} ({info['path']}) 확인 {info['fetch_sec']:.2f}s / 검증 {info['parse_sec']:.2f}s / 지표 {info['load_sec']:.2f}s"
+          f" / {len(df):,}행 {info['memory_mb']:.1f}MB")
+    return df, info
+
+def data_options(df, info):
+    # 사이드바 선택지: (기업명, 연도(최신순), 분기)
+    if info['use_sql']: return metric_options()
+    if df.empty: return [], [], []
+    return (sorted(df['corp_name'].unique()), sorted((int(y) for y in df['year'].unique()), reverse=True),
+            sorted(df['quarter'].unique()))
+
+def variant_name(use_iso_4q):
+    return 'iso4q' if use_iso_4q else 'raw'
+
+def select_variant(df, use_iso_4q):
+    # 4Q 개별 분기 값과 그 기준의 OPM/QoQ/YoY는 지표 테이블에 미리 계산되어 있습니다.
+    return df[df['variant'] == variant_name(use_iso_4q)].drop(columns='variant')
+
+def filter_frame(df, corps=None, years=None, quarters=None):
+    # 빈 선택 = 전체. 조건을 하나의 마스크로 모아 한 번만 자릅니다.
+    mask = pd.Series(True, index=df.index)
+    if corps: mask &= df['corp_name'].isin(corps)
+    if years: mask &= df['year'].isin(years)
+    if quarters: mask &= df['quarter'].isin(quarters)
+    return df[mask]
+
+def query_filtered(use_iso_4q, corps=None, years=None, quarters=None):
+    # 선택 조건을 WHERE 절로 내려 필요한 행만 읽음 (인덱스: variant+year+quarter, variant+corp_name)
+    return prepare(query_metrics(variant_name(use_iso_4q), corps, years, quarters, columns=VIEW_COLUMNS))
+
+def summary_table(df):
+    return df[[c for c in SUMMARY_COLUMNS if c in df.columns]].sort_values(['revenue'], ascending=False)
+
+def top_growth(df, k=20):
+    # 노이즈 제거: 매출 100억 이상 (기업 필터가 걸린 선택용, 전체 선택은 PeriodIndex.top 사용)
+    growth_df = df[df['revenue'] > DEFAULT_MIN_REVENUE]
+    return growth_df.nlargest(k, 'rev_qoq')[REV_COLUMNS], growth_df.nlargest(k, 'prof_qoq')[PROF_COLUMNS]
+
+def period_trend(df):
+    d_sum = df.groupby('period')[['revenue', 'profit']].sum()
+    return d_sum.assign(period=period_label(d_sum.index)).reset_index(drop=True)[['period', 'revenue', 'profit']]
+
+def summary_kpis(df):
+    # 상단 지표 카드용 (선택 행 전체 대신 숫자 몇 개만 세션에 들고 있음)
+    return {'rows': len(df), 'revenue': df['revenue'].sum(), 'profit': df['profit'].sum(),
+            'opm': float(df['opm'].mean()) if len(df) else float('nan'), 'corps': df['corp_name'].nunique()}
+
+def display_frame(df):
+    # 차트/다운로드용: 분기 번호 → '2024-1Q' 라벨, category → 문자열 (몇 행 안 되는 결과에만 사용)
+    out = df.astype({col: str for col in ['corp_name', 'quarter'] if col in df.columns})
+    if 'period' in out.columns:
+        out['period'] = period_label(out['period'])
+    return out
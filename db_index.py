@@ -0,0 +1,50 @@
+import os
+from storage import read_db, file_digest
+
+# -----------------------------------------------------------
+# financial_db.csv 중복 체크용 키 인덱스
+# -----------------------------------------------------------
+# 키: (corp_code 8자리 문자열, year int, quarter 문자열)
+# 사이드카 파일(financial_db.keys.txt)의 첫 줄에 CSV 내용 해시를 기록해 두고,
+# 해시가 같으면 CSV 전체를 파싱하지 않고 인덱스만 읽어옵니다.
+# 한 줄에 키 하나씩 정렬해서 저장하므로 git diff에는 새 키만 추가됩니다.
+KEY_COLUMNS = ['corp_code', 'year', 'quarter']
+
+def normalize_code(corp_code):
+    # pandas가 corp_code를 숫자로 읽으면 앞자리 0이 사라지므로 8자리로 복원
+    return str(corp_code).strip().split('.')[0].zfill(8)
+
+def make_key(corp_code, year, quarter):
+    return (normalize_code(corp_code), int(year), str(quarter))
+
+def index_path_for(csv_path):
+    return os.path.splitext(csv_path)[0] + '.keys.txt'
+
+def build_key_index(csv_path):
+    if not os.path.exists(csv_path):
+        return set()
+    df = read_db(columns=KEY_COLUMNS, source=csv_path)
+    return set(zip(df['corp_code'], df['year'].tolist(), df['quarter'].astype(str)))
+
+def load_key_index(csv_path):
+    path = index_path_for(csv_path)
+    if os.path.exists(csv_path) and os.path.exists(path):
+        try:
+            with open(path, encoding='utf-8') as f:
+                csv_sha256 = f.readline().split('=', 1)[1].strip()
+                if csv_sha256 == file_digest(csv_path):
+                    rows = f.read().split()
+                    return {(code, int(year), quarter) for code, year, quarter in (r.split(',') for r in rows)}
+            print("ℹ️ 키 인덱스가 CSV와 달라 다시 생성합니다.")
+        except (OSError, ValueError, IndexError) as e:
+            print(f"⚠️ 키 인덱스 로딩 실패, 다시 생성합니다: {e}")
+    return build_key_index(csv_path)
+
+def save_key_index(keys, csv_path):
+    path = index_path_for(csv_path)
+    csv_sha256 = file_digest(csv_path) or ''
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(f"# csv_sha256={csv_sha256}\n")
+        f.writelines(f"{code},{year},{quarter}\n" for code, year, quarter in sorted(keys))
+    os.replace(tmp_path, path)
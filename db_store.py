@@ -0,0 +1,183 @@
+import os
+import sqlite3
+import pandas as pd
+
+from storage import CSV_FILE, DB_COLUMNS, AMOUNT_COLUMNS, read_csv_db, file_digest
+from db_index import normalize_code
+from metrics import METRIC_COLUMNS
+
+# -----------------------------------------------------------
+# SQLite 저장소 (기본키 upsert + 인덱스, 대시보드 SQL 조회)
+# -----------------------------------------------------------
+# financial_db.sqlite는 gitignore 대상이고 언제든 CSV에서 다시 만들 수 있습니다.
+# main.py는 여기에 upsert(정정공시는 기존 행 교체)한 뒤, 저장소용 CSV를
+# (corp_code, year, quarter) 순서로 통째로 내보냅니다. 같은 데이터면 항상 같은 파일이 나옵니다.
+# meta 테이블에 마지막으로 맞춘 CSV 내용 해시를 기록해 두고, 다르면 CSV에서 다시 만듭니다.
+DB_FILE = 'financial_db.sqlite'
+
+METRIC_TEXT_COLUMNS = ['corp_code', 'corp_name', 'quarter', 'variant']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS financial (
+    corp_code TEXT NOT NULL,
+    corp_name TEXT,
+    year INTEGER NOT NULL,
+    quarter TEXT NOT NULL,
+    "매출액" REAL, "영업이익" REAL, "순이익" REAL, "영업현금흐름" REAL, "수주잔고" REAL, "수주잔고_증감" REAL,
+    PRIMARY KEY (corp_code, year, quarter)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_financial_name ON financial(corp_name);
+CREATE INDEX IF NOT EXISTS idx_financial_period ON financial(year, quarter);
+
+CREATE TABLE IF NOT EXISTS metrics (
+    corp_code TEXT NOT NULL,
+    corp_name TEXT,
+    year INTEGER NOT NULL,
+    quarter TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    revenue REAL, profit REAL, net_income REAL, cash_flow REAL,
+    opm REAL, rev_qoq REAL, prof_qoq REAL, rev_yoy REAL, prof_yoy REAL,
+    PRIMARY KEY (variant, corp_code, year, quarter)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_metrics_period ON metrics(variant, year, quarter);
+CREATE INDEX IF NOT EXISTS idx_metrics_name ON metrics(variant, corp_name);
+
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+def quote(col):
+    return '"' + col + '"'
+
+# 기존 키는 넘어온 값으로 교체하되, 값이 없는(NULL) 컬럼은 기존 값을 유지합니다.
+# (main.py는 매출액/영업이익/순이익만 넘기므로 영업현금흐름/수주잔고 등이 정정공시 upsert로 지워지지 않게)
+UPSERT_SQL = (
+    f"INSERT INTO financial ({', '.join(quote(c) for c in DB_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in DB_COLUMNS)}) "
+    f"ON CONFLICT(corp_code, year, quarter) DO UPDATE SET "
+    + ', '.join(f"{quote(c)} = COALESCE(excluded.{quote(c)}, financial.{quote(c)})" for c in DB_COLUMNS if c not in ('corp_code', 'year', 'quarter'))
+)
+
+def connect(path=DB_FILE):
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+def connect_readonly(path=DB_FILE):
+    # 대시보드 조회용 (파일을 새로 만들거나 스키마를 바꾸지 않음)
+    return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+def get_meta(conn, key):
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+def set_meta(conn, key, value):
+    conn.execute("INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                 (key, str(value)))
+
+def csv_digest(csv_path):
+    return file_digest(csv_path) or ''
+
+def to_records(df):
+    # NaN → NULL, corp_code 8자리, year int
+    df = df.reindex(columns=DB_COLUMNS)
+    df['corp_code'] = df['corp_code'].map(normalize_code)
+    df['year'] = df['year'].astype('int64')
+    for col in AMOUNT_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    df = df.astype(object).where(df.notna(), None)
+    return list(df.itertuples(index=False, name=None))
+
+def upsert_rows(conn, rows):
+    # rows: dict 목록 또는 DataFrame. 한 트랜잭션으로 넣고, 기존 키는 넘어온 값만 교체
+    df = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame(rows)
+    if df.empty:
+        return 0
+    with conn:
+        conn.executemany(UPSERT_SQL, to_records(df))
+    return len(df)
+
+def rebuild_from_csv(conn, csv_path=CSV_FILE):
+    with conn:
+        conn.execute("DELETE FROM financial")
+        if os.path.exists(csv_path):
+            conn.executemany(UPSERT_SQL, to_records(read_csv_db(csv_path)))
+        set_meta(conn, 'csv_sha256', csv_digest(csv_path))
+
+def store_is_fresh(conn, csv_path=CSV_FILE):
+    return get_meta(conn, 'csv_sha256') == csv_digest(csv_path)
+
+def open_store(csv_path=CSV_FILE, path=DB_FILE):
+    # main.py 시작 시 호출: 없거나 CSV와 어긋나 있으면 CSV에서 다시 만듭니다.
+    conn = connect(path)
+    if not store_is_fresh(conn, csv_path):
+        print("🗄️ SQLite 저장소를 CSV에서 다시 만듭니다.")
+        rebuild_from_csv(conn, csv_path)
+    return conn
+
+def export_csv(conn, csv_path=CSV_FILE):
+    # 정렬된 전체 내보내기 (임시 파일에 쓰고 교체)
+    df = pd.read_sql_query(
+        f"SELECT {', '.join(quote(c) for c in DB_COLUMNS)} FROM financial ORDER BY corp_code, year, quarter", conn)
+    tmp_path = csv_path + '.tmp'
+    df.to_csv(tmp_path, index=False, encoding='utf-8-sig', lineterminator='\n')
+    os.replace(tmp_path, csv_path)
+    with conn:
+        set_meta(conn, 'csv_sha256', csv_digest(csv_path))
+    return len(df)
+
+# -----------------------------------------------------------
+# 파생 지표 (대시보드 조회용 사본)
+# -----------------------------------------------------------
+def write_metrics(conn, metrics, csv_path=CSV_FILE):
+    df = metrics.reindex(columns=METRIC_COLUMNS)
+    df = df.astype({col: str for col in METRIC_TEXT_COLUMNS}).astype({'year': 'int64'})
+    df = df.astype(object).where(df.notna(), None)
+    with conn:
+        conn.execute("DELETE FROM metrics")
+        conn.executemany(
+            f"INSERT INTO metrics ({', '.join(METRIC_COLUMNS)}) VALUES ({', '.join('?' for _ in METRIC_COLUMNS)})",
+            df.itertuples(index=False, name=None))
+        set_meta(conn, 'metrics_csv_sha256', csv_digest(csv_path))
+    return len(df)
+
+def metrics_table_is_fresh(csv_path=CSV_FILE, path=DB_FILE):
+    if not (os.path.exists(path) and os.path.exists(csv_path)):
+        return False
+    try:
+        conn = connect_readonly(path)
+        try:
+            return get_meta(conn, 'metrics_csv_sha256') == csv_digest(csv_path)
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return False
+
+def in_clause(col, values, params):
+    params.extend(values)
+    return f"{col} IN ({', '.join('?' for _ in values)})"
+
+def query_metrics(variant, corps=None, years=None, quarters=None, columns=None, path=DB_FILE):
+    # 사이드바 필터를 WHERE 절로 내려서 필요한 행만 읽습니다. (빈 선택 = 전체)
+    params = [variant]
+    where = ["variant = ?"]
+    if corps: where.append(in_clause('corp_name', list(corps), params))
+    if years: where.append(in_clause('year', [int(y) for y in years], params))
+    if quarters: where.append(in_clause('quarter', list(quarters), params))
+    select = ', '.join(columns or [c for c in METRIC_COLUMNS if c != 'variant'])
+    conn = connect_readonly(path)
+    try:
+        return pd.read_sql_query(f"SELECT {select} FROM metrics WHERE {' AND '.join(where)}", conn, params=params)
+    finally:
+        conn.close()
+
+def metric_options(path=DB_FILE):
+    # 사이드바 선택지 (기업명, 연도, 분기)
+    conn = connect_readonly(path)
+    try:
+        corps = [r[0] for r in conn.execute("SELECT DISTINCT corp_name FROM metrics WHERE variant = 'raw' ORDER BY corp_name")]
+        years = [r[0] for r in conn.execute("SELECT DISTINCT year FROM metrics WHERE variant = 'raw' ORDER BY year DESC")]
+        quarters = [r[0] for r in conn.execute("SELECT DISTINCT quarter FROM metrics WHERE variant = 'raw' ORDER BY quarter")]
+    finally:
+        conn.close()
+    return corps, years, quarters
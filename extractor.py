@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+# -----------------------------------------------------------
+# finstate 프레임에서 주요 계정 금액 추출 (벡터화)
+# -----------------------------------------------------------
+# DART 계정명 -> financial_db.csv 컬럼명
+# 계정을 늘리려면 여기에 추가하면 됩니다. (예: finstate_all 기준 '영업활동현금흐름': '영업현금흐름')
+ACCOUNTS = {'매출액': '매출액', '영업이익': '영업이익', '당기순이익': '순이익'}
+
+# 연결(CFS)을 우선, 없으면 별도(OFS)
+FS_PRIORITY = {'CFS': 0, 'OFS': 1}
+FS_COLUMNS = ['account_nm', 'fs_div', 'thstrm_amount', 'frmtrm_amount']
+RESULT_COLUMNS = ['key', 'account_nm', 'column', 'thstrm', 'frmtrm']
+
+def parse_amounts(values):
+    # "1,234" / "(1,234)" / "-" 같은 문자열을 int64로 (해석 불가 값은 0)
+    s = pd.Series(values).astype(str)
+    s = s.str.replace(',', '', regex=False).str.replace('(', '-', regex=False).str.replace(')', '', regex=False).str.strip()
+    return pd.to_numeric(s, errors='coerce').fillna(0).astype('int64')
+
+def extract_batch(frames, accounts=ACCOUNTS):
+    # frames: {key: finstate DataFrame}. 결과는 key/계정 순서대로 정렬된 long 형식 DataFrame
+    keys = [k for k, fs in frames.items() if fs is not None and not fs.empty]
+    if not keys:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+
+    # 프레임별 pandas 연산 대신 필요한 4개 컬럼만 numpy로 모아 한 번에 처리
+    columns = {col: np.concatenate([frames[k][col].to_numpy(dtype=object) for k in keys]) for col in FS_COLUMNS}
+    pos = np.repeat(np.arange(len(keys)), [len(frames[k]) for k in keys])
+
+    account_order = {name: i for i, name in enumerate(accounts)}
+    order = pd.Series(columns['account_nm']).map(account_order).to_numpy()
+    priority = pd.Series(columns['fs_div']).map(FS_PRIORITY).to_numpy()
+    rows = np.flatnonzero(~(np.isnan(order) | np.isnan(priority)))
+    if rows.size == 0:
+        # 어느 보고서에도 대상 계정이 없음 (예: 자산총계만 있는 finstate) → 저장할 값 없음
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+
+    # (보고서, 계정) 슬롯별로 CFS → OFS 순으로 정렬한 뒤 슬롯의 첫 행만 선택
+    slot = pos[rows] * len(accounts) + order[rows].astype(np.int64)
+    rows = rows[np.lexsort((priority[rows], slot))]
+    slot = pos[rows] * len(accounts) + order[rows].astype(np.int64)
+    rows = rows[np.r_[True, slot[1:] != slot[:-1]]]
+
+    amounts = parse_amounts(np.concatenate([columns['thstrm_amount'][rows], columns['frmtrm_amount'][rows]])).to_numpy()
+    account_nm = columns['account_nm'][rows]
+    return pd.DataFrame({
+        'key': [keys[p] for p in pos[rows]],
+        'account_nm': account_nm,
+        'column': [accounts[name] for name in account_nm],
+        'thstrm': amounts[:len(rows)],
+        'frmtrm': amounts[len(rows):],
+    }, columns=RESULT_COLUMNS)
@@ -0,0 +1,106 @@
+import os
+import time
+import pickle
+import threading
+from collections import OrderedDict
+
+# -----------------------------------------------------------
+# dart.finstate 결과 캐시 (메모리 LRU + 디스크, TTL)
+# -----------------------------------------------------------
+# (corp_code, year) 단위로 결과를 보관합니다. 결과가 None(데이터 없음)이면 같은 실행 안에서만
+# 메모리에 기억하고 디스크에는 남기지 않습니다. (DART 반영이 늦은 공시를 다음 실행에서 다시 조회)
+# 정정공시는 refresh=True로 캐시를 건너뛰고 새로 조회한 값으로 캐시를 덮어씁니다.
+DEFAULT_CACHE_DIR = os.path.join('.cache', 'finstate')
+DEFAULT_TTL = 12 * 3600
+DEFAULT_MAX_ITEMS = 512
+
+class CachedDart:
+    def __init__(self, dart, cache_dir=DEFAULT_CACHE_DIR, ttl=DEFAULT_TTL, max_items=DEFAULT_MAX_ITEMS):
+        self.dart = dart
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_items = max_items
+        self.memory = OrderedDict()  # key -> (저장 시각, fs)
+        self.lock = threading.Lock()
+        self.key_locks = {}
+        self.hits = 0
+        self.misses = 0
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def __getattr__(self, name):
+        # list() 등 나머지 메서드는 원본 dart 객체로 그대로 전달
+        return getattr(self.dart, name)
+
+    def cached(self, corp_code, year):
+        # API를 부르지 않고 캐시만 확인 (반환: (있음 여부, fs)). 속도 제한 토큰은 캐시에 없을 때만 쓰도록
+        found, fs = self._get((str(corp_code).zfill(8), int(year)))
+        if found:
+            with self.lock:
+                self.hits += 1
+        return found, fs
+
+    def finstate(self, corp_code, year, refresh=False):
+        key = (str(corp_code).zfill(8), int(year))
+        # 같은 키를 여러 스레드가 동시에 요청하면 한 번만 조회
+        with self.lock:
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            found, fs = (False, None) if refresh else self._get(key)
+            if found:
+                with self.lock:
+                    self.hits += 1
+                return fs
+            fs = self.dart.finstate(corp_code, year)
+            with self.lock:
+                self.misses += 1
+            self._put(key, fs)
+            return fs
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key[0]}_{key[1]}.pkl")
+
+    def _get(self, key):
+        now = time.time()
+        with self.lock:
+            if key in self.memory:
+                saved_at, fs = self.memory[key]
+                if now - saved_at <= self.ttl:
+                    self.memory.move_to_end(key)
+                    return True, fs
+                del self.memory[key]
+        if not self.cache_dir:
+            return False, None
+        path = self._path(key)
+        try:
+            if now - os.path.getmtime(path) > self.ttl:
+                return False, None
+            with open(path, 'rb') as f:
+                fs = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return False, None
+        self._remember(key, os.path.getmtime(path), fs)
+        return True, fs
+
+    def _put(self, key, fs):
+        self._remember(key, time.time(), fs)
+        if not self.cache_dir or fs is None:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(fs, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ finstate 캐시 저장 실패 ({key[0]}, {key[1]}): {e}")
+
+    def _remember(self, key, saved_at, fs):
+        with self.lock:
+            self.memory[key] = (saved_at, fs)
+            self.memory.move_to_end(key)
+            while len(self.memory) > self.max_items:
+                self.memory.popitem(last=False)
@@ -1,54 +1,53 @@
-import OpenDartReader
-import pandas as pd
 import os
+import sys
+import argparse
 import requests
-import time
 from datetime import datetime
 import re
+from db_index import load_key_index, save_key_index, make_key
+from dart_fetch import fetch_all, call_with_retry
+from finstate_cache import CachedDart, DEFAULT_CACHE_DIR, DEFAULT_TTL
+from extractor import extract_batch
+from storage import HAS_PYARROW, sync_columnar, columnar_is_fresh, CSV_FILE, COLUMNAR_DIR
+from metrics import refresh_metrics, metrics_is_fresh, load_metrics, METRICS_FILE
+from screening import refresh_screening, SCREENING_FILE
+from db_store import open_store, upsert_rows, export_csv, write_metrics, metrics_table_is_fresh, DB_FILE
+from backfill import iter_windows, load_checkpoint, save_checkpoint, clear_checkpoint, DEFAULT_WINDOW_DAYS, DEFAULT_CHECKPOINT
+from notifier import SlackNotifier, DEFAULT_DIGEST_SIZE, DEFAULT_FLUSH_INTERVAL
+from watermark import load_watermark, save_watermark, catchup_start, load_receipts, save_receipts, load_pending, save_pending, settle_pending, DEFAULT_MAX_CATCHUP_DAYS, DEFAULT_MAX_MISSING_ATTEMPTS
+from perf import PerfRecorder, RunProfiler, path_size, DEFAULT_REPORT
 
 # -----------------------------------------------------------
-# 1. 설정 및 초기화
+# 1. 설정
 # -----------------------------------------------------------
-print("🚀 [데일리 모드] 시스템 가동 시작...")
+# 인자 없이 실행하면 데일리 모드(워터마크 날짜 ~ 오늘), --start/--end를 주면 기간 백필 모드
+# import해도 아무것도 실행되지 않습니다. (벤치마크는 main(argv, dart=가짜 DART)로 수집 루프를 돌림)
+def positive_int(value):
+    # argparse 타입: 1 이상 정수만 허용
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {value}")
+    return number
 
-DART_API_KEY = os.environ.get('DART_API_KEY')
-SLACK_WEBHOOK_URL = os.environ.get('SLACK_WEBHOOK_URL')
+def build_parser():
+    parser = argparse.ArgumentParser(description="DART 실적 공시 수집")
+    parser.add_argument('--start', help="백필 시작일 (YYYYMMDD)")
+    parser.add_argument('--end', help="백필 종료일 (YYYYMMDD, 기본: 오늘)")
+    parser.add_argument('--window-days', type=positive_int, default=DEFAULT_WINDOW_DAYS, help="dart.list 한 번에 조회할 일수")
+    parser.add_argument('--batch-size', type=int, default=50, help="CSV에 한 번에 추가할 기업 수")
+    parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT, help="백필 진행 상황 파일")
+    parser.add_argument('--no-resume', action='store_true', help="체크포인트를 무시하고 처음부터 백필")
+    parser.add_argument('--profile', nargs='?', const='cprofile', choices=['cprofile', 'pyinstrument'],
+                        help="프로파일러로 실행 (run_profile.prof / run_profile.html 저장)")
+    parser.add_argument('--skip-derived', action='store_true',
+                        help="대시보드용 사본(Parquet/지표/스크리닝 테이블, SQLite 지표)을 만들지 않음 (GitHub Actions용)")
+    return parser
 
-# 슬랙 전송 함수 (결과 로그 확인 기능 보강)
-def send_slack(msg):
-    if SLACK_WEBHOOK_URL:
-        try:
-            print(f"🔔 슬랙 전송 시도: {msg[:30]}...")
-            response = requests.post(SLACK_WEBHOOK_URL, json={"text": msg})
-            # 슬랙 서버 응답 결과 출력 (성공 시 200 ok)
-            if response.status_code == 200:
-                print(f"✅ 슬랙 전송 성공! (상태 코드: {response.status_code})")
-            else:
-                print(f"⚠️ 슬랙 전송 응답 이상: {response.status_code}, {response.text}")
-        except Exception as e:
-            print(f"❌ 슬랙 전송 중 물리적 에러 발생: {e}")
-    else:
-        print("⚠️ SLACK_WEBHOOK_URL 설정이 없어 알림을 건너뜁니다.")
-
-if DART_API_KEY is None:
-    print("❌ [오류] API 키가 없습니다.")
-    exit(1)
-
-try:
-    dart = OpenDartReader(DART_API_KEY.strip())
-except Exception as e:
-    print(f"❌ [오류] DART 연결 실패: {e}")
-    exit(1)
+FILE_NAME = CSV_FILE
 
 # -----------------------------------------------------------
 # 2. 유틸리티 함수
 # -----------------------------------------------------------
-def str_to_int(text):
-    try:
-        return int(str(text).replace(",", "").replace("(", "-").replace(")", "").strip())
-    except:
-        return 0
-
 def format_diff(val):
     return f"(+{val:,})" if val > 0 else f"({val:,})" if val < 0 else "(-)"
 
@@ -57,115 +56,344 @@ def get_period_from_name(report_nm):
     elif "반기" in report_nm: return "2Q"
     elif "3분기" in report_nm: return "3Q"
     elif "사업보고서" in report_nm: return "4Q"
+    # "분기보고서 (2025.03)"처럼 분기 번호가 없으면 결산월로 판단
+    month_match = re.search(r'\(\d{4}\.(\d{2})\)', report_nm)
+    if "분기" in report_nm and month_match:
+        return {'03': '1Q', '09': '3Q'}.get(month_match.group(1))
     return None
 
+def get_year(report_nm, quarter, rcept_dt):
+    year_match = re.search(r'\((\d{4})\.', report_nm)
+    if year_match:
+        return int(year_match.group(1))
+    # 보고서명에 연도가 없으면 접수일 기준 (사업보고서는 1~3월 접수분이 전년도)
+    try:
+        filed = datetime.strptime(str(rcept_dt), '%Y%m%d')
+    except ValueError:
+        filed = datetime.now()
+    year = filed.year
+    if quarter == '4Q' and filed.month <= 3:
+        year -= 1
+    return year
+
 # -----------------------------------------------------------
-# 3. 오늘의 공시 리스트 조회 (데일리 모드로 원복)
+# 3. 공시 리스트 조회 및 조회 대상 만들기
 # -----------------------------------------------------------
-# 실행 시점의 '오늘' 날짜를 자동으로 가져옵니다.
-today_str = datetime.now().strftime('%Y%m%d')
-print(f"📅 검색 일자: {today_str}")
-
-try:
-    # 정기공시(kind='A') 조회 (시작과 끝을 오늘로 설정)
-    report_list = dart.list(start=today_str, end=today_str, kind='A') 
-    
+def list_reports(dart, start, end):
+    # 정기공시(kind='A') 중 상장사 실적 보고서만
+    report_list = call_with_retry(lambda: dart.list(start=start, end=end, kind='A'))
     if report_list is None or report_list.empty:
-        print(f"💤 {today_str}일자 실적 공시가 없습니다. 작업을 종료합니다.")
-        exit(0)
-
-    target_reports = report_list[
-        (report_list['stock_code'].notnull()) & 
+        return None
+    return report_list[
+        (report_list['stock_code'].notnull()) &
         (report_list['report_nm'].str.contains('보고서|실적', na=False))
     ]
-    
-    count = len(target_reports)
-    if count == 0:
-        print(f"💤 분석할 실적 보고서가 없습니다.")
-        exit(0)
 
-    print(f"🔎 총 {count}건의 공시 분석 시작")
+def build_jobs(target_reports, existing_keys):
+    # 중복은 API 호출 전에 걸러냄 (정정공시는 이미 있어도 다시 받아서 덮어씀)
+    jobs = []
+    for idx, row in target_reports.iterrows():
+        corp_name = row['corp_name']
+        corp_code = row['corp_code']
+        report_nm = row['report_nm']
+
+        quarter = get_period_from_name(report_nm)
+        if not quarter: continue
+        year = get_year(report_nm, quarter, row.get('rcept_dt'))
 
-except Exception as e:
-    print(f"❌ 공시 조회 중 오류: {e}")
-    exit(1)
+        key = make_key(corp_code, year, quarter)
+        amended = '정정' in report_nm
+        if key in existing_keys and not amended:
+            print(f"   ⚠️ [Skip] {corp_name} {year} {quarter} 이미 존재함")
+            continue
+
+        jobs.append({'corp_code': corp_code, 'corp_name': corp_name, 'year': year, 'quarter': quarter, 'key': key,
+                     'amended': amended, 'rcept_no': str(row.get('rcept_no'))})
+    return jobs
 
 # -----------------------------------------------------------
-# 4. 상세 분석 및 데이터 저장
+# 4. 실행 (데일리: 워터마크 ~ 오늘 / 백필: 구간별로 나눠 처리 + 체크포인트)
 # -----------------------------------------------------------
-FILE_NAME = 'financial_db.csv'
-success_count = 0
-error_count = 0
-
-for idx, row in target_reports.iterrows():
-    corp_name = row['corp_name']
-    corp_code = row['corp_code']
-    report_nm = row['report_nm']
-    
-    quarter = get_period_from_name(report_nm)
-    if not quarter: continue
+def main(argv=None, dart=None):
+    # argv: 명령행 인자 (None이면 sys.argv), dart: OpenDartReader 대신 쓸 객체 (벤치마크용 가짜 DART)
+    # 반환: 종료 코드 (0 정상, 1 설정/조회 오류). 실행 리포트는 run_report.json에 남습니다.
+    args = build_parser().parse_args(argv)
 
-    year_match = re.search(r'\((\d{4})\.', report_nm)
-    if year_match:
-        year = int(year_match.group(1))
-    else:
-        current_month = datetime.now().month
-        year = datetime.now().year
-        if quarter == '4Q' and current_month <= 3:
-            year -= 1
+    # 실행 계측: 단계별 시간(p50/p95/max), API 호출 수, 읽기/쓰기 바이트 → run_report.json
+    perf = PerfRecorder()
+    report_path = os.environ.get('RUN_REPORT_PATH', DEFAULT_REPORT)
+    profiler = RunProfiler(args.profile).start() if args.profile else None
 
-    try:
-        # 중복 체크
-        if os.path.exists(FILE_NAME):
-            df_existing = pd.read_csv(FILE_NAME)
-            check = df_existing[
-                (df_existing['corp_name'] == corp_name) & 
-                (df_existing['year'] == year) & 
-                (df_existing['quarter'] == quarter)
-            ]
-            if not check.empty:
+    today_str = datetime.now().strftime('%Y%m%d')
+    backfill_mode = args.start is not None
+    start_str = args.start or today_str
+    end_str = args.end or today_str
+
+    print(f"🚀 [{'백필' if backfill_mode else '데일리'} 모드] 시스템 가동 시작...")
+
+    # 데일리 모드: 마지막 처리 날짜부터 다시 조회해 빠진 날을 따라잡습니다. (이미 처리한 접수번호는 제외)
+    if not backfill_mode:
+        start_str = catchup_start(load_watermark(), today_str, int(os.environ.get('INGEST_MAX_CATCHUP_DAYS', DEFAULT_MAX_CATCHUP_DAYS)))
+        if start_str < today_str:
+            print(f"⏪ 워터마크 이후 공시부터 조회합니다: {start_str} ~ {end_str}")
+
+    DART_API_KEY = os.environ.get('DART_API_KEY')
+    SLACK_WEBHOOK_URL = os.environ.get('SLACK_WEBHOOK_URL')
+
+    # DART 조회 동시성/속도 제한 (DART 일일·분당 호출 한도에 맞춰 조절)
+    MAX_WORKERS = int(os.environ.get('DART_MAX_WORKERS', 4))
+    RATE_PER_SEC = float(os.environ.get('DART_RATE_PER_SEC', 5))
+
+    # finstate 캐시 (같은 날 재실행 시 API 재호출 방지, 빈 값이면 디스크 캐시 끔)
+    CACHE_DIR = os.environ.get('FINSTATE_CACHE_DIR', DEFAULT_CACHE_DIR)
+    CACHE_TTL = int(os.environ.get('FINSTATE_CACHE_TTL', DEFAULT_TTL))
+
+    # 슬랙 알림 (백그라운드 전송, 여러 기업을 한 메시지로 묶어 발송, 종료 시 남은 알림 전송)
+    notifier = SlackNotifier(
+        SLACK_WEBHOOK_URL,
+        session=perf.wrap(requests.Session(), ['post'], 'slack'),
+        digest_size=int(os.environ.get('SLACK_DIGEST_SIZE', DEFAULT_DIGEST_SIZE)),
+        flush_interval=float(os.environ.get('SLACK_FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL)),
+    )
+
+    if dart is None:
+        if DART_API_KEY is None:
+            print("❌ [오류] API 키가 없습니다.")
+            return 1
+        try:
+            import OpenDartReader
+            dart = OpenDartReader(DART_API_KEY.strip())
+        except Exception as e:
+            print(f"❌ [오류] DART 연결 실패: {e}")
+            return 1
+    dart = CachedDart(perf.wrap(dart, ['list', 'finstate'], 'dart'), cache_dir=CACHE_DIR, ttl=CACHE_TTL)
+
+    success_count = 0
+    error_count = 0
+    saved_keys = []
+
+    # 실행 전에 Parquet 사본/지표 테이블이 CSV와 맞지 않았다면 마지막에 전체를 다시 만듭니다.
+    columnar_was_fresh = args.skip_derived or columnar_is_fresh(FILE_NAME)
+    metrics_was_fresh = args.skip_derived or metrics_is_fresh(FILE_NAME)
+
+    # 처리한 접수번호 (finstate 조회 전에 거름). 조회/저장에 실패한 공시는 넣지 않아 다음 실행에서 재시도합니다.
+    processed_receipts = load_receipts()
+    failed_receipts = set()
+    # finstate가 아직 없던 공시(None/전부 0)도 INGEST_MAX_MISSING_ATTEMPTS번 실행까지는 처리 완료로 넣지 않습니다.
+    pending_receipts = load_pending()
+    missing_receipts = set()
+    retry_receipts = set()
+    MAX_MISSING_ATTEMPTS = int(os.environ.get('INGEST_MAX_MISSING_ATTEMPTS', DEFAULT_MAX_MISSING_ATTEMPTS))
+
+    # 중복 체크용 키 인덱스 (실행당 1회 로딩, 저장 시마다 갱신)
+    with perf.span('dedup.load_index', io=True):
+        existing_keys = load_key_index(FILE_NAME)
+    print(f"🗂️ 기존 데이터 키 {len(existing_keys):,}건 로딩")
+
+    # SQLite 저장소 (upsert 대상). CSV는 구간이 끝날 때마다 여기서 정렬된 전체로 다시 내보냅니다.
+    with perf.span('write.open_store', io=True):
+        store = open_store(FILE_NAME)
+    csv_dirty = False
+
+    def flush_csv():
+        nonlocal csv_dirty
+        if csv_dirty:
+            with perf.span('write.export_csv', io=True):
+                export_csv(store, FILE_NAME)
+            csv_dirty = False
+
+    def finish_run(status, error=None):
+        # 실행 리포트 저장 (종료 직전 1회). 실패해도 수집 결과에는 영향 없음
+        if profiler is not None:
+            profiler.stop()
+        perf.print_summary()
+        try:
+            perf.write_report(
+                report_path, status=status, error=error,
+                mode='backfill' if backfill_mode else 'daily', start=start_str, end=end_str,
+                saved=success_count, errors=error_count, cache=dart.stats(), slack=notifier.stats(),
+                files={path: path_size(path) for path in [FILE_NAME, COLUMNAR_DIR, METRICS_FILE, DB_FILE]},
+            )
+            print(f"🧾 실행 리포트 저장: {report_path}")
+        except OSError as e:
+            print(f"⚠️ 실행 리포트 저장 실패: {e}")
+
+    # 상세 분석 및 데이터 저장
+    def save_batch(batch):
+        # batch: [(job, fs)] → 계정 추출은 일괄, CSV 추가도 한 번
+        nonlocal success_count, csv_dirty
+        with perf.span('extract'):
+            extracted = extract_batch({job['key']: fs for job, fs in batch})
+        by_key = {}
+        for key, ac_kor, column, val, prev_val in extracted.itertuples(index=False):
+            by_key.setdefault(key, []).append((ac_kor, column, val, prev_val))
+
+        rows, saved = [], []
+        for job, fs in batch:
+            corp_name, corp_code, year, quarter, key = job['corp_name'], job['corp_code'], job['year'], job['quarter'], job['key']
+
+            # 같은 실행 안에서 먼저 저장된 보고서와 겹치면 스킵
+            if key in existing_keys and not job['amended']:
                 print(f"   ⚠️ [Skip] {corp_name} {year} {quarter} 이미 존재함")
                 continue
 
-        # 재무데이터 가져오기
-        fs = dart.finstate(corp_code, year)
-        if fs is None:
-            fs = dart.finstate(corp_code, year - 1)
-        
-        if fs is None: continue
-
-        accounts = {'매출액': 'revenue', '영업이익': 'profit', '당기순이익': 'net_income'}
-        save_row = {'corp_code': corp_code, 'corp_name': corp_name, 'year': year, 'quarter': quarter}
-        
-        msg_lines = [f"📢 *{corp_name} {year}년 {quarter} 실적*"]
-        has_data = False
-
-        for ac_kor, ac_eng in accounts.items():
-            data = fs.loc[(fs['account_nm'] == ac_kor) & (fs['fs_div'] == 'CFS')]
-            if data.empty:
-                data = fs.loc[(fs['account_nm'] == ac_kor) & (fs['fs_div'] == 'OFS')]
-            
-            if not data.empty:
-                val = str_to_int(data['thstrm_amount'].values[0])
-                save_row[ac_eng] = val
-                prev_val = str_to_int(data['frmtrm_amount'].values[0])
+            items = by_key.get(key, [])
+            if not any(val != 0 for _, _, val, _ in items):
+                missing_receipts.add(job['rcept_no'])
+                continue
+
+            save_row = {'corp_code': corp_code, 'corp_name': corp_name, 'year': year, 'quarter': quarter}
+            msg_lines = [f"✏️ *{corp_name} {year}년 {quarter} 실적 (정정)*" if job['amended'] else f"📢 *{corp_name} {year}년 {quarter} 실적*"]
+            for ac_kor, column, val, prev_val in items:
+                save_row[column] = val
                 msg_lines.append(f"- {ac_kor}: {val:,}원 {format_diff(val - prev_val)}")
-                if val != 0: has_data = True
-
-        if has_data:
-            df_new = pd.DataFrame([save_row])
-            if not os.path.exists(FILE_NAME):
-                df_new.to_csv(FILE_NAME, index=False, encoding='utf-8-sig')
-            else:
-                df_new.to_csv(FILE_NAME, mode='a', header=False, index=False, encoding='utf-8-sig')
-            
-            send_slack("\n".join(msg_lines))
+
+            rows.append(save_row)
+            saved.append((corp_name + (" (정정)" if job['amended'] else ""), "\n".join(msg_lines)))
+            existing_keys.add(key)
+
+        if not rows: return
+        with perf.span('write.upsert', io=True):
+            upsert_rows(store, rows)
+        csv_dirty = True
+        saved_keys.extend(make_key(row['corp_code'], row['year'], row['quarter']) for row in rows)
+        for corp_name, msg in saved:
+            with perf.span('slack.enqueue'):
+                notifier.notify(msg)
             print(f"   💾 {corp_name} 저장 완료")
-            success_count += 1
-            time.sleep(0.5)
+        success_count += len(rows)
+        perf.count('rows_saved', len(rows))
+
+    def process_jobs(jobs):
+        # 재무데이터 병렬 조회 → 저장은 여기(메인 스레드)에서 batch_size 단위로
+        nonlocal error_count
+        print(f"📥 재무데이터 조회 {len(jobs)}건 (동시 {MAX_WORKERS}개, 초당 {RATE_PER_SEC}회)")
+        batch = []
+        for job, fs, fetch_error in fetch_all(dart, jobs, max_workers=MAX_WORKERS, rate=RATE_PER_SEC):
+            if fetch_error is not None:
+                print(f"   ⚠️ {job['corp_name']} 에러: {fetch_error}")
+                error_count += 1
+                failed_receipts.add(job['rcept_no'])
+                continue
+            if fs is None:
+                missing_receipts.add(job['rcept_no'])
+                continue
+
+            batch.append((job, fs))
+            if len(batch) >= args.batch_size:
+                flush_batch(batch)
+                batch = []
+        if batch:
+            flush_batch(batch)
+
+    def flush_batch(batch):
+        nonlocal error_count
+        try:
+            save_batch(batch)
+        except Exception as e:
+            print(f"   ⚠️ {len(batch)}건 저장 중 에러: {e}")
+            error_count += len(batch)
+            failed_receipts.update(job['rcept_no'] for job, _ in batch)
+
+    done_until = None
+    if backfill_mode and not args.no_resume:
+        done_until = load_checkpoint(args.checkpoint, start_str, end_str)
+        if done_until:
+            print(f"⏩ 체크포인트 발견: {done_until}까지 처리됨, 이어서 진행합니다.")
+
+    for win_start, win_end in iter_windows(start_str, end_str, args.window_days):
+        if done_until and win_end <= done_until: continue
+        print(f"📅 검색 기간: {win_start} ~ {win_end}")
+
+        try:
+            target_reports = list_reports(dart, win_start, win_end)
+        except Exception as e:
+            print(f"❌ 공시 조회 중 오류: {e}")
+            flush_csv()
+            save_key_index(existing_keys, FILE_NAME)
+            store.close()
+            notifier.close()
+            finish_run('error', str(e))
+            return 1
+
+        if target_reports is not None and not target_reports.empty:
+            perf.count('reports_listed', len(target_reports))
+            with perf.span('dedup.receipts'):
+                seen = target_reports['rcept_no'].astype(str).isin(processed_receipts)
+            if seen.any():
+                print(f"⏭️ 이미 처리한 공시 {int(seen.sum())}건 제외")
+            target_reports = target_reports[~seen]
+
+        if target_reports is None or target_reports.empty:
+            print(f"💤 {win_start} ~ {win_end} 분석할 실적 공시가 없습니다.")
+        else:
+            print(f"🔎 총 {len(target_reports)}건의 공시 분석 시작")
+            with perf.span('dedup.keys'):
+                jobs = build_jobs(target_reports, existing_keys)
+            perf.count('jobs', len(jobs))
+            with perf.span('fetch_and_save'):
+                process_jobs(jobs)
+            listed = set(target_reports['rcept_no'].astype(str)) - failed_receipts
+            retry = settle_pending(pending_receipts, listed, missing_receipts, MAX_MISSING_ATTEMPTS)
+            if retry:
+                print(f"⏳ 재무데이터가 아직 없는 공시 {len(retry)}건은 다음 실행에서 다시 조회합니다.")
+            retry_receipts |= retry
+            processed_receipts |= listed - retry
+
+        flush_csv()
+        with perf.span('write.key_index', io=True):
+            save_key_index(existing_keys, FILE_NAME)
+            processed_receipts = save_receipts(processed_receipts, today_str)
+            pending_receipts = save_pending(pending_receipts, today_str)
+        # 실패했거나 재무데이터를 기다리는 공시가 있으면 워터마크를 그 접수일에 묶어 두어 다음 실행에서 다시 조회되게 합니다.
+        hold = min([r[:8] for r in failed_receipts | retry_receipts] + [win_end])
+        done = [r for r in processed_receipts if r[:8] <= hold]
+        save_watermark(hold, max(done) if done else None)
+        if backfill_mode:
+            save_checkpoint(args.checkpoint, start_str, end_str, win_end)
+
+    if backfill_mode:
+        clear_checkpoint(args.checkpoint)
+
+    # 대시보드용 사본은 모두 gitignore 대상이라 GitHub Actions에서는 --skip-derived로 건너뜁니다.
+    # (커밋되지 않고 실행이 끝나면 버려지므로, 대시보드가 CSV 내용 해시를 보고 직접 다시 만듭니다.)
+    if not args.skip_derived:
+        # Parquet 사본 갱신 (저장된 연도 파티션만, 사본이 어긋나 있었으면 전체)
+        saved_years = {year for _, year, _ in saved_keys}
+        if saved_years or not columnar_was_fresh:
+            with perf.span('write.columnar', io=True):
+                synced = sync_columnar(years=saved_years if columnar_was_fresh else None, csv_path=FILE_NAME)
+            if synced:
+                print("🧱 Parquet 사본 갱신 완료")
+
+        # 파생 지표 테이블 갱신 (새로 저장된 기업·연도만)
+        if saved_keys or not metrics_was_fresh:
+            with perf.span('write.metrics', io=True):
+                metric_rows = refresh_metrics(saved_keys, base_was_fresh=metrics_was_fresh, csv_path=FILE_NAME)
+            if metric_rows:
+                print(f"📐 지표 테이블 갱신 완료 ({metric_rows:,}행)")
+
+        # 스크리닝 테이블 (연속 성장·TTM·분기별 백분위): 분기 단면 순위라 저장한 행이 있거나 CSV 내용이 바뀌면 전체를 다시 계산
+        if HAS_PYARROW and metrics_is_fresh(FILE_NAME) and (saved_keys or not metrics_is_fresh(FILE_NAME, SCREENING_FILE)):
+            with perf.span('write.screening', io=True):
+                screen_rows = refresh_screening(FILE_NAME)
+            if screen_rows:
+                print(f"🧭 스크리닝 테이블 갱신 완료 ({screen_rows:,}행)")
+
+        # 대시보드 SQL 조회용 지표 사본 (이번 실행에 저장한 행이 있으면 항상 다시 씀)
+        if HAS_PYARROW and metrics_is_fresh(FILE_NAME) and (saved_keys or not metrics_table_is_fresh(FILE_NAME)):
+            with perf.span('write.sqlite_metrics', io=True):
+                write_metrics(store, load_metrics(), FILE_NAME)
+    store.close()
 
-    except Exception as e:
-        print(f"   ⚠️ {corp_name} 에러: {e}")
-        error_count += 1
+    with perf.span('slack.flush'):
+        notifier.close()
+    finish_run('ok')
+    slack_stats = notifier.stats()
+    cache_stats = dart.stats()
+    print(f"🏁 작업 완료! (저장: {success_count}, 스킵/에러: {error_count}, 캐시 hit/miss: {cache_stats['hits']}/{cache_stats['misses']}, "
+          f"슬랙: {slack_stats['sent']}건/{slack_stats['posts']}회 전송)")
+    return 0
 
-print(f"🏁 작업 완료! (저장: {success_count}, 스킵/에러: {error_count})")
+if __name__ == '__main__':
+    sys.exit(main())
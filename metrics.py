@@ -0,0 +1,94 @@
+import os
+import pandas as pd
+
+from storage import HAS_PYARROW, CSV_FILE, read_db, file_digest
+from quarterly import sort_frame, period_keys, isolate_4q, add_growth
+
+# -----------------------------------------------------------
+# 파생 지표 테이블 (OPM / QoQ / YoY, 원본·4Q 개별분기 두 가지)
+# -----------------------------------------------------------
+# main.py가 수집 후 갱신하고, dashboard.py는 계산 없이 읽기만 합니다.
+# variant='raw'   : 공시 원본 (4Q는 연간 누적)
+# variant='iso4q' : 4Q에서 같은 해 1Q~3Q 합계를 뺀 개별 분기 값 (1Q~3Q가 다 있어야 계산, 아니면 NaN)
+# 계산 자체는 quarterly.py 엔진이 담당합니다.
+# 금액은 원 단위 그대로 저장합니다. 파일 메타데이터에 원본 CSV 내용 해시를 남겨 최신 여부를 확인합니다.
+METRICS_FILE = 'financial_metrics.parquet'
+SOURCE_KEY = b'source_csv_sha256'
+
+RENAME_MAP = {
+    '매출액': 'revenue', '영업이익': 'profit', '영업현금흐름': 'cash_flow',
+    '당기순이익': 'net_income', '순이익': 'net_income',
+    '분기순이익': 'net_income', '반기순이익': 'net_income', '연결당기순이익': 'net_income'
+}
+VALUE_COLUMNS = ['revenue', 'profit', 'net_income', 'cash_flow']
+ISOLATE_COLUMNS = ['revenue', 'profit', 'net_income']
+METRIC_COLUMNS = ['corp_code', 'corp_name', 'year', 'quarter', 'variant'] + VALUE_COLUMNS + \
+                 ['opm', 'rev_qoq', 'prof_qoq', 'rev_yoy', 'prof_yoy']
+
+def base_frame(db):
+    df = db.rename(columns={k: v for k, v in RENAME_MAP.items() if k in db.columns})
+    df = df.loc[:, ~df.columns.duplicated()]
+    df = df.reindex(columns=['corp_code', 'corp_name', 'year', 'quarter'] + VALUE_COLUMNS)
+    for col in VALUE_COLUMNS:
+        if not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = df[col].astype(str).str.replace(',', '')
+        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+    df = df.astype({'corp_code': str, 'corp_name': str, 'quarter': str})
+    return sort_frame(df)
+
+def compute_metrics(db):
+    base = base_frame(db)
+    keys = period_keys(base)
+    raw = add_growth(base, keys).assign(variant='raw')
+    iso = add_growth(isolate_4q(base, ISOLATE_COLUMNS, keys), keys).assign(variant='iso4q')
+    return pd.concat([raw, iso], ignore_index=True)[METRIC_COLUMNS]
+
+def update_metrics(db, metrics, changed_keys):
+    # 새로 들어온 (corp_code, year)와, 그 다음 해(YoY/QoQ 기준이 바뀜)만 다시 계산해 교체
+    groups = {(code, int(year) + d) for code, year, _ in changed_keys for d in (0, 1)}
+    corps = {code for code, _ in groups}
+
+    context = db[db['corp_code'].isin(corps)]
+    fresh = compute_metrics(context)
+    fresh = fresh[pd.MultiIndex.from_arrays([fresh['corp_code'], fresh['year']]).isin(groups)]
+    keep = metrics[~pd.MultiIndex.from_arrays([metrics['corp_code'], metrics['year']]).isin(groups)]
+    return pd.concat([keep, fresh], ignore_index=True)[METRIC_COLUMNS]
+
+def metrics_is_fresh(csv_path=CSV_FILE, path=METRICS_FILE):
+    if not (HAS_PYARROW and os.path.exists(path) and os.path.exists(csv_path)):
+        return False
+    import pyarrow.parquet as pq
+    try:
+        meta = pq.read_schema(path).metadata or {}
+    except OSError:
+        return False
+    return meta.get(SOURCE_KEY) == file_digest(csv_path).encode()
+
+def load_metrics(path=METRICS_FILE, columns=None):
+    return pd.read_parquet(path, columns=columns)
+
+def save_metrics(metrics, csv_path=CSV_FILE, path=METRICS_FILE):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    metrics = metrics.sort_values(['variant', 'corp_code', 'year', 'quarter'], kind='stable').reset_index(drop=True)
+    metrics = metrics.astype({'corp_name': 'category', 'quarter': 'category', 'variant': 'category'})
+    table = pa.Table.from_pandas(metrics, preserve_index=False)
+    meta = dict(table.schema.metadata or {})
+    meta[SOURCE_KEY] = file_digest(csv_path).encode()
+    tmp_path = path + '.tmp'
+    pq.write_table(table.replace_schema_metadata(meta), tmp_path)
+    os.replace(tmp_path, path)
+
+def refresh_metrics(changed_keys=None, base_was_fresh=False, csv_path=CSV_FILE, path=METRICS_FILE):
+    # main.py 수집 단계 마지막에 호출. 기존 테이블이 직전 CSV 기준으로 최신이었다면 변경분만 갱신.
+    if not HAS_PYARROW or not os.path.exists(csv_path):
+        return None
+    db = read_db(source=csv_path)
+    if base_was_fresh and changed_keys is not None:
+        if not changed_keys:
+            return 0
+        metrics = update_metrics(db, load_metrics(path), changed_keys)
+    else:
+        metrics = compute_metrics(db)
+    save_metrics(metrics, csv_path, path)
+    return len(metrics)
@@ -0,0 +1,137 @@
+import time
+import queue
+import atexit
+import threading
+
+import requests
+
+# -----------------------------------------------------------
+# 슬랙 알림 디스패처 (백그라운드 전송 + 다이제스트 묶음)
+# -----------------------------------------------------------
+# notify()는 큐에 넣고 바로 돌아오므로 수집 루프가 웹훅 응답을 기다리지 않습니다.
+# 백그라운드 스레드가 flush_interval 동안 모인 메시지를 한 번에 묶어 Block Kit 형식으로 보내고,
+# 슬랙 제한(메시지당 블록 50개, 섹션 3000자)에 맞춰 나눕니다.
+# 429는 Retry-After만큼 기다렸다가, 5xx/네트워크 오류는 지수 백오프로 재시도합니다.
+# 프로그램 종료 시(atexit) 남은 메시지를 모두 보내고 끝납니다.
+DEFAULT_DIGEST_SIZE = 20       # 다이제스트 한 번에 묶을 최대 메시지 수
+DEFAULT_FLUSH_INTERVAL = 5.0   # 첫 메시지 이후 모으는 최대 시간 (초)
+DEFAULT_TIMEOUT = 10
+DEFAULT_RETRIES = 5
+DEFAULT_BACKOFF = 1.0
+
+MAX_BLOCKS = 50
+MAX_SECTION_CHARS = 3000
+MAX_FALLBACK_CHARS = 3000
+
+def truncate(text, limit):
+    return text if len(text) <= limit else text[:limit - 1] + "…"
+
+def build_payloads(messages, title="📊 실적 공시 알림"):
+    # messages: mrkdwn 문자열 목록 → 웹훅 payload 목록 (블록 50개 이하로 분할)
+    per_payload = MAX_BLOCKS - 2  # 헤더 + 구분선
+    payloads = []
+    for start in range(0, len(messages), per_payload):
+        chunk = messages[start:start + per_payload]
+        part = f" ({start // per_payload + 1}/{-(-len(messages) // per_payload)})" if len(messages) > per_payload else ""
+        header = f"{title} {len(chunk)}건{part}"
+        blocks = [
+            {"type": "header", "text": {"type": "plain_text", "text": truncate(header, 150), "emoji": True}},
+            {"type": "divider"},
+        ]
+        for msg in chunk:
+            blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": truncate(msg, MAX_SECTION_CHARS)}})
+        # 알림 미리보기용 text (블록을 못 보여주는 클라이언트 대비)
+        fallback = header + "\n" + "\n".join(msg.split("\n", 1)[0] for msg in chunk)
+        payloads.append({"text": truncate(fallback, MAX_FALLBACK_CHARS), "blocks": blocks})
+    return payloads
+
+class SlackNotifier:
+    def __init__(self, webhook_url, digest_size=DEFAULT_DIGEST_SIZE, flush_interval=DEFAULT_FLUSH_INTERVAL,
+                 timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, session=None):
+        self.webhook_url = webhook_url
+        self.digest_size = digest_size
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.session = session or requests.Session()
+        self.queue = queue.Queue()
+        self.sent = 0       # 전달된 메시지 수
+        self.posts = 0      # 웹훅 호출 성공 수
+        self.retried = 0
+        self.dropped = 0
+        self.closed = False
+        self.worker = None
+        if webhook_url:
+            self.worker = threading.Thread(target=self._run, name='slack-notifier', daemon=True)
+            self.worker.start()
+            atexit.register(self.close)
+        else:
+            print("⚠️ SLACK_WEBHOOK_URL 설정이 없어 알림을 건너뜁니다.")
+
+    def notify(self, msg):
+        if self.worker is None or self.closed: return
+        self.queue.put(msg)
+
+    def close(self, timeout=60):
+        # 남은 메시지를 모두 보내고 워커 종료 (여러 번 불러도 안전)
+        if self.worker is None or self.closed: return
+        self.closed = True
+        self.queue.put(None)
+        self.worker.join(timeout)
+        if self.worker.is_alive():
+            print(f"⚠️ 슬랙 전송이 {timeout}초 안에 끝나지 않았습니다. (남은 메시지 약 {self.queue.qsize()}건)")
+
+    def stats(self):
+        return {'sent': self.sent, 'posts': self.posts, 'retried': self.retried, 'dropped': self.dropped}
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            msg = self.queue.get()
+            if msg is None: break
+            digest = [msg]
+            deadline = time.monotonic() + self.flush_interval
+            while len(digest) < self.digest_size:
+                try:
+                    msg = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if msg is None:
+                    stopping = True
+                    break
+                digest.append(msg)
+            self._send_digest(digest)
+
+    def _send_digest(self, digest):
+        for payload in build_payloads(digest):
+            count = len(payload['blocks']) - 2
+            if self._post(payload):
+                self.sent += count
+                self.posts += 1
+                print(f"✅ 슬랙 전송 성공! ({count}건 묶음)")
+            else:
+                self.dropped += count
+
+    def _post(self, payload):
+        for attempt in range(self.retries + 1):
+            try:
+                response = self.session.post(self.webhook_url, json=payload, timeout=self.timeout)
+            except requests.RequestException as e:
+                wait, reason = self.backoff * (2 ** attempt), f"네트워크 에러: {e}"
+            else:
+                if response.status_code == 200: return True
+                if response.status_code == 429:
+                    wait, reason = float(response.headers.get('Retry-After', self.backoff)), "요청 한도 초과(429)"
+                elif response.status_code >= 500:
+                    wait, reason = self.backoff * (2 ** attempt), f"서버 에러({response.status_code})"
+                else:
+                    # 4xx(잘못된 payload, 폐기된 웹훅 등)는 재시도해도 같은 결과
+                    print(f"⚠️ 슬랙 전송 응답 이상: {response.status_code}, {response.text}")
+                    return False
+            if attempt == self.retries: break
+            self.retried += 1
+            print(f"   🔁 슬랙 재시도 {attempt + 1}/{self.retries} ({wait:.1f}초 후): {reason}")
+            time.sleep(wait)
+        print(f"❌ 슬랙 전송 실패: {reason}")
+        return False
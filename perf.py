@@ -0,0 +1,207 @@
+import os
+import sys
+import json
+import time
+import threading
+from datetime import datetime
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# -----------------------------------------------------------
+# 실행 계측 (단계별 소요 시간, API 호출 수, 읽기/쓰기 바이트) + JSON 실행 리포트
+# -----------------------------------------------------------
+# 단계(span)마다 걸린 시간을 모아 p50/p95/max를 내고, 실행이 끝나면 run_report.json으로 남깁니다.
+# 워크플로에서 아티팩트로 올려 두면 실행 간 비교(데이터가 커질 때의 회귀 확인)에 씁니다.
+# 바이트는 /proc/self/io(rchar/wchar, 리눅스)의 전후 차이로 잽니다. 없는 환경에서는 생략합니다.
+DEFAULT_REPORT = 'run_report.json'
+DEFAULT_PROFILE = 'run_profile'
+IO_PATH = '/proc/self/io'
+
+def read_io():
+    try:
+        with open(IO_PATH) as f:
+            fields = dict(line.split(':', 1) for line in f if ':' in line)
+        return int(fields['rchar']), int(fields['wchar'])
+    except (OSError, KeyError, ValueError):
+        return None
+
+def percentile(sorted_values, q):
+    # 최근접 순위(nearest-rank) 백분위
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+def path_size(path):
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+class PerfRecorder:
+    def __init__(self):
+        self.samples = {}    # stage -> [초]
+        self.counters = {}   # 이름 -> 횟수/건수
+        self.io = {}         # stage -> [읽은 바이트, 쓴 바이트]
+        self.lock = threading.Lock()
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self.t0 = time.perf_counter()
+        self.io_start = read_io()
+
+    @contextmanager
+    def span(self, name, io=False):
+        # io=True: 메인 스레드 단계의 읽기/쓰기 바이트도 기록 (스레드 풀 안에서는 다른 스레드 몫이 섞이므로 끔)
+        io_before = read_io() if io else None
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - t0)
+            if io_before is not None:
+                io_after = read_io()
+                if io_after is not None:
+                    self.add_io(name, io_after[0] - io_before[0], io_after[1] - io_before[1])
+
+    def record(self, name, sec):
+        with self.lock:
+            self.samples.setdefault(name, []).append(sec)
+
+    def count(self, name, n=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def add_io(self, name, read_bytes, written_bytes):
+        with self.lock:
+            totals = self.io.setdefault(name, [0, 0])
+            totals[0] += read_bytes
+            totals[1] += written_bytes
+
+    def wrap(self, obj, methods, prefix):
+        # obj의 지정한 메서드 호출마다 '{prefix}.{method}' 단계 시간과 'api.{prefix}.{method}' 호출 수를 기록
+        return TimedProxy(self, obj, methods, prefix)
+
+    def stages(self):
+        with self.lock:
+            samples = {name: sorted(values) for name, values in self.samples.items()}
+            io = {name: list(values) for name, values in self.io.items()}
+        out = {}
+        for name, values in samples.items():
+            stage = {
+                'count': len(values),
+                'total_sec': round(sum(values), 4),
+                'p50_ms': round(percentile(values, 50) * 1000, 2),
+                'p95_ms': round(percentile(values, 95) * 1000, 2),
+                'max_ms': round(values[-1] * 1000, 2),
+            }
+            if name in io:
+                stage['read_bytes'], stage['written_bytes'] = io[name]
+            out[name] = stage
+        return out
+
+    def report(self, **extra):
+        io_end = read_io()
+        bytes_io = None
+        if self.io_start is not None and io_end is not None:
+            bytes_io = {'read': io_end[0] - self.io_start[0], 'written': io_end[1] - self.io_start[1]}
+        with self.lock:
+            counters = dict(self.counters)
+        report = {
+            'started_at': self.started_at,
+            'total_sec': round(time.perf_counter() - self.t0, 3),
+            'stages': self.stages(),
+            'api_calls': {k[len('api.'):]: v for k, v in counters.items() if k.startswith('api.')},
+            'counters': {k: v for k, v in counters.items() if not k.startswith('api.')},
+            'bytes': bytes_io,
+            'peak_rss_mb': peak_rss_mb(),
+        }
+        report.update(extra)
+        return report
+
+    def write_report(self, path=DEFAULT_REPORT, **extra):
+        report = self.report(**extra)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+        return report
+
+    def print_summary(self, top=8):
+        stages = sorted(self.stages().items(), key=lambda item: item[1]['total_sec'], reverse=True)
+        print(f"⏱️ 단계별 소요 시간 (상위 {min(top, len(stages))}개, 총 {time.perf_counter() - self.t0:.1f}초)")
+        for name, s in stages[:top]:
+            print(f"   {name:<22} {s['total_sec']:8.2f}s  {s['count']:>5}회  "
+                  f"p50 {s['p50_ms']:8.1f}ms  p95 {s['p95_ms']:8.1f}ms  max {s['max_ms']:8.1f}ms")
+
+class TimedProxy:
+    def __init__(self, perf, obj, methods, prefix):
+        self._perf = perf
+        self._obj = obj
+        self._methods = set(methods)
+        self._prefix = prefix
+
+    def __getattr__(self, name):
+        attr = getattr(self._obj, name)
+        if name not in self._methods:
+            return attr
+        stage = f"{self._prefix}.{name}"
+
+        def timed(*args, **kwargs):
+            self._perf.count('api.' + stage)
+            with self._perf.span(stage):
+                return attr(*args, **kwargs)
+        return timed
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    # 리눅스는 KB, macOS는 바이트 단위
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+# -----------------------------------------------------------
+# 프로파일러 (--profile 플래그, 메인 스레드만 측정)
+# -----------------------------------------------------------
+# cprofile: run_profile.prof(pstats/snakeviz로 열람) + 누적 시간 상위 함수 출력
+# pyinstrument: 설치되어 있을 때만, run_profile.html로 저장
+class RunProfiler:
+    def __init__(self, kind='cprofile', path=DEFAULT_PROFILE):
+        self.kind = kind
+        self.path = path
+        self.profiler = None
+
+    def start(self):
+        if self.kind == 'pyinstrument':
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                print("⚠️ pyinstrument가 설치되어 있지 않아 cProfile로 측정합니다.")
+                self.kind = 'cprofile'
+            else:
+                self.profiler = Profiler()
+                self.profiler.start()
+                return self
+        import cProfile
+        self.profiler = cProfile.Profile()
+        self.profiler.enable()
+        return self
+
+    def stop(self, top=20):
+        if self.profiler is None:
+            return None
+        if self.kind == 'pyinstrument':
+            self.profiler.stop()
+            out_path = self.path + '.html'
+            with open(out_path, 'w', encoding='utf-8') as f:
+                f.write(self.profiler.output_html())
+        else:
+            import pstats
+            self.profiler.disable()
+            out_path = self.path + '.prof'
+            self.profiler.dump_stats(out_path)
+            pstats.Stats(self.profiler).sort_stats('cumulative').print_stats(top)
+        self.profiler = None
+        print(f"🔬 프로파일 저장: {out_path}")
+        return out_path
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+# -----------------------------------------------------------
+# 분기 시계열 계산 엔진 (4Q 개별분기 변환, OPM, QoQ, YoY)
+# -----------------------------------------------------------
+# (기업, 연도, 분기)로 정렬된 배열 위에서 동작합니다. merge/행 단위 lambda 없이
+# "기업 번호 × STRIDE + 분기 번호" 정렬 키를 searchsorted로 찾아 이전 분기를 연결하므로,
+# 중간 분기가 빠져 있으면 엉뚱한 분기와 비교하지 않고 비교값 없음(0%)으로 처리합니다.
+QUARTERS = ['1Q', '2Q', '3Q', '4Q']
+STRIDE = 1 << 20
+
+def period_index(year, quarter):
+    # 연속 분기 번호: 2024-1Q → 8096, 2024-2Q → 8097 ...
+    qnum = pd.Categorical(quarter, categories=QUARTERS).codes.astype(np.int64)
+    return np.asarray(year, dtype=np.int64) * 4 + qnum
+
+def period_label(pidx):
+    # 분기 번호 → '2024-1Q' (배열이면 라벨 리스트)
+    if np.ndim(pidx) == 0:
+        return f"{int(pidx) // 4}-{QUARTERS[int(pidx) % 4]}"
+    return [f"{p // 4}-{QUARTERS[p % 4]}" for p in np.asarray(pidx, dtype=np.int64).tolist()]
+
+def sort_frame(df):
+    order = np.lexsort((period_index(df['year'], df['quarter']), df['corp_code'].to_numpy()))
+    return df.iloc[order].reset_index(drop=True)
+
+def period_keys(df):
+    # 정렬된 프레임 전제: 기업 번호도 정렬 순서대로 매겨 키 전체가 오름차순이 됩니다.
+    corp_id, _ = pd.factorize(df['corp_code'], sort=True)
+    return corp_id.astype(np.int64) * STRIDE + period_index(df['year'], df['quarter'])
+
+def lag_positions(keys, lag):
+    # 같은 기업의 lag분기 전 행 위치 (없으면 -1)
+    target = keys - lag
+    pos = np.searchsorted(keys, target)
+    pos_clipped = np.minimum(pos, len(keys) - 1)
+    found = (pos < len(keys)) & (keys[pos_clipped] == target)
+    return np.where(found, pos_clipped, -1)
+
+def take(values, pos):
+    # pos == -1 자리는 NaN
+    out = values[np.maximum(pos, 0)].astype(np.float64)
+    out[pos < 0] = np.nan
+    return out
+
+def pct_change(values, prev):
+    # 기준값이 없거나 0이면 0% (기존 대시보드의 inf/NaN → 0 처리와 동일)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out = (values - prev) / prev * 100
+    out[~np.isfinite(out)] = 0
+    return out
+
+def operating_margin(revenue, profit):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out = profit / revenue * 100
+    out[~np.isfinite(out)] = 0
+    return out
+
+def isolate_4q(df, columns=('revenue', 'profit', 'net_income'), keys=None):
+    # 4Q(연간 누적) - 같은 해 1Q~3Q. 1Q~3Q 중 하나라도 없으면 개별 분기 값을 알 수 없으므로 NaN
+    keys = period_keys(df) if keys is None else keys
+    is_4q = (df['quarter'] == '4Q').to_numpy()
+    prior = [lag_positions(keys, lag) for lag in (1, 2, 3)]
+    out = df.copy()
+    for col in columns:
+        values = out[col].to_numpy(dtype=np.float64)
+        q123 = take(values, prior[0]) + take(values, prior[1]) + take(values, prior[2])
+        out[col] = np.where(is_4q, values - q123, values)
+    return out
+
+def add_growth(df, keys=None):
+    # df는 sort_frame 순서여야 합니다.
+    keys = period_keys(df) if keys is None else keys
+    prev_q = lag_positions(keys, 1)
+    prev_y = lag_positions(keys, 4)
+    revenue = df['revenue'].to_numpy(dtype=np.float64)
+    profit = df['profit'].to_numpy(dtype=np.float64)
+    return df.assign(
+        opm=operating_margin(revenue, profit),
+        rev_qoq=pct_change(revenue, take(revenue, prev_q)),
+        prof_qoq=pct_change(profit, take(profit, prev_q)),
+        rev_yoy=pct_change(revenue, take(revenue, prev_y)),
+        prof_yoy=pct_change(profit, take(profit, prev_y)),
+    )
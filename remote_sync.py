@@ -0,0 +1,108 @@
+import os
+import json
+import time
+import filecmp
+from email.utils import formatdate
+
+import requests
+
+from storage import CSV_FILE, ID_COLUMNS, read_csv_db
+
+# -----------------------------------------------------------
+# 원격 financial_db.csv 조건부 동기화 (대시보드용)
+# -----------------------------------------------------------
+# 마지막으로 받은 정상 사본(snapshot)과 ETag/Last-Modified를 SNAPSHOT_DIR에 보관하고,
+# If-None-Match / If-Modified-Since로 바뀐 경우에만 내려받습니다.
+# 새로 받은 파일은 파싱 검증을 통과해야 사본을 교체하므로, 원격이 깨지거나 장애가 나도
+# 직전 정상 사본(없으면 로컬 CSV)을 계속 쓸 수 있습니다.
+SNAPSHOT_DIR = os.path.join('.cache', 'remote')
+SNAPSHOT_FILE = 'financial_db.csv'
+META_FILE = 'meta.json'
+DEFAULT_TIMEOUT = 10
+
+def snapshot_paths(snapshot_dir=SNAPSHOT_DIR):
+    return os.path.join(snapshot_dir, SNAPSHOT_FILE), os.path.join(snapshot_dir, META_FILE)
+
+def load_meta(meta_path):
+    try:
+        with open(meta_path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_meta(meta, meta_path):
+    tmp_path = meta_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, meta_path)
+
+def conditional_headers(meta, snapshot_path, local_path):
+    headers = {}
+    if os.path.exists(snapshot_path):
+        if meta.get('etag'): headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'): headers['If-Modified-Since'] = meta['last_modified']
+    elif local_path and os.path.exists(local_path):
+        # 사본이 아직 없으면 로컬 CSV 수정 시각 기준으로 물어봅니다. (배포 직후 첫 실행)
+        headers['If-Modified-Since'] = formatdate(os.path.getmtime(local_path), usegmt=True)
+    return headers
+
+def validate_csv(path):
+    # 최소한 키 컬럼이 있고 행이 있어야 정상 사본으로 인정
+    df = read_csv_db(path, columns=ID_COLUMNS)
+    if df.empty:
+        raise ValueError("빈 CSV")
+    return len(df)
+
+def local_is_current(local_path, snapshot_path):
+    if os.path.getmtime(local_path) >= os.path.getmtime(snapshot_path):
+        return True
+    return filecmp.cmp(snapshot_path, local_path, shallow=False)
+
+def sync_remote(url, local_path=CSV_FILE, snapshot_dir=SNAPSHOT_DIR, timeout=DEFAULT_TIMEOUT, session=None):
+    # 반환: {'status': updated|not_modified|error, 'path': 읽을 파일, 'fetch_sec', 'parse_sec', 'bytes', 'error'}
+    # path: 원격 사본이 로컬 CSV보다 새로우면 사본, 아니면(같은 내용이거나 로컬이 더 최신) 로컬.
+    #       로컬이면 main.py가 미리 만들어 둔 지표 테이블/Parquet 사본을 그대로 쓸 수 있습니다.
+    os.makedirs(snapshot_dir, exist_ok=True)
+    snapshot_path, meta_path = snapshot_paths(snapshot_dir)
+    meta = load_meta(meta_path)
+    info = {'status': 'error', 'path': None, 'fetch_sec': 0.0, 'parse_sec': 0.0, 'bytes': 0, 'error': None}
+
+    t0 = time.perf_counter()
+    try:
+        resp = (session or requests).get(url, headers=conditional_headers(meta, snapshot_path, local_path), timeout=timeout)
+        info['fetch_sec'] = time.perf_counter() - t0
+        if resp.status_code == 304:
+            info['status'] = 'not_modified'
+        else:
+            resp.raise_for_status()
+            tmp_path = snapshot_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(resp.content)
+            info['bytes'] = len(resp.content)
+            t1 = time.perf_counter()
+            try:
+                validate_csv(tmp_path)
+            except Exception:
+                os.remove(tmp_path)
+                raise
+            info['parse_sec'] = time.perf_counter() - t1
+            os.replace(tmp_path, snapshot_path)
+            save_meta({
+                'url': url,
+                'etag': resp.headers.get('ETag'),
+                'last_modified': resp.headers.get('Last-Modified'),
+                'size': info['bytes'],
+                'fetched_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            }, meta_path)
+            info['status'] = 'updated'
+    except (requests.RequestException, OSError, ValueError) as e:
+        info['fetch_sec'] = time.perf_counter() - t0
+        info['error'] = f"{type(e).__name__}: {e}"
+
+    has_snapshot = os.path.exists(snapshot_path)
+    has_local = bool(local_path) and os.path.exists(local_path)
+    if has_snapshot and not (has_local and local_is_current(local_path, snapshot_path)):
+        info['path'] = snapshot_path
+    elif has_local:
+        info['path'] = local_path
+    return info
@@ -0,0 +1,121 @@
+import os
+import numpy as np
+import pandas as pd
+
+from storage import HAS_PYARROW, CSV_FILE, file_digest
+from metrics import load_metrics, metrics_is_fresh, SOURCE_KEY, METRICS_FILE
+from quarterly import sort_frame, period_keys, period_index, lag_positions, take
+
+# -----------------------------------------------------------
+# 전 기업 스크리닝 테이블 (연속 성장 분기 수, TTM, 분기별 백분위)
+# -----------------------------------------------------------
+# 지표 테이블의 4Q 개별분기(iso4q) 값을 (기업, 분기) 순서로 정렬한 배열에서 한 번에 계산합니다.
+# - rev_yoy/prof_yoy: 전년 같은 분기 대비 (%). 어느 한쪽 값이 없으면(빈 계정의 0 포함) NaN (지표 테이블은 0%로 두지만 여기서는 비교 불가로 봄)
+# - rev_streak/prof_streak: 이번 분기까지 매출/영업이익 YoY 증가가 이어진 분기 수 (분기가 비거나 YoY가 NaN이면 끊김)
+# - ttm_*: 최근 4분기 합계 (4분기가 모두 있어야 계산, 아니면 NaN), ttm_opm: TTM 영업이익률
+# - *_pct: 같은 분기 전 기업 중 백분위 (0~100, 클수록 상위, 값이 없는 기업은 제외)
+# main.py가 지표 테이블을 갱신한 뒤 다시 만들고, 대시보드는 읽기만 합니다.
+# 순위가 분기 단면이라 한 기업만 바뀌어도 그 분기 전체가 바뀌므로 변경분 갱신 없이 전체를 다시 계산합니다.
+SCREENING_FILE = 'financial_screening.parquet'
+SCREEN_VARIANT = 'iso4q'
+TTM_QUARTERS = 4
+
+BASE_COLUMNS = ['corp_code', 'corp_name', 'year', 'quarter', 'revenue', 'profit']
+RANK_COLUMNS = ['rev_yoy', 'prof_yoy', 'ttm_revenue', 'ttm_opm']
+SCREENING_COLUMNS = BASE_COLUMNS + ['rev_yoy', 'prof_yoy', 'ttm_revenue', 'ttm_profit', 'ttm_opm', 'rev_streak', 'prof_streak'] + \
+                    [f"{col}_pct" for col in RANK_COLUMNS]
+
+def rolling_sum(values, keys, window=TTM_QUARTERS):
+    # 같은 기업의 최근 window분기 합계. 한 분기라도 없으면 NaN
+    total = np.zeros(len(values))
+    for lag in range(window):
+        total += take(values, lag_positions(keys, lag)) if lag else values
+    return total
+
+def yoy_change(values, prev):
+    # quarterly.pct_change와 달리 기준값이 없거나 0이면 NaN (백분위 순위에서 빠지고 연속 성장도 끊김)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out = (values - prev) / prev * 100
+    out[~np.isfinite(out)] = np.nan
+    return out
+
+def growth_streak(grew, prev_pos):
+    # grew[i]가 참인 분기가 직전 분기(prev_pos)부터 몇 번 이어졌는지. 분기 누락/기업 경계에서 다시 1부터
+    # 끊기는 지점(성장 아님: i, 새 연속 시작: i-1)을 누적 최대로 퍼뜨려 i - 기준점 = 연속 길이
+    i = np.arange(len(grew))
+    anchor = np.where(~grew, i, np.where(prev_pos < 0, i - 1, -1))
+    anchor = np.maximum.accumulate(anchor) if len(anchor) else anchor
+    return np.where(grew, i - anchor, 0).astype(np.int16)
+
+def percentile_rank(values, pidx):
+    # 분기별 단면 백분위 (동점은 평균 순위)
+    return (pd.Series(values).groupby(pidx).rank(pct=True) * 100).to_numpy(dtype=np.float32)
+
+def compute_screening(metrics, variant=SCREEN_VARIANT):
+    df = metrics.loc[metrics['variant'] == variant, BASE_COLUMNS]
+    df = sort_frame(df.astype({'corp_code': str, 'corp_name': str, 'quarter': str}))
+    keys = period_keys(df)
+    pidx = period_index(df['year'], df['quarter'])
+    prev_pos = lag_positions(keys, 1)
+    prev_year = lag_positions(keys, 4)
+
+    # 지표 테이블은 빈 계정을 0으로 채워 두므로, 금액 0은 값이 없는 것으로 보고 YoY/TTM/순위에서 뺍니다.
+    revenue = df['revenue'].to_numpy(dtype=np.float64)
+    profit = df['profit'].to_numpy(dtype=np.float64)
+    revenue = np.where(revenue == 0, np.nan, revenue)
+    profit = np.where(profit == 0, np.nan, profit)
+    ttm_revenue = rolling_sum(revenue, keys)
+    ttm_profit = rolling_sum(profit, keys)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ttm_opm = np.where(ttm_revenue > 0, ttm_profit / ttm_revenue * 100, np.nan)
+    rev_yoy = yoy_change(revenue, take(revenue, prev_year))
+    prof_yoy = yoy_change(profit, take(profit, prev_year))
+
+    out = df.assign(
+        revenue=revenue,
+        profit=profit,
+        rev_yoy=rev_yoy,
+        prof_yoy=prof_yoy,
+        ttm_revenue=ttm_revenue,
+        ttm_profit=ttm_profit,
+        ttm_opm=ttm_opm,
+        rev_streak=growth_streak(rev_yoy > 0, prev_pos),
+        prof_streak=growth_streak(prof_yoy > 0, prev_pos),
+    )
+    for col in RANK_COLUMNS:
+        out[f"{col}_pct"] = percentile_rank(out[col].to_numpy(dtype=np.float64), pidx)
+    return out[SCREENING_COLUMNS]
+
+def load_screening(path=SCREENING_FILE, columns=None):
+    return pd.read_parquet(path, columns=columns)
+
+def save_screening(table, csv_path=CSV_FILE, path=SCREENING_FILE):
+    # 지표 테이블과 같은 방식으로 원본 CSV 내용 해시를 메타데이터에 남김 (metrics_is_fresh(csv_path, path)로 확인)
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    table = table.astype({'corp_name': 'category', 'quarter': 'category'})
+    arrow = pa.Table.from_pandas(table, preserve_index=False)
+    meta = dict(arrow.schema.metadata or {})
+    meta[SOURCE_KEY] = file_digest(csv_path).encode()
+    tmp_path = path + '.tmp'
+    pq.write_table(arrow.replace_schema_metadata(meta), tmp_path)
+    os.replace(tmp_path, path)
+
+def refresh_screening(csv_path=CSV_FILE, path=SCREENING_FILE, metrics_path=METRICS_FILE):
+    # main.py 수집 단계 마지막에 호출 (지표 테이블이 최신일 때만)
+    if not HAS_PYARROW or not metrics_is_fresh(csv_path, metrics_path):
+        return None
+    table = compute_screening(load_metrics(metrics_path))
+    save_screening(table, csv_path, path)
+    return len(table)
+
+def screen(table, period, corps=None, min_rev_streak=0, min_prof_streak=0, min_ttm_revenue=None,
+           sort_by='rev_yoy_pct', k=50):
+    # period: 분기 번호 (연도×4+분기), 금액 조건은 table과 같은 단위
+    pidx = table['period'].to_numpy() if 'period' in table.columns else period_index(table['year'], table['quarter'])
+    mask = pidx == period
+    if corps: mask &= table['corp_name'].isin(corps).to_numpy()
+    if min_rev_streak: mask &= table['rev_streak'].to_numpy() >= min_rev_streak
+    if min_prof_streak: mask &= table['prof_streak'].to_numpy() >= min_prof_streak
+    if min_ttm_revenue: mask &= table['ttm_revenue'].to_numpy() >= min_ttm_revenue
+    return table[mask].sort_values(sort_by, ascending=False, na_position='last', kind='stable').head(k)
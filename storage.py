@@ -0,0 +1,129 @@
+import os
+import json
+import hashlib
+import shutil
+import pandas as pd
+
+# pyarrow가 없으면 컬럼형 사본 없이 CSV만 사용합니다.
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# -----------------------------------------------------------
+# financial_db 저장소: CSV(원본) + 연도별 파티션 Parquet(읽기용 사본)
+# -----------------------------------------------------------
+# CSV는 GitHub 워크플로와 외부 공유용 원본으로 그대로 유지하고,
+# Parquet 사본은 타입이 지정된 상태로 year=YYYY 폴더에 나눠 저장합니다.
+# 사본 폴더의 _source.json에 CSV 내용 해시를 기록해 두고, 다르면 CSV를 직접 읽습니다.
+CSV_FILE = 'financial_db.csv'
+COLUMNAR_DIR = 'financial_db_parquet'
+SOURCE_MARKER = '_source.json'
+
+ID_COLUMNS = ['corp_code', 'corp_name', 'year', 'quarter']
+AMOUNT_COLUMNS = ['매출액', '영업이익', '순이익', '영업현금흐름', '수주잔고', '수주잔고_증감']
+DB_COLUMNS = ID_COLUMNS + AMOUNT_COLUMNS
+QUARTERS = ['1Q', '2Q', '3Q', '4Q']
+
+_digest_cache = {}
+
+def file_digest(path):
+    # 파일 내용 해시 (sha256). 크기만 비교하면 같은 크기로 바뀐 경우(정정공시 금액 변경, 원격 사본 교체)를 놓칩니다.
+    # 같은 프로세스에서 크기·수정 시각이 그대로면 다시 읽지 않습니다.
+    if not os.path.exists(path):
+        return None
+    stat = os.stat(path)
+    key = os.path.abspath(path)
+    cached = _digest_cache.get(key)
+    if cached and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+        return cached[2]
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    _digest_cache[key] = (stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+    return _digest_cache[key][2]
+
+def apply_schema(df):
+    # corp_code: 8자리 문자열 / corp_name·quarter: category / year: int64 / 금액: float64
+    df = df.copy()
+    if 'corp_code' in df.columns:
+        codes = df['corp_code'].astype(str)
+        if (codes.str.len() != 8).any():
+            codes = codes.str.strip().str.split('.').str[0].str.zfill(8)
+        df['corp_code'] = codes
+    if 'corp_name' in df.columns and df['corp_name'].dtype != 'category':
+        df['corp_name'] = df['corp_name'].astype(str).astype('category')
+    if 'year' in df.columns:
+        df['year'] = df['year'].astype('int64')
+    if 'quarter' in df.columns and not (df['quarter'].dtype == 'category' and list(df['quarter'].cat.categories) == QUARTERS):
+        df['quarter'] = pd.Categorical(df['quarter'].astype(str), categories=QUARTERS, ordered=True)
+    for col in AMOUNT_COLUMNS:
+        if col in df.columns and df[col].dtype != 'float64':
+            df[col] = pd.to_numeric(df[col].astype(str).str.replace(',', ''), errors='coerce')
+    return df
+
+def read_csv_db(source=CSV_FILE, columns=None):
+    kwargs = {'usecols': columns, 'dtype': {'corp_code': str}}
+    try:
+        return pd.read_csv(source, encoding='utf-8-sig', **kwargs)
+    except UnicodeDecodeError:
+        return pd.read_csv(source, encoding='cp949', **kwargs)
+
+def columnar_is_fresh(csv_path=CSV_FILE, columnar_dir=COLUMNAR_DIR):
+    marker = os.path.join(columnar_dir, SOURCE_MARKER)
+    if not (HAS_PYARROW and os.path.exists(marker) and os.path.exists(csv_path)):
+        return False
+    try:
+        with open(marker, encoding='utf-8') as f:
+            return json.load(f).get('csv_sha256') == file_digest(csv_path)
+    except (OSError, ValueError):
+        return False
+
+def read_db(columns=None, years=None, quarters=None, source=CSV_FILE, columnar_dir=COLUMNAR_DIR):
+    # columns: 읽을 컬럼 (None이면 전체), years/quarters: 행 필터
+    # Parquet 사본이 최신이면 컬럼 선택과 필터를 파일 단계에서 적용합니다.
+    if columnar_is_fresh(source, columnar_dir):
+        filters = []
+        if years is not None: filters.append(('year', 'in', [int(y) for y in years]))
+        if quarters is not None: filters.append(('quarter', 'in', list(quarters)))
+        df = pd.read_parquet(columnar_dir, columns=columns, filters=filters or None)
+    else:
+        usecols = None
+        if columns is not None:
+            filter_cols = (['year'] if years is not None else []) + (['quarter'] if quarters is not None else [])
+            usecols = list(dict.fromkeys(list(columns) + filter_cols))
+        df = read_csv_db(source, usecols)
+        if years is not None: df = df[df['year'].isin([int(y) for y in years])]
+        if quarters is not None: df = df[df['quarter'].isin(list(quarters))]
+    # 파티션 컬럼(year)이 맨 뒤로 가므로 요청한 순서(또는 CSV 순서)로 맞춤
+    order = list(columns) if columns is not None else [c for c in DB_COLUMNS if c in df.columns]
+    return apply_schema(df[order]).reset_index(drop=True)
+
+def write_columnar(df, years=None, csv_path=CSV_FILE, columnar_dir=COLUMNAR_DIR):
+    # years를 주면 해당 연도 파티션만 다시 씁니다. (나머지 연도 파일은 그대로)
+    if not HAS_PYARROW:
+        return False
+    df = apply_schema(df.reindex(columns=DB_COLUMNS))
+    if years is not None:
+        df = df[df['year'].isin([int(y) for y in years])]
+    elif os.path.isdir(columnar_dir):
+        shutil.rmtree(columnar_dir)
+    df = df.sort_values(['year', 'corp_code', 'quarter'], kind='stable')
+    df.to_parquet(columnar_dir, partition_cols=['year'], index=False,
+                  existing_data_behavior='delete_matching', basename_template='part-{i}.parquet')
+    with open(os.path.join(columnar_dir, SOURCE_MARKER), 'w', encoding='utf-8') as f:
+        json.dump({'csv_sha256': file_digest(csv_path)}, f)
+    return True
+
+def sync_columnar(years=None, csv_path=CSV_FILE, columnar_dir=COLUMNAR_DIR):
+    # CSV 기준으로 Parquet 사본 갱신 (사본이 없으면 전체 생성)
+    if not HAS_PYARROW or not os.path.exists(csv_path):
+        return False
+    if not os.path.isdir(columnar_dir):
+        years = None
+    df = read_csv_db(csv_path)
+    if years is not None:
+        df = df[df['year'].isin([int(y) for y in years])]
+    return write_columnar(df, years=years, csv_path=csv_path, columnar_dir=columnar_dir)
@@ -0,0 +1,25 @@
+import pandas as pd
+
+from db_store import connect, upsert_rows, export_csv
+from storage import read_csv_db
+
+# -----------------------------------------------------------
+# 정정공시 upsert가 넘기지 않은 컬럼(영업현금흐름/수주잔고)을 지우지 않는지
+# -----------------------------------------------------------
+ORIGINAL = {'corp_code': '00100601', 'corp_name': '강원에너지', 'year': 2024, 'quarter': '1Q',
+            '매출액': 82180178311.0, '영업이익': 2005995605.0, '순이익': -1411776635.0,
+            '영업현금흐름': 7130739815.0, '수주잔고': 10453038862.0, '수주잔고_증감': 0.0}
+
+def test_amended_upsert_keeps_unprovided_columns(tmp_path):
+    conn = connect(str(tmp_path / 'db.sqlite'))
+    upsert_rows(conn, [ORIGINAL])
+    # main.py의 save_batch와 같은 모양: 추출한 3개 계정만
+    upsert_rows(conn, [{'corp_code': '00100601', 'corp_name': '강원에너지', 'year': 2024, 'quarter': '1Q',
+                        '매출액': 90000000000, '영업이익': 2100000000, '순이익': -1000000000}])
+    csv_path = str(tmp_path / 'db.csv')
+    export_csv(conn, csv_path)
+    conn.close()
+
+    row = read_csv_db(csv_path).iloc[0]
+    assert (row['매출액'], row['영업이익'], row['순이익']) == (90000000000, 2100000000, -1000000000)
+    assert (row['영업현금흐름'], row['수주잔고'], row['수주잔고_증감']) == (7130739815, 10453038862, 0)
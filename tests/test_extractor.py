@@ -0,0 +1,21 @@
+import pandas as pd
+
+from extractor import extract_batch, RESULT_COLUMNS
+
+# -----------------------------------------------------------
+# 대상 계정이 없는 finstate가 섞인 배치 (자산총계만 있는 보고서)
+# -----------------------------------------------------------
+def finstate(rows):
+    return pd.DataFrame(rows, columns=['account_nm', 'fs_div', 'thstrm_amount', 'frmtrm_amount'])
+
+BALANCE_ONLY = finstate([('자산총계', 'CFS', '3,000', '2,500'), ('자산총계', 'OFS', '2,400', '2,000')])
+INCOME = finstate([('매출액', 'OFS', '900', '800'), ('매출액', 'CFS', '1,000', '(900)'), ('자산총계', 'CFS', '3,000', '2,500')])
+
+def test_batch_without_target_accounts_is_empty():
+    out = extract_batch({'a': BALANCE_ONLY, 'b': BALANCE_ONLY})
+    assert out.empty
+    assert list(out.columns) == RESULT_COLUMNS
+
+def test_mixed_batch_keeps_valid_report():
+    out = extract_batch({'a': BALANCE_ONLY, 'b': INCOME})
+    assert out.values.tolist() == [['b', '매출액', '매출액', 1000, -900]]
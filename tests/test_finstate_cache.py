@@ -0,0 +1,46 @@
+import os
+
+from bench.fake_dart import FakeDart
+from finstate_cache import CachedDart
+from dart_fetch import fetch_all, fetch_finstate
+
+# -----------------------------------------------------------
+# finstate 캐시: 정정공시는 새로 조회, None은 디스크에 남기지 않음, 캐시 적중은 속도 제한 토큰을 쓰지 않음
+# -----------------------------------------------------------
+JOBS = [{'corp_code': f"{100000 + i:08d}", 'year': 2024} for i in range(5)]
+
+class CountingLimiter:
+    def __init__(self):
+        self.acquired = 0
+
+    def acquire(self):
+        self.acquired += 1
+
+def test_amended_bypasses_cache(tmp_path):
+    fake = FakeDart(latency=0)
+    dart = CachedDart(fake, cache_dir=str(tmp_path))
+    list(fetch_all(dart, JOBS, rate=1000))
+    assert fake.calls == len(JOBS)
+    list(fetch_all(dart, JOBS, rate=1000))
+    assert fake.calls == len(JOBS)
+    list(fetch_all(dart, [dict(JOBS[0], amended=True)], rate=1000))
+    assert fake.calls == len(JOBS) + 1
+
+def test_none_not_persisted(tmp_path):
+    fake = FakeDart(latency=0, missing_rate=1.0)
+    dart = CachedDart(fake, cache_dir=str(tmp_path))
+    assert fetch_finstate(dart, JOBS[0]['corp_code'], 2024) is None
+    assert os.listdir(tmp_path) == []
+    # 다음 실행(새 캐시 객체)은 다시 조회
+    again = CachedDart(fake, cache_dir=str(tmp_path))
+    calls = fake.calls
+    fetch_finstate(again, JOBS[0]['corp_code'], 2024)
+    assert fake.calls > calls
+
+def test_cache_hit_skips_limiter(tmp_path):
+    dart = CachedDart(FakeDart(latency=0), cache_dir=str(tmp_path))
+    limiter = CountingLimiter()
+    fetch_finstate(dart, JOBS[0]['corp_code'], 2024, limiter)
+    assert limiter.acquired == 1
+    fetch_finstate(dart, JOBS[0]['corp_code'], 2024, limiter)
+    assert limiter.acquired == 1
@@ -0,0 +1,63 @@
+from notifier import SlackNotifier, build_payloads, MAX_BLOCKS, MAX_SECTION_CHARS
+
+# -----------------------------------------------------------
+# 슬랙 디스패처: 429는 Retry-After만큼 기다렸다 재시도, 블록 50개(섹션 48개) 단위로 분할
+# -----------------------------------------------------------
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = ''
+
+class FakeWebhook:
+    # throttle_every번째 요청마다 429 (Retry-After: retry_after)
+    def __init__(self, throttle_every=0, retry_after='0.01'):
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.requests = 0
+        self.throttled = 0
+        self.payloads = []
+
+    def post(self, url, json=None, timeout=None):
+        self.requests += 1
+        if self.throttle_every and self.requests % self.throttle_every == 0:
+            self.throttled += 1
+            return FakeResponse(429, {'Retry-After': self.retry_after})
+        self.payloads.append(json)
+        return FakeResponse(200)
+
+def sections(payload):
+    return [b for b in payload['blocks'] if b['type'] == 'section']
+
+def test_payloads_split_at_48_sections():
+    payloads = build_payloads([f"메시지 {i}" for i in range(100)])
+    assert [len(sections(p)) for p in payloads] == [48, 48, 4]
+    assert all(len(p['blocks']) <= MAX_BLOCKS for p in payloads)
+    assert payloads[0]['blocks'][0]['text']['text'].endswith("48건 (1/3)")
+
+def test_long_section_truncated():
+    payload, = build_payloads(["가" * (MAX_SECTION_CHARS + 10)])
+    text = sections(payload)[0]['text']['text']
+    assert len(text) == MAX_SECTION_CHARS and text.endswith("…")
+
+def test_retry_after_429_delivers_everything():
+    webhook = FakeWebhook(throttle_every=2)
+    notifier = SlackNotifier('http://webhook', digest_size=100, flush_interval=0.05, backoff=5, session=webhook)
+    for i in range(100):
+        notifier.notify(f"메시지 {i}")
+    notifier.close()
+    stats = notifier.stats()
+    assert stats['sent'] == 100 and stats['dropped'] == 0
+    assert stats['retried'] == webhook.throttled > 0
+    assert sum(len(sections(p)) for p in webhook.payloads) == 100
+
+def test_client_error_not_retried():
+    class Gone(FakeWebhook):
+        def post(self, url, json=None, timeout=None):
+            self.requests += 1
+            return FakeResponse(404)
+    webhook = Gone()
+    notifier = SlackNotifier('http://webhook', flush_interval=0.01, session=webhook)
+    notifier.notify("메시지")
+    notifier.close()
+    assert webhook.requests == 1 and notifier.stats()['dropped'] == 1
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from quarterly import sort_frame, period_keys, isolate_4q, add_growth
+
+# -----------------------------------------------------------
+# 중간 분기가 빠진 시계열에서 4Q 개별분기 변환과 OPM/QoQ/YoY 확인 (손으로 계산한 값)
+# -----------------------------------------------------------
+# A: 2023년은 1Q~4Q 모두 있음, 2024년은 2Q가 빠짐 (4Q는 연간 누적)
+# B: 2024-1Q 매출 0 → 2Q의 QoQ 기준값이 0
+ROWS = [
+    ('00000001', 'A', 2023, '1Q', 100, 10),
+    ('00000001', 'A', 2023, '2Q', 110, 11),
+    ('00000001', 'A', 2023, '3Q', 120, 12),
+    ('00000001', 'A', 2023, '4Q', 460, 46),
+    ('00000001', 'A', 2024, '1Q', 120, 15),
+    ('00000001', 'A', 2024, '3Q', 150, 18),
+    ('00000001', 'A', 2024, '4Q', 600, 70),
+    ('00000002', 'B', 2024, '1Q', 0, -5),
+    ('00000002', 'B', 2024, '2Q', 80, 8),
+]
+
+@pytest.fixture
+def gapped():
+    df = pd.DataFrame(ROWS, columns=['corp_code', 'corp_name', 'year', 'quarter', 'revenue', 'profit'])
+    df['net_income'] = df['profit'] * 0.5
+    # 입력 순서를 섞어도 sort_frame 뒤에는 (기업, 분기) 순서
+    return sort_frame(df.sample(frac=1, random_state=0))
+
+def row(df, corp, year, quarter):
+    hit = df[(df['corp_name'] == corp) & (df['year'] == year) & (df['quarter'] == quarter)]
+    assert len(hit) == 1
+    return hit.iloc[0]
+
+def test_isolate_4q(gapped):
+    iso = isolate_4q(gapped, ('revenue', 'profit', 'net_income'))
+    # 2023-4Q: 460 - (100 + 110 + 120) = 130
+    assert row(iso, 'A', 2023, '4Q')['revenue'] == 130
+    assert row(iso, 'A', 2023, '4Q')['profit'] == 13
+    assert row(iso, 'A', 2023, '4Q')['net_income'] == 6.5
+    # 2024-4Q: 2Q가 없으면 개별 분기 값을 알 수 없음
+    assert np.isnan(row(iso, 'A', 2024, '4Q')['revenue'])
+    assert np.isnan(row(iso, 'A', 2024, '4Q')['profit'])
+    # 1Q~3Q는 그대로
+    assert row(iso, 'A', 2024, '3Q')['revenue'] == 150
+    assert row(iso, 'B', 2024, '2Q')['revenue'] == 80
+
+def test_add_growth_raw(gapped):
+    out = add_growth(gapped)
+    # OPM
+    assert row(out, 'A', 2024, '1Q')['opm'] == pytest.approx(12.5)
+    assert row(out, 'B', 2024, '1Q')['opm'] == 0   # 매출 0 → 0
+    # QoQ: 직전 분기(누적 4Q 460) 대비
+    assert row(out, 'A', 2024, '1Q')['rev_qoq'] == pytest.approx((120 - 460) / 460 * 100)
+    # 2024-3Q: 직전 2Q가 없으므로 1Q와 비교하지 않고 0%
+    assert row(out, 'A', 2024, '3Q')['rev_qoq'] == 0
+    assert row(out, 'A', 2024, '3Q')['prof_qoq'] == 0
+    # 다른 기업의 이전 행과 비교하지 않음 (B의 첫 분기)
+    assert row(out, 'B', 2024, '1Q')['rev_qoq'] == 0
+    # 기준값 0 → 0%
+    assert row(out, 'B', 2024, '2Q')['rev_qoq'] == 0
+    assert row(out, 'B', 2024, '2Q')['prof_qoq'] == pytest.approx((8 - -5) / -5 * 100)
+    # YoY: 전년 같은 분기 대비
+    assert row(out, 'A', 2024, '1Q')['rev_yoy'] == pytest.approx(20.0)
+    assert row(out, 'A', 2024, '3Q')['rev_yoy'] == pytest.approx(25.0)
+    assert row(out, 'A', 2024, '4Q')['prof_yoy'] == pytest.approx((70 - 46) / 46 * 100)
+    assert row(out, 'A', 2023, '1Q')['rev_yoy'] == 0   # 전년 없음
+
+def test_add_growth_iso4q(gapped):
+    keys = period_keys(gapped)
+    out = add_growth(isolate_4q(gapped, ('revenue', 'profit', 'net_income'), keys), keys)
+    # 2024-1Q QoQ: 개별 4Q(130) 대비
+    assert row(out, 'A', 2024, '1Q')['rev_qoq'] == pytest.approx((120 - 130) / 130 * 100)
+    assert row(out, 'A', 2023, '4Q')['opm'] == pytest.approx(10.0)
+    # 개별 4Q가 NaN이면 성장률도 비교값 없음(0%)
+    assert row(out, 'A', 2024, '4Q')['rev_qoq'] == 0
+    assert row(out, 'A', 2024, '4Q')['rev_yoy'] == 0
@@ -0,0 +1,101 @@
+import os
+import time
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
+
+import pytest
+import requests
+
+from remote_sync import sync_remote
+
+# -----------------------------------------------------------
+# 원격 CSV 조건부 동기화: ETag/If-Modified-Since 304, 깨진 응답·장애 시 마지막 정상 사본 유지
+# -----------------------------------------------------------
+URL = 'https://example.invalid/financial_db.csv'
+HEADER = 'corp_code,corp_name,year,quarter,매출액,영업이익,순이익,영업현금흐름,수주잔고,수주잔고_증감\n'
+
+def csv_body(rows):
+    return ('\ufeff' + HEADER + ''.join(f"{i:08d},기업{i},2024,1Q,{i * 100},{i * 10},{i},,,\n" for i in range(1, rows + 1))).encode('utf-8')
+
+class FakeResponse:
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code}")
+
+class FakeRemote:
+    # GitHub raw 대역: ETag(If-None-Match) 우선, 없으면 Last-Modified(If-Modified-Since)로 304
+    def __init__(self, body, mtime=None):
+        self.requests = 0
+        self.down = False
+        self.broken = False
+        self.publish(body, mtime)
+
+    def publish(self, body, mtime=None):
+        self.body = body
+        self.etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        self.mtime = mtime or time.time()
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests += 1
+        headers = headers or {}
+        if self.down:
+            raise requests.ConnectionError("remote down")
+        if self.broken:
+            return FakeResponse(200, b'<html>oops</html>')
+        inm, ims = headers.get('If-None-Match'), headers.get('If-Modified-Since')
+        if (inm == self.etag) if inm else bool(ims) and parsedate_to_datetime(ims).timestamp() >= int(self.mtime):
+            return FakeResponse(304, headers={'ETag': self.etag})
+        return FakeResponse(200, self.body, {'ETag': self.etag, 'Last-Modified': formatdate(self.mtime, usegmt=True)})
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / 'financial_db.csv'), str(tmp_path / 'snapshot')
+
+def sync(remote, paths):
+    local_path, snapshot_dir = paths
+    info = sync_remote(URL, local_path=local_path, snapshot_dir=snapshot_dir, session=remote)
+    where = 'local' if info['path'] == local_path else ('snapshot' if info['path'] else None)
+    return info['status'], where
+
+def test_etag_not_modified_then_update(paths):
+    remote = FakeRemote(csv_body(3), mtime=time.time() - 3600)
+    assert sync(remote, paths) == ('updated', 'snapshot')
+    assert sync(remote, paths) == ('not_modified', 'snapshot')
+    remote.publish(csv_body(4))
+    assert sync(remote, paths) == ('updated', 'snapshot')
+    with open(os.path.join(paths[1], 'financial_db.csv'), 'rb') as f:
+        assert f.read() == csv_body(4)
+
+def test_broken_or_down_keeps_last_good_snapshot(paths):
+    remote = FakeRemote(csv_body(3), mtime=time.time() - 3600)
+    assert sync(remote, paths) == ('updated', 'snapshot')
+    remote.publish(csv_body(5))
+    remote.broken = True
+    assert sync(remote, paths) == ('error', 'snapshot')
+    remote.broken, remote.down = False, True
+    assert sync(remote, paths) == ('error', 'snapshot')
+    # 깨진 응답은 사본을 바꾸지 않음
+    with open(os.path.join(paths[1], 'financial_db.csv'), 'rb') as f:
+        assert f.read() == csv_body(3)
+
+def test_local_copy_asks_with_if_modified_since(paths):
+    # 배포 직후: 로컬 CSV만 있고 원격은 그 이후 변경 없음 → 304, 로컬 사용
+    local_path, _ = paths
+    with open(local_path, 'wb') as f:
+        f.write(csv_body(3))
+    remote = FakeRemote(csv_body(3), mtime=time.time() - 3600)
+    assert sync(remote, paths) == ('not_modified', 'local')
+    assert remote.requests == 1
+
+def test_down_without_snapshot_falls_back_to_local(paths):
+    local_path, _ = paths
+    with open(local_path, 'wb') as f:
+        f.write(csv_body(3))
+    remote = FakeRemote(csv_body(3))
+    remote.down = True
+    assert sync(remote, paths) == ('error', 'local')
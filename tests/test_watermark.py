@@ -0,0 +1,23 @@
+from watermark import load_pending, save_pending, settle_pending
+
+# -----------------------------------------------------------
+# finstate가 아직 없던 공시의 재조회 횟수 (한도까지 대기, 찾으면 목록에서 뺌)
+# -----------------------------------------------------------
+def test_missing_receipt_retried_until_limit():
+    pending = {}
+    for attempt in range(1, 3):
+        assert settle_pending(pending, {'20250303000001'}, {'20250303000001'}, max_attempts=3) == {'20250303000001'}
+        assert pending == {'20250303000001': attempt}
+    # 세 번째도 없으면 포기 (처리 완료로 넘어감)
+    assert settle_pending(pending, {'20250303000001'}, {'20250303000001'}, max_attempts=3) == set()
+    assert pending == {}
+
+def test_found_receipt_leaves_pending():
+    pending = {'20250303000001': 2, '20250304000009': 1}
+    assert settle_pending(pending, {'20250303000001'}, set(), max_attempts=3) == set()
+    assert pending == {'20250304000009': 1}
+
+def test_pending_round_trip_drops_old(tmp_path):
+    path = str(tmp_path / 'pending.txt')
+    save_pending({'20250303000001': 2, '20240101000001': 5}, '20250310', path=path)
+    assert load_pending(path) == {'20250303000001': 2}
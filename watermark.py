@@ -0,0 +1,114 @@
+import os
+import json
+from datetime import datetime, timedelta
+
+from backfill import DATE_FMT
+
+# -----------------------------------------------------------
+# 수집 워터마크 + 처리한 접수번호(rcept_no) 인덱스
+# -----------------------------------------------------------
+# 워터마크: 마지막으로 처리한 날짜와 접수번호. 데일리 실행은 이 날짜부터 오늘까지 조회하므로
+# 크론이 하루 이틀 빠져도 다음 실행에서 자동으로 따라잡습니다.
+# 접수번호 인덱스: 이미 처리한 공시는 finstate 조회 전에 걸러 하루 여러 번(10분 간격) 실행해도
+# 새 공시만 처리합니다. 접수번호 앞 8자리가 접수일이므로 보관 기간이 지난 번호는 정리합니다.
+# 대기 중인 접수번호: 공시는 올라왔지만 finstate가 아직 없던(None/전부 0) 번호와 시도 횟수.
+# 한도까지는 처리 완료로 넣지 않고 워터마크도 묶어 두어 다음 실행에서 다시 조회합니다.
+# 세 파일 모두 저장소에 커밋되어 GitHub Actions 실행 사이에 유지됩니다.
+DEFAULT_WATERMARK = 'ingest_watermark.json'
+DEFAULT_RECEIPTS = 'processed_receipts.txt'
+DEFAULT_PENDING = 'pending_receipts.txt'
+DEFAULT_MAX_CATCHUP_DAYS = 31
+DEFAULT_RETENTION_DAYS = 35
+DEFAULT_MAX_MISSING_ATTEMPTS = 20
+
+def load_watermark(path=DEFAULT_WATERMARK):
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        datetime.strptime(data['last_date'], DATE_FMT)
+        return data
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠️ 워터마크 로딩 실패, 오늘 공시만 조회합니다: {e}")
+        return None
+
+def save_watermark(last_date, last_rcept_no, path=DEFAULT_WATERMARK):
+    # 뒤로 가지 않음: 과거 구간 백필은 워터마크를 바꾸지 않습니다.
+    current = load_watermark(path) or {}
+    if current.get('last_date', '') > last_date:
+        return current
+    if current.get('last_date') == last_date:
+        last_rcept_no = max(last_rcept_no or '', current.get('last_rcept_no') or '') or None
+    if current.get('last_date') == last_date and current.get('last_rcept_no') == last_rcept_no:
+        return current  # 변화 없으면 파일을 건드리지 않음 (10분 간격 실행 시 불필요한 커밋 방지)
+    data = {'last_date': last_date, 'last_rcept_no': last_rcept_no,
+            'updated_at': datetime.now().isoformat(timespec='seconds')}
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+    return data
+
+def catchup_start(watermark, today, max_days=DEFAULT_MAX_CATCHUP_DAYS):
+    # 워터마크 날짜 당일부터 다시 조회 (같은 날 늦게 올라온 공시 포함, 중복은 접수번호로 거름)
+    if not watermark:
+        return today
+    oldest = (datetime.strptime(today, DATE_FMT) - timedelta(days=max_days)).strftime(DATE_FMT)
+    if watermark['last_date'] < oldest:
+        print(f"⚠️ 워터마크({watermark['last_date']})가 {max_days}일보다 오래되어 {oldest}부터 조회합니다. "
+              f"그 이전은 --start/--end 백필로 채워 주세요.")
+        return oldest
+    return min(watermark['last_date'], today)
+
+def load_receipts(path=DEFAULT_RECEIPTS):
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding='utf-8') as f:
+        return set(f.read().split())
+
+def save_receipts(receipts, today, path=DEFAULT_RECEIPTS, retention_days=DEFAULT_RETENTION_DAYS):
+    # 보관 기간이 지난 접수번호는 빼고 정렬해서 저장 (git diff에는 새 번호만 추가)
+    cutoff = (datetime.strptime(today, DATE_FMT) - timedelta(days=retention_days)).strftime(DATE_FMT)
+    kept = sorted(r for r in receipts if r[:8] >= cutoff)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.writelines(f"{r}\n" for r in kept)
+    os.replace(tmp_path, path)
+    return set(kept)
+
+def load_pending(path=DEFAULT_PENDING):
+    # 한 줄에 "접수번호 시도횟수"
+    if not os.path.exists(path):
+        return {}
+    pending = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 2 and parts[1].isdigit():
+                pending[parts[0]] = int(parts[1])
+    return pending
+
+def save_pending(pending, today, path=DEFAULT_PENDING, retention_days=DEFAULT_RETENTION_DAYS):
+    cutoff = (datetime.strptime(today, DATE_FMT) - timedelta(days=retention_days)).strftime(DATE_FMT)
+    kept = {r: n for r, n in pending.items() if r[:8] >= cutoff}
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.writelines(f"{r} {kept[r]}\n" for r in sorted(kept))
+    os.replace(tmp_path, path)
+    return kept
+
+def settle_pending(pending, listed, missing, max_attempts=DEFAULT_MAX_MISSING_ATTEMPTS):
+    # listed: 이번에 조회를 마친 접수번호, missing: 그중 finstate가 없던 번호
+    # 없던 번호는 시도 횟수를 올리고, 한도 전이면 다시 조회할 번호로 돌려줍니다. (나머지는 대기 목록에서 뺌)
+    retry = set()
+    for r in listed:
+        if r not in missing:
+            pending.pop(r, None)
+            continue
+        pending[r] = pending.get(r, 0) + 1
+        if pending[r] < max_attempts:
+            retry.add(r)
+        else:
+            print(f"   ⚠️ 접수번호 {r}: 재무데이터가 {pending.pop(r)}회 연속 없어 더 이상 조회하지 않습니다.")
+    return retry